@@ -104,14 +104,14 @@ modules_to_skip: list[str] = [
     "PIL.report",
     "py_compile",
     "pydoc",
-    "select",
     "statistics",
 ]
 
 
 if os.name == "nt":
-    modules_to_skip += ["PIL._tkinter_finder", "selectors"]
+    modules_to_skip += ["PIL._tkinter_finder", "select", "selectors"]
 else:
+    # socket, used for single instance mode, imports selectors which needs select
     # TODO: Skip everything but plat other?
     modules_to_skip += ["send2trash.mac", "send2trash.plat_gio", "send2trash.win"]
 
@@ -314,7 +314,10 @@ from_imports_to_skip: dict[str, set[tuple[str, str]]] = {
 unused_imports_to_preserve: dict[str, set[str]] = {
     f"{IMAGE_VIEWER_NAME}.utils.os": {
         "ask_yes_no",
+        "get_file_stats_in_folder",
         "get_files_in_folder",
+        "get_files_in_folder_with_suffixes",
+        "get_folders_in_folder",
         "restore_file",
         "show_info",
         "trash_file",
@@ -0,0 +1,255 @@
+"""Profiles imports while the image viewer starts and compares them with the
+modules the compiled build skips. Needs a display.
+
+Run with 'python -m compile_utils.import_profile [image path] [--max-ms MS]'.
+Exits with 1 if the build skips a module the viewer imports or if imports
+took longer than --max-ms, so it can be used as a startup regression check."""
+
+import ast
+import os
+import subprocess
+import sys
+from argparse import ArgumentParser
+
+from compile_utils.code_to_skip import modules_to_skip
+from compile_utils.constants import IMAGE_VIEWER_NAME
+from compile_utils.log import get_logger
+from compile_utils.piv_plugin import _removable_std_modules
+
+DEFAULT_IMAGE_PATH: str = os.path.join("tests", "example_images", "a.png")
+
+_IMPORT_TIME_PREFIX: str = "import time:"
+
+# Runs main.py until the viewer would start its main loop. If the second
+# argument is "profile", prints every module a function was called from
+_CHILD_SCRIPT: str = """
+import runpy
+import sys
+import threading
+
+used_modules = set()
+
+
+def profile(frame, event, arg):
+    if event == "call":
+        if frame.f_code.co_name != "<module>":
+            used_modules.add(frame.f_globals.get("__name__"))
+    elif event == "c_call":
+        used_modules.add(getattr(arg, "__module__", None))
+
+
+if sys.argv[2] == "profile":
+    sys.setprofile(profile)
+    threading.setprofile(profile)
+
+from image_viewer.viewer import ViewerApp
+
+
+def _start(self):
+    sys.setprofile(None)
+    print("\\n".join(m for m in used_modules if isinstance(m, str)), flush=True)
+    self.exit()
+
+
+ViewerApp.start = _start
+sys.argv = ["main.py", sys.argv[1]]
+runpy.run_path("main.py", run_name="__main__")
+"""
+
+_logger = get_logger()
+
+
+class ImportTime:
+    """Time spent importing one module, as reported by -X importtime"""
+
+    __slots__ = ("cumulative_us", "depth", "module", "self_us")
+
+    def __init__(
+        self, module: str, depth: int, self_us: int, cumulative_us: int
+    ) -> None:
+        self.module: str = module
+        # How many imports this import was nested in
+        self.depth: int = depth
+        self.self_us: int = self_us
+        # Includes time importing modules this module imported first
+        self.cumulative_us: int = cumulative_us
+
+
+def parse_import_times(importtime_output: str) -> list[ImportTime]:
+    """Parses the output of -X importtime.
+
+    :param importtime_output: stderr of a process run with -X importtime.
+    :returns: Times of each module in the order their imports finished."""
+    import_times: list[ImportTime] = []
+
+    for line in importtime_output.splitlines():
+        if not line.startswith(_IMPORT_TIME_PREFIX):
+            continue
+
+        try:
+            self_us, cumulative_us, module = line[len(_IMPORT_TIME_PREFIX) :].split("|")
+            # Module names are indented two spaces per nested import
+            depth: int = (len(module) - len(module.lstrip()) - 1) // 2
+            import_times.append(
+                ImportTime(module.strip(), depth, int(self_us), int(cumulative_us))
+            )
+        except ValueError:
+            continue  # Header
+
+    return import_times
+
+
+def get_top_level_import_time_us(import_times: list[ImportTime]) -> int:
+    """:returns: Microseconds spent in imports not nested in other imports."""
+    return sum(
+        import_time.cumulative_us
+        for import_time in import_times
+        if import_time.depth == 0
+    )
+
+
+def find_source_imports(folder: str) -> set[str]:
+    """Finds every module imported by python files in folder, including
+    imports inside functions.
+
+    :param folder: Folder to search.
+    :returns: Module names. For imports like 'from a import b', both a and a.b
+    are included since b may be a module."""
+    modules: set[str] = set()
+
+    for root_folder, _, files in os.walk(folder):
+        for file in files:
+            if not file.endswith(".py"):
+                continue
+
+            with open(os.path.join(root_folder, file), encoding="utf-8") as fp:
+                tree: ast.Module = ast.parse(fp.read())
+
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Import):
+                    modules.update(alias.name for alias in node.names)
+                elif (
+                    isinstance(node, ast.ImportFrom)
+                    and node.level == 0
+                    and node.module is not None
+                ):
+                    modules.add(node.module)
+                    modules.update(f"{node.module}.{a.name}" for a in node.names)
+
+    return modules
+
+
+def is_skipped(module: str, skipped_modules: set[str]) -> bool:
+    """:returns: True if module or a package containing it is skipped."""
+    parts: list[str] = module.split(".")
+    return any(".".join(parts[:i]) in skipped_modules for i in range(1, len(parts) + 1))
+
+
+def find_unused_modules(imported: list[str], used: set[str]) -> list[str]:
+    """Finds modules imported without any of their functions being called.
+    Packages containing a used module are considered used.
+
+    :param imported: Modules imported.
+    :param used: Modules a function was called from.
+    :returns: Modules in imported that look unused."""
+    used_packages: set[str] = set()
+    for module in used:
+        parts: list[str] = module.split(".")
+        used_packages.update(".".join(parts[:i]) for i in range(1, len(parts) + 1))
+
+    return [module for module in imported if module not in used_packages]
+
+
+def _run_viewer(image_path: str, *python_flags: str, profile: bool) -> str:
+    """Starts the viewer once and exits before its main loop.
+
+    :param image_path: Image to open.
+    :param python_flags: Extra flags passed to python.
+    :param profile: If modules functions were called from should be printed.
+    :returns: stdout if profiling, otherwise stderr."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            *python_flags,
+            "-c",
+            _CHILD_SCRIPT,
+            image_path,
+            "profile" if profile else "",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    return result.stdout if profile else result.stderr
+
+
+def main() -> int:
+    """Profiles imports of a startup and logs a report.
+
+    :returns: Exit code, 1 if a check failed."""
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("image_path", nargs="?", default=DEFAULT_IMAGE_PATH)
+    parser.add_argument(
+        "--max-ms", type=float, help="Fail if startup imports take longer than this"
+    )
+    args = parser.parse_args()
+
+    import_times: list[ImportTime] = parse_import_times(
+        _run_viewer(args.image_path, "-X", "importtime", profile=False)
+    )
+    used_modules: set[str] = set(
+        _run_viewer(args.image_path, profile=True).splitlines()
+    )
+
+    failed: bool = False
+    total_ms: float = get_top_level_import_time_us(import_times) / 1000
+    _logger.info(
+        "Imported %d modules at startup in %.1f ms", len(import_times), total_ms
+    )
+    if args.max_ms is not None and total_ms > args.max_ms:
+        _logger.error("Imports took longer than %.1f ms", args.max_ms)
+        failed = True
+
+    skipped_modules: set[str] = set(modules_to_skip) | _removable_std_modules
+    source_modules: set[str] = find_source_imports(IMAGE_VIEWER_NAME)
+    imported_modules: list[str] = [t.module for t in import_times]
+
+    # The viewer's own imports are kept as is, so skipping them breaks the build
+    skipped_but_imported: list[str] = sorted(
+        module for module in source_modules if is_skipped(module, skipped_modules)
+    )
+    if skipped_but_imported:
+        _logger.error(
+            "Skipped by the compiled build but imported by the viewer:\n%s",
+            "\n".join(skipped_but_imported),
+        )
+        failed = True
+
+    # Dependencies' imports of skipped modules are removed by code_to_skip
+    skipped_at_startup: list[str] = [
+        module for module in imported_modules if is_skipped(module, skipped_modules)
+    ]
+    if skipped_at_startup:
+        _logger.info(
+            "Imported at startup from source but skipped by the compiled build:\n%s",
+            "\n".join(skipped_at_startup),
+        )
+
+    self_us_by_module: dict[str, int] = {t.module: t.self_us for t in import_times}
+    unused_modules: list[str] = sorted(
+        find_unused_modules(imported_modules, used_modules),
+        key=self_us_by_module.__getitem__,
+        reverse=True,
+    )
+    _logger.info(
+        "Imported at startup without calling any of their functions, slowest first:"
+    )
+    for module in unused_modules:
+        _logger.info("%8.2f ms  %s", self_us_by_module[module] / 1000, module)
+
+    return int(failed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
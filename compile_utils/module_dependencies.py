@@ -12,10 +12,13 @@ module_dependencies: list[Requirement] = parse_requirements_file("requirements.t
 # be checked explicitly
 modules_to_include: list[str] = [
     "image_viewer.image._read",
+    "image_viewer.image._resize",
     "image_viewer._config",
 ]
 if os.name == "nt":
     modules_to_include.append("image_viewer.utils._os_nt")
+else:
+    modules_to_include.append("image_viewer.utils._os_linux")
 
 
 def get_normalized_module_name(module: Requirement) -> str:
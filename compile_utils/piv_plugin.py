@@ -6,6 +6,7 @@ from nuitka.options.CommandLineOptionsTools import OurOptionGroup
 from nuitka.plugins.PluginBase import NuitkaPluginBase
 from nuitka.utils.ModuleNames import ModuleName
 
+# json is not removable since timings and traces are exported as JSON
 _removable_std_modules = {
     "__hello__",
     "__phello__",
@@ -24,7 +25,6 @@ _removable_std_modules = {
     "imaplib",
     "imghdr",
     "ipaddress",
-    "json",
     "mailcap",
     "mimetypes",
     "modulefinder",
@@ -3,16 +3,23 @@
 from typing import Final
 
 DEFAULT_CACHE_SIZE: Final[int]
+DEFAULT_CACHE_DECODE_PROCESSES: Final[int]
 DEFAULT_KB_COPY_TO_CLIPBOARD_AS_BASE64: Final[str]
+DEFAULT_KB_CYCLE_SORT_MODE: Final[str]
+DEFAULT_KB_EXPORT_AS_DATA_URI: Final[str]
 DEFAULT_KB_MOVE_TO_NEW_FILE: Final[str]
 DEFAULT_KB_OPTIMIZE_IMAGE: Final[str]
 DEFAULT_KB_REFRESH: Final[str]
 DEFAULT_KB_RELOAD_IMAGE: Final[str]
 DEFAULT_KB_RENAME: Final[str]
 DEFAULT_KB_SHOW_DETAILS: Final[str]
+DEFAULT_KB_TOGGLE_RECURSIVE_BROWSING: Final[str]
+DEFAULT_KB_TOGGLE_TIMINGS: Final[str]
 DEFAULT_KB_UNDO_MOST_RECENT_ACTION: Final[str]
 DEFAULT_UI_BACKGROUND_COLOR: Final[str]
 DEFAULT_UI_FONT: Final[str]
+DEFAULT_UI_SINGLE_INSTANCE: Final[bool]
+DEFAULT_UNDO_DEPTH: Final[int]
 
 class Config:
     """Can't be instantiated in Python.
@@ -21,29 +28,46 @@ class Config:
 
     __slots__ = (
         "cache_size",
+        "convert_profiles",
+        "decode_processes",
         "kb_copy_to_clipboard_as_base64",
+        "kb_cycle_sort_mode",
+        "kb_export_as_data_uri",
         "kb_move_to_new_file",
         "kb_optimize_image",
         "kb_refresh",
         "kb_reload_image",
         "kb_rename",
         "kb_show_details",
+        "kb_toggle_recursive_browsing",
+        "kb_toggle_timings",
         "kb_undo_most_recent_action",
         "ui_background_color",
         "ui_font",
+        "ui_single_instance",
+        "undo_depth",
     )
 
     cache_size: int
+    # Format to profile name to encoder speed and quality
+    convert_profiles: dict[str, dict[str, tuple[int, int]]]
+    decode_processes: int
     kb_copy_to_clipboard_as_base64: str
+    kb_cycle_sort_mode: str
+    kb_export_as_data_uri: str
     kb_move_to_new_file: str
     kb_optimize_image: str
     kb_refresh: str
     kb_reload_image: str
     kb_rename: str
     kb_show_details: str
+    kb_toggle_recursive_browsing: str
+    kb_toggle_timings: str
     kb_undo_most_recent_action: str
     ui_background_color: str
     ui_font: str
+    ui_single_instance: bool
+    undo_depth: int
 
 def parse_config_file(file_path: str = "image_viewer/config.ini") -> Config:
     """Parses a simplified .ini file and returns provided values or default.
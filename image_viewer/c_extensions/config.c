@@ -9,10 +9,14 @@ char *Section_to_string(enum Section section) {
     switch (section) {
     case CACHE:
         return "CACHE";
+    case CONVERT:
+        return "CONVERT";
     case KEYBINDS:
         return "KEYBINDS";
     case UI:
         return "UI";
+    case UNDO:
+        return "UNDO";
     default:
         return "Unknown";
     }
@@ -157,10 +161,18 @@ enum Section parse_section(const char *line, size_t line_size)
         if (memcmp(line, "UI", 2) == 0) {
             return UI;
         }
+    case 4:
+        if (memcmp(line, "UNDO", 4) == 0) {
+            return UNDO;
+        }
     case 5:
         if (memcmp(line, "CACHE", 5) == 0) {
             return CACHE;
         }
+    case 7:
+        if (memcmp(line, "CONVERT", 7) == 0) {
+            return CONVERT;
+        }
     case 8:
         if (memcmp(line, "KEYBINDS", 8) == 0) {
             return KEYBINDS;
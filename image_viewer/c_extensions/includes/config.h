@@ -8,8 +8,10 @@ enum Section
 {
     UNKNOWN,
     CACHE,
+    CONVERT,
     KEYBINDS,
     UI,
+    UNDO,
 };
 
 char *Section_to_string(enum Section header);
@@ -19,21 +21,33 @@ typedef struct
     PyObject_HEAD;
 
     // [CACHE]
-    PyObject *cache_size; // int
+    PyObject *cache_size;       // int
+    PyObject *decode_processes; // int
+
+    // [CONVERT]
+    PyObject *convert_profiles; // dict[str, dict[str, tuple[int, int]]]
 
     // [KEYBINDS]
     PyObject *kb_copy_to_clipboard_as_base64; // str
+    PyObject *kb_cycle_sort_mode;             // str
+    PyObject *kb_export_as_data_uri;          // str
     PyObject *kb_move_to_new_file;            // str
     PyObject *kb_optimize_image;              // str
     PyObject *kb_refresh;                     // str
     PyObject *kb_reload_image;                // str
     PyObject *kb_rename;                      // str
     PyObject *kb_show_details;                // str
+    PyObject *kb_toggle_recursive_browsing;   // str
+    PyObject *kb_toggle_timings;              // str
     PyObject *kb_undo_most_recent_action;     // str
 
     // [UI]
     PyObject *ui_background_color; // str
     PyObject *ui_font;             // str
+    PyObject *ui_single_instance;  // bool
+
+    // [UNDO]
+    PyObject *undo_depth; // int
 } Config;
 
 extern const int LINE_MAX_SIZE;
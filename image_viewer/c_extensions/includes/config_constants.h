@@ -2,25 +2,40 @@
 #define PIV_CONFIG_DEFAULTS
 
 const char *KEY_CACHE_SIZE = "SIZE";
+const char *KEY_CACHE_DECODE_PROCESSES = "DECODE_PROCESSES";
 const char *KEY_KB_COPY_TO_CLIPBOARD_AS_BASE64 = "COPY_TO_CLIPBOARD_AS_BASE64";
+const char *KEY_KB_CYCLE_SORT_MODE = "CYCLE_SORT_MODE";
+const char *KEY_KB_EXPORT_AS_DATA_URI = "EXPORT_AS_DATA_URI";
 const char *KEY_KB_MOVE_TO_NEW_FILE = "MOVE_TO_NEW_FILE";
 const char *KEY_KB_OPTIMIZE_IMAGE = "OPTIMIZE_IMAGE";
 const char *KEY_KB_REFRESH = "REFRESH";
 const char *KEY_KB_RELOAD_IMAGE = "RELOAD_IMAGE";
 const char *KEY_KB_RENAME = "RENAME";
 const char *KEY_KB_SHOW_DETAILS = "SHOW_DETAILS";
+const char *KEY_KB_TOGGLE_RECURSIVE_BROWSING = "TOGGLE_RECURSIVE_BROWSING";
+const char *KEY_KB_TOGGLE_TIMINGS = "TOGGLE_TIMINGS";
 const char *KEY_KB_UNDO_MOST_RECENT_ACTION = "UNDO_MOST_RECENT_ACTION";
 const char *KEY_UI_BACKGROUND_COLOR = "BACKGROUND_COLOR";
 const char *KEY_UI_FONT = "FONT";
+const char *KEY_UI_SINGLE_INSTANCE = "SINGLE_INSTANCE";
+const char *KEY_UNDO_DEPTH = "DEPTH";
 
 const int DEFAULT_CACHE_SIZE = 20;
+const int DEFAULT_CACHE_DECODE_PROCESSES = 0;
+const int MAX_CACHE_DECODE_PROCESSES = 32;
+const int MAX_CONVERT_SPEED = 10;
+const int MAX_CONVERT_QUALITY = 100;
 const char *DEFAULT_KB_COPY_TO_CLIPBOARD_AS_BASE64 = "<Control-E>";
+const char *DEFAULT_KB_CYCLE_SORT_MODE = "<Control-s>";
+const char *DEFAULT_KB_EXPORT_AS_DATA_URI = "<Control-U>";
 const char *DEFAULT_KB_MOVE_TO_NEW_FILE = "<Control-m>";
 const char *DEFAULT_KB_OPTIMIZE_IMAGE = "<Control-o>";
 const char *DEFAULT_KB_REFRESH = "<Control-r>";
 const char *DEFAULT_KB_RELOAD_IMAGE = "<F5>";
 const char *DEFAULT_KB_RENAME = "<F2>";
 const char *DEFAULT_KB_SHOW_DETAILS = "<Control-d>";
+const char *DEFAULT_KB_TOGGLE_RECURSIVE_BROWSING = "<Control-R>";
+const char *DEFAULT_KB_TOGGLE_TIMINGS = "<Control-t>";
 const char *DEFAULT_KB_UNDO_MOST_RECENT_ACTION = "<Control-z>";
 const char *DEFAULT_UI_BACKGROUND_COLOR = "#000000";
 
@@ -30,4 +45,9 @@ const char *DEFAULT_UI_FONT = "arial.ttf";
 const char *DEFAULT_UI_FONT = "LiberationSans-Regular.ttf";
 #endif
 
+const bool DEFAULT_UI_SINGLE_INSTANCE = false;
+
+const int DEFAULT_UNDO_DEPTH = 8;
+const int MAX_UNDO_DEPTH = 1000;
+
 #endif /* PIV_CONFIG_DEFAULTS */
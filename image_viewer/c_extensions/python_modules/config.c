@@ -5,6 +5,7 @@
 #include "includes/c_optimizations.h"
 #include "includes/config_constants.h"
 
+#include <ctype.h>
 #include <stddef.h>
 #include <stdlib.h>
 
@@ -13,31 +14,47 @@
 // Config Start
 static PyMemberDef Config_members[] = {
     {"cache_size", Py_T_OBJECT_EX, offsetof(Config, cache_size), Py_READONLY, 0},
+    {"decode_processes", Py_T_OBJECT_EX, offsetof(Config, decode_processes), Py_READONLY, 0},
+    {"convert_profiles", Py_T_OBJECT_EX, offsetof(Config, convert_profiles), Py_READONLY, 0},
     {"kb_copy_to_clipboard_as_base64", Py_T_OBJECT_EX, offsetof(Config, kb_copy_to_clipboard_as_base64), Py_READONLY, 0},
+    {"kb_cycle_sort_mode", Py_T_OBJECT_EX, offsetof(Config, kb_cycle_sort_mode), Py_READONLY, 0},
+    {"kb_export_as_data_uri", Py_T_OBJECT_EX, offsetof(Config, kb_export_as_data_uri), Py_READONLY, 0},
     {"kb_move_to_new_file", Py_T_OBJECT_EX, offsetof(Config, kb_move_to_new_file), Py_READONLY, 0},
     {"kb_optimize_image", Py_T_OBJECT_EX, offsetof(Config, kb_optimize_image), Py_READONLY, 0},
     {"kb_refresh", Py_T_OBJECT_EX, offsetof(Config, kb_refresh), Py_READONLY, 0},
     {"kb_reload_image", Py_T_OBJECT_EX, offsetof(Config, kb_reload_image), Py_READONLY, 0},
     {"kb_rename", Py_T_OBJECT_EX, offsetof(Config, kb_rename), Py_READONLY, 0},
     {"kb_show_details", Py_T_OBJECT_EX, offsetof(Config, kb_show_details), Py_READONLY, 0},
+    {"kb_toggle_recursive_browsing", Py_T_OBJECT_EX, offsetof(Config, kb_toggle_recursive_browsing), Py_READONLY, 0},
+    {"kb_toggle_timings", Py_T_OBJECT_EX, offsetof(Config, kb_toggle_timings), Py_READONLY, 0},
     {"kb_undo_most_recent_action", Py_T_OBJECT_EX, offsetof(Config, kb_undo_most_recent_action), Py_READONLY, 0},
     {"ui_background_color", Py_T_OBJECT_EX, offsetof(Config, ui_background_color), Py_READONLY, 0},
     {"ui_font", Py_T_OBJECT_EX, offsetof(Config, ui_font), Py_READONLY, 0},
+    {"ui_single_instance", Py_T_OBJECT_EX, offsetof(Config, ui_single_instance), Py_READONLY, 0},
+    {"undo_depth", Py_T_OBJECT_EX, offsetof(Config, undo_depth), Py_READONLY, 0},
     {NULL}
 };
 
 static void Config_dealloc(Config *self) {
     Py_XDECREF(self->ui_font);
     Py_XDECREF(self->cache_size);
+    Py_XDECREF(self->decode_processes);
+    Py_XDECREF(self->convert_profiles);
     Py_XDECREF(self->kb_copy_to_clipboard_as_base64);
+    Py_XDECREF(self->kb_cycle_sort_mode);
+    Py_XDECREF(self->kb_export_as_data_uri);
     Py_XDECREF(self->kb_move_to_new_file);
     Py_XDECREF(self->kb_optimize_image);
     Py_XDECREF(self->kb_refresh);
     Py_XDECREF(self->kb_reload_image);
     Py_XDECREF(self->kb_rename);
     Py_XDECREF(self->kb_show_details);
+    Py_XDECREF(self->kb_toggle_recursive_browsing);
+    Py_XDECREF(self->kb_toggle_timings);
     Py_XDECREF(self->kb_undo_most_recent_action);
     Py_XDECREF(self->ui_background_color);
+    Py_XDECREF(self->ui_single_instance);
+    Py_XDECREF(self->undo_depth);
     Py_TYPE(self)->tp_free((PyObject *)self);
 }
 
@@ -54,15 +71,23 @@ static inline Config *Config_New() {
     Config *config = (Config *)PyObject_New(Config, &Config_Type);
     config->ui_font = NULL;
     config->cache_size = NULL;
+    config->decode_processes = NULL;
+    config->convert_profiles = NULL;
     config->kb_copy_to_clipboard_as_base64 = NULL;
+    config->kb_cycle_sort_mode = NULL;
+    config->kb_export_as_data_uri = NULL;
     config->kb_move_to_new_file = NULL;
     config->kb_optimize_image = NULL;
     config->kb_refresh = NULL;
     config->kb_reload_image = NULL;
     config->kb_rename = NULL;
     config->kb_show_details = NULL;
+    config->kb_toggle_recursive_browsing = NULL;
+    config->kb_toggle_timings = NULL;
     config->kb_undo_most_recent_action = NULL;
     config->ui_background_color = NULL;
+    config->ui_single_instance = NULL;
+    config->undo_depth = NULL;
 
     return config;
 }
@@ -71,9 +96,21 @@ static void Config_SetDefaults(PyObject *self, Config *config) {
     if (config->cache_size == NULL) {
         config->cache_size = PyObject_GetAttrString(self, VARIABLE_NAME(DEFAULT_CACHE_SIZE));
     }
+    if (config->decode_processes == NULL) {
+        config->decode_processes = PyObject_GetAttrString(self, VARIABLE_NAME(DEFAULT_CACHE_DECODE_PROCESSES));
+    }
+    if (config->convert_profiles == NULL) {
+        config->convert_profiles = PyDict_New();
+    }
     if (config->kb_copy_to_clipboard_as_base64 == NULL) {
         config->kb_copy_to_clipboard_as_base64 = PyObject_GetAttrString(self, VARIABLE_NAME(DEFAULT_KB_COPY_TO_CLIPBOARD_AS_BASE64));
     }
+    if (config->kb_cycle_sort_mode == NULL) {
+        config->kb_cycle_sort_mode = PyObject_GetAttrString(self, VARIABLE_NAME(DEFAULT_KB_CYCLE_SORT_MODE));
+    }
+    if (config->kb_export_as_data_uri == NULL) {
+        config->kb_export_as_data_uri = PyObject_GetAttrString(self, VARIABLE_NAME(DEFAULT_KB_EXPORT_AS_DATA_URI));
+    }
     if (config->kb_move_to_new_file == NULL) {
         config->kb_move_to_new_file = PyObject_GetAttrString(self, VARIABLE_NAME(DEFAULT_KB_MOVE_TO_NEW_FILE));
     }
@@ -92,6 +129,12 @@ static void Config_SetDefaults(PyObject *self, Config *config) {
     if (config->kb_show_details == NULL) {
         config->kb_show_details = PyObject_GetAttrString(self, VARIABLE_NAME(DEFAULT_KB_SHOW_DETAILS));
     }
+    if (config->kb_toggle_recursive_browsing == NULL) {
+        config->kb_toggle_recursive_browsing = PyObject_GetAttrString(self, VARIABLE_NAME(DEFAULT_KB_TOGGLE_RECURSIVE_BROWSING));
+    }
+    if (config->kb_toggle_timings == NULL) {
+        config->kb_toggle_timings = PyObject_GetAttrString(self, VARIABLE_NAME(DEFAULT_KB_TOGGLE_TIMINGS));
+    }
     if (config->kb_undo_most_recent_action == NULL) {
         config->kb_undo_most_recent_action = PyObject_GetAttrString(self, VARIABLE_NAME(DEFAULT_KB_UNDO_MOST_RECENT_ACTION));
     }
@@ -101,6 +144,12 @@ static void Config_SetDefaults(PyObject *self, Config *config) {
     if (config->ui_font == NULL) {
         config->ui_font = PyObject_GetAttrString(self, VARIABLE_NAME(DEFAULT_UI_FONT));
     }
+    if (config->ui_single_instance == NULL) {
+        config->ui_single_instance = PyObject_GetAttrString(self, VARIABLE_NAME(DEFAULT_UI_SINGLE_INSTANCE));
+    }
+    if (config->undo_depth == NULL) {
+        config->undo_depth = PyObject_GetAttrString(self, VARIABLE_NAME(DEFAULT_UNDO_DEPTH));
+    }
 }
 // Config End
 
@@ -150,15 +199,104 @@ static PyObject *Py_from_string_or_null_with_validation(const char *value, bool
     return PyUnicode_FromString(value);
 }
 
-static PyObject *Py_from_int_or_null(const char *value, int *error_out) {
+static PyObject *Py_from_int_or_null(const char *value, int min, int max, int default_value, int *error_out) {
     if (*value == '\0') {
         *error_out = false;
         return NULL;
     }
-    return PyLong_FromLong(str_to_int(value, 0, 100, DEFAULT_CACHE_SIZE, error_out));
+    return PyLong_FromLong(str_to_int(value, min, max, default_value, error_out));
+}
+
+static PyObject *Py_from_bool_or_null(const char *value, bool default_value, int *error_out) {
+    if (*value == '\0') {
+        *error_out = false;
+        return NULL;
+    }
+    // Out of range values are not clamped like ints since 2 meaning true is a guess
+    int as_int = str_to_int(value, 0, 1, default_value, error_out);
+    return PyBool_FromLong(*error_out ? default_value : as_int);
+}
+
+/**
+ * Adds a line in the format <FORMAT>_<PROFILE>=<speed>,<quality> to the convert profiles.
+ * Both format and profile are lower cased. Invalid lines are ignored.
+ *
+ * @param config Config to add the profile to
+ * @param key Non-null key of the line, edited in place
+ * @param value Non-null value of the line, edited in place
+ * @param validate If errors should be printed
+ * @return false if a Python error was raised
+ */
+static bool _add_convert_profile(Config *config, char *restrict key, char *restrict value, bool validate) {
+    char *profile_name = strchr(key, '_');
+    if (profile_name == NULL || profile_name == key || profile_name[1] == '\0') {
+        if (validate) {
+            _print_err_bad_key(key, value, CONVERT, "Not in the format <FORMAT>_<PROFILE>");
+        }
+        return true;
+    }
+
+    char *quality_str = strchr(value, ',');
+    if (quality_str == NULL) {
+        if (validate) {
+            _print_err_bad_value(key, value, CONVERT, "Not in the format <speed>,<quality>");
+        }
+        return true;
+    }
+
+    *quality_str = '\0';
+    int speed_error;
+    int quality_error;
+    int speed = str_to_int(str_strip(value), 0, MAX_CONVERT_SPEED, 0, &speed_error);
+    int quality = str_to_int(str_strip(quality_str + 1), 0, MAX_CONVERT_QUALITY, 0, &quality_error);
+    if (speed_error || quality_error) {
+        if (validate) {
+            *quality_str = ',';
+            _print_err_bad_value(key, value, CONVERT, "Speed not an integer in range 0-10 or quality not in range 0-100");
+        }
+        return true;
+    }
+
+    for (char *c = key; *c != '\0'; ++c) {
+        *c = tolower(*c);
+    }
+    *profile_name++ = '\0';
+
+    if (config->convert_profiles == NULL) {
+        config->convert_profiles = PyDict_New();
+        if (unlikely(config->convert_profiles == NULL)) {
+            return false;
+        }
+    }
+
+    PyObject *format_profiles = PyDict_GetItemString(config->convert_profiles, key);
+    if (format_profiles == NULL) {
+        format_profiles = PyDict_New();
+        if (unlikely(format_profiles == NULL)) {
+            return false;
+        }
+        const int set_result = PyDict_SetItemString(config->convert_profiles, key, format_profiles);
+        Py_DECREF(format_profiles);
+        if (unlikely(set_result < 0)) {
+            return false;
+        }
+    } else if (validate && PyDict_GetItemString(format_profiles, profile_name) != NULL) {
+        profile_name[-1] = '_';
+        _print_err_bad_key(key, value, CONVERT, "Duplicate");
+        return true;
+    }
+
+    PyObject *profile = Py_BuildValue("(ii)", speed, quality);
+    if (unlikely(profile == NULL)) {
+        return false;
+    }
+    const int set_result = PyDict_SetItemString(format_profiles, profile_name, profile);
+    Py_DECREF(profile);
+
+    return set_result == 0;
 }
 
-static inline void _update_config(Config *config, enum Section section, char *restrict key, char *restrict value, bool validate) {
+static inline bool _update_config(Config *config, enum Section section, char *restrict key, char *restrict value, bool validate) {
     PyObject **target = NULL;
     PyObject *Py_value = NULL;
 
@@ -167,18 +305,33 @@ static inline void _update_config(Config *config, enum Section section, char *re
         if (strcmp(key, KEY_CACHE_SIZE) == 0) {
             int error;
             target = &config->cache_size;
-            Py_value = Py_from_int_or_null(value, &error);
+            Py_value = Py_from_int_or_null(value, 0, 100, DEFAULT_CACHE_SIZE, &error);
             if (validate && error) {
                 _print_err_bad_value_int(key, value, section, "Not an integer in range 0-100", DEFAULT_CACHE_SIZE);
             }
+        } else if (strcmp(key, KEY_CACHE_DECODE_PROCESSES) == 0) {
+            int error;
+            target = &config->decode_processes;
+            Py_value = Py_from_int_or_null(value, 0, MAX_CACHE_DECODE_PROCESSES, DEFAULT_CACHE_DECODE_PROCESSES, &error);
+            if (validate && error) {
+                _print_err_bad_value_int(key, value, section, "Not an integer in range 0-32", DEFAULT_CACHE_DECODE_PROCESSES);
+            }
         }
         break;
+    case CONVERT:
+        return _add_convert_profile(config, key, value, validate);
     case KEYBINDS:
         const char *default_value;
 
         if (strcmp(key, KEY_KB_COPY_TO_CLIPBOARD_AS_BASE64) == 0) {
             target = &config->kb_copy_to_clipboard_as_base64;
             default_value = DEFAULT_KB_COPY_TO_CLIPBOARD_AS_BASE64;
+        } else if (strcmp(key, KEY_KB_CYCLE_SORT_MODE) == 0) {
+            target = &config->kb_cycle_sort_mode;
+            default_value = DEFAULT_KB_CYCLE_SORT_MODE;
+        } else if (strcmp(key, KEY_KB_EXPORT_AS_DATA_URI) == 0) {
+            target = &config->kb_export_as_data_uri;
+            default_value = DEFAULT_KB_EXPORT_AS_DATA_URI;
         } else if (strcmp(key, KEY_KB_MOVE_TO_NEW_FILE) == 0) {
             target = &config->kb_move_to_new_file;
             default_value = DEFAULT_KB_MOVE_TO_NEW_FILE;
@@ -197,6 +350,12 @@ static inline void _update_config(Config *config, enum Section section, char *re
         } else if (strcmp(key, KEY_KB_SHOW_DETAILS) == 0) {
             target = &config->kb_show_details;
             default_value = DEFAULT_KB_SHOW_DETAILS;
+        } else if (strcmp(key, KEY_KB_TOGGLE_RECURSIVE_BROWSING) == 0) {
+            target = &config->kb_toggle_recursive_browsing;
+            default_value = DEFAULT_KB_TOGGLE_RECURSIVE_BROWSING;
+        } else if (strcmp(key, KEY_KB_TOGGLE_TIMINGS) == 0) {
+            target = &config->kb_toggle_timings;
+            default_value = DEFAULT_KB_TOGGLE_TIMINGS;
         } else if (strcmp(key, KEY_KB_UNDO_MOST_RECENT_ACTION) == 0) {
             target = &config->kb_undo_most_recent_action;
             default_value = DEFAULT_KB_UNDO_MOST_RECENT_ACTION;
@@ -222,6 +381,23 @@ static inline void _update_config(Config *config, enum Section section, char *re
         } else if (strcmp(key, KEY_UI_FONT) == 0) {
             target = &config->ui_font;
             Py_value = Py_from_string_or_null(value);
+        } else if (strcmp(key, KEY_UI_SINGLE_INSTANCE) == 0) {
+            target = &config->ui_single_instance;
+            int error;
+            Py_value = Py_from_bool_or_null(value, DEFAULT_UI_SINGLE_INSTANCE, &error);
+            if (validate && error) {
+                _print_err_bad_value_int(key, value, section, "Not 0 or 1", DEFAULT_UI_SINGLE_INSTANCE);
+            }
+        }
+        break;
+    case UNDO:
+        if (strcmp(key, KEY_UNDO_DEPTH) == 0) {
+            int error;
+            target = &config->undo_depth;
+            Py_value = Py_from_int_or_null(value, 0, MAX_UNDO_DEPTH, DEFAULT_UNDO_DEPTH, &error);
+            if (validate && error) {
+                _print_err_bad_value_int(key, value, section, "Not an integer in range 0-1000", DEFAULT_UNDO_DEPTH);
+            }
         }
         break;
     case UNKNOWN:
@@ -241,9 +417,15 @@ static inline void _update_config(Config *config, enum Section section, char *re
     } else if (validate) {
         _print_err_bad_key(key, value, section, "Unknown key for known header");
     }
+
+    return true;
 }
 
-static inline void _parse_file_into_config(FILE *file, Config *config, bool validate) {
+/**
+ * @return false if a Python error was raised
+ */
+static inline bool _parse_file_into_config(FILE *file, Config *config, bool validate) {
+    bool success = true;
     enum Section section = UNKNOWN;
 
     char *raw_line = (char *)malloc(LINE_MAX_SIZE * sizeof(char));
@@ -269,14 +451,17 @@ static inline void _parse_file_into_config(FILE *file, Config *config, bool vali
             bool success = parse_line(line, line_size, value);
             if (!success && validate) {
                 _print_err_unexpected_line(line);
-            } else if (*value != '\0' || validate) {
-                _update_config(config, section, line, value, validate);
+            } else if ((*value != '\0' || validate) && unlikely(!_update_config(config, section, line, value, validate))) {
+                success = false;
+                break;
             }
         } else if (validate) {
             _print_err_unexpected_line(line);
         }
     }
     free(raw_line);
+
+    return success;
 }
 
 PyObject *parse_config_file(PyObject *self, PyObject *args) {
@@ -292,8 +477,12 @@ PyObject *parse_config_file(PyObject *self, PyObject *args) {
         goto check_defaults;
     }
 
-    _parse_file_into_config(file, config, false);
+    const bool success = _parse_file_into_config(file, config, false);
     fclose(file);
+    if (unlikely(!success)) {
+        Py_DECREF(config);
+        return NULL;
+    }
 
 check_defaults:
     Config_SetDefaults(self, config);
@@ -308,9 +497,18 @@ static void _print_err_missing_keys(Config *config) {
     if (config->cache_size == NULL) {
         _print_err_missing_key(KEY_CACHE_SIZE, CACHE);
     }
+    if (config->decode_processes == NULL) {
+        _print_err_missing_key(KEY_CACHE_DECODE_PROCESSES, CACHE);
+    }
     if (config->kb_copy_to_clipboard_as_base64 == NULL) {
         _print_err_missing_key(KEY_KB_COPY_TO_CLIPBOARD_AS_BASE64, KEYBINDS);
     }
+    if (config->kb_cycle_sort_mode == NULL) {
+        _print_err_missing_key(KEY_KB_CYCLE_SORT_MODE, KEYBINDS);
+    }
+    if (config->kb_export_as_data_uri == NULL) {
+        _print_err_missing_key(KEY_KB_EXPORT_AS_DATA_URI, KEYBINDS);
+    }
     if (config->kb_move_to_new_file == NULL) {
         _print_err_missing_key(KEY_KB_MOVE_TO_NEW_FILE, KEYBINDS);
     }
@@ -329,6 +527,12 @@ static void _print_err_missing_keys(Config *config) {
     if (config->kb_show_details == NULL) {
         _print_err_missing_key(KEY_KB_SHOW_DETAILS, KEYBINDS);
     }
+    if (config->kb_toggle_recursive_browsing == NULL) {
+        _print_err_missing_key(KEY_KB_TOGGLE_RECURSIVE_BROWSING, KEYBINDS);
+    }
+    if (config->kb_toggle_timings == NULL) {
+        _print_err_missing_key(KEY_KB_TOGGLE_TIMINGS, KEYBINDS);
+    }
     if (config->kb_undo_most_recent_action == NULL) {
         _print_err_missing_key(KEY_KB_UNDO_MOST_RECENT_ACTION, KEYBINDS);
     }
@@ -338,6 +542,12 @@ static void _print_err_missing_keys(Config *config) {
     if (config->ui_font == NULL) {
         _print_err_missing_key(KEY_UI_FONT, UI);
     }
+    if (config->ui_single_instance == NULL) {
+        _print_err_missing_key(KEY_UI_SINGLE_INSTANCE, UI);
+    }
+    if (config->undo_depth == NULL) {
+        _print_err_missing_key(KEY_UNDO_DEPTH, UNDO);
+    }
 }
 
 PyObject *validate_config_file(PyObject *self, PyObject *arg) {
@@ -350,9 +560,14 @@ PyObject *validate_config_file(PyObject *self, PyObject *arg) {
     }
 
     Config *config = Config_New();
-    _parse_file_into_config(file, config, true);
+    const bool success = _parse_file_into_config(file, config, true);
     fclose(file);
 
+    if (unlikely(!success)) {
+        Config_dealloc(config);
+        return NULL;
+    }
+
     _print_err_missing_keys(config);
     Config_dealloc(config);
 
@@ -372,16 +587,23 @@ static int config_exec(PyObject *module) {
             PyType_Ready(&Config_Type) ||
             PyModule_AddObjectRef(module, VARIABLE_NAME(Config), (PyObject *)&Config_Type) ||
             PyModule_AddIntConstant(module, VARIABLE_NAME(DEFAULT_CACHE_SIZE), DEFAULT_CACHE_SIZE) ||
+            PyModule_AddIntConstant(module, VARIABLE_NAME(DEFAULT_CACHE_DECODE_PROCESSES), DEFAULT_CACHE_DECODE_PROCESSES) ||
             PyModule_AddStringConstant(module, VARIABLE_NAME(DEFAULT_KB_COPY_TO_CLIPBOARD_AS_BASE64), DEFAULT_KB_COPY_TO_CLIPBOARD_AS_BASE64) ||
+            PyModule_AddStringConstant(module, VARIABLE_NAME(DEFAULT_KB_CYCLE_SORT_MODE), DEFAULT_KB_CYCLE_SORT_MODE) ||
+            PyModule_AddStringConstant(module, VARIABLE_NAME(DEFAULT_KB_EXPORT_AS_DATA_URI), DEFAULT_KB_EXPORT_AS_DATA_URI) ||
             PyModule_AddStringConstant(module, VARIABLE_NAME(DEFAULT_KB_MOVE_TO_NEW_FILE), DEFAULT_KB_MOVE_TO_NEW_FILE) ||
             PyModule_AddStringConstant(module, VARIABLE_NAME(DEFAULT_KB_OPTIMIZE_IMAGE), DEFAULT_KB_OPTIMIZE_IMAGE) ||
             PyModule_AddStringConstant(module, VARIABLE_NAME(DEFAULT_KB_REFRESH), DEFAULT_KB_REFRESH) ||
             PyModule_AddStringConstant(module, VARIABLE_NAME(DEFAULT_KB_RELOAD_IMAGE), DEFAULT_KB_RELOAD_IMAGE) ||
             PyModule_AddStringConstant(module, VARIABLE_NAME(DEFAULT_KB_RENAME), DEFAULT_KB_RENAME) ||
             PyModule_AddStringConstant(module, VARIABLE_NAME(DEFAULT_KB_SHOW_DETAILS), DEFAULT_KB_SHOW_DETAILS) ||
+            PyModule_AddStringConstant(module, VARIABLE_NAME(DEFAULT_KB_TOGGLE_RECURSIVE_BROWSING), DEFAULT_KB_TOGGLE_RECURSIVE_BROWSING) ||
+            PyModule_AddStringConstant(module, VARIABLE_NAME(DEFAULT_KB_TOGGLE_TIMINGS), DEFAULT_KB_TOGGLE_TIMINGS) ||
             PyModule_AddStringConstant(module, VARIABLE_NAME(DEFAULT_KB_UNDO_MOST_RECENT_ACTION), DEFAULT_KB_UNDO_MOST_RECENT_ACTION) ||
             PyModule_AddStringConstant(module, VARIABLE_NAME(DEFAULT_UI_BACKGROUND_COLOR), DEFAULT_UI_BACKGROUND_COLOR) ||
-            PyModule_AddStringConstant(module, VARIABLE_NAME(DEFAULT_UI_FONT), DEFAULT_UI_FONT)
+            PyModule_AddStringConstant(module, VARIABLE_NAME(DEFAULT_UI_FONT), DEFAULT_UI_FONT) ||
+            PyModule_AddObjectRef(module, VARIABLE_NAME(DEFAULT_UI_SINGLE_INSTANCE), DEFAULT_UI_SINGLE_INSTANCE ? Py_True : Py_False) ||
+            PyModule_AddIntConstant(module, VARIABLE_NAME(DEFAULT_UNDO_DEPTH), DEFAULT_UNDO_DEPTH)
         )) {
         Py_DECREF(module);
         return -1;
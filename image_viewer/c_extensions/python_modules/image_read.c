@@ -3,10 +3,28 @@
 #include "includes/image_read.h"
 
 #include "includes/c_optimizations.h"
+#include "includes/cencode.h"
 
+#include <errno.h>
+#include <stdbool.h>
 #include <stddef.h>
+#include <stdint.h>
 #include <turbojpeg.h>
 
+#ifdef _WIN32
+#include <io.h>
+#define write _write
+#else
+#include <unistd.h>
+#endif
+
+#define PROBE_SIZE 4096
+#define MAX_JPEG_SEGMENTS 64
+#define MAX_BYTES_TO_ENCODE_AT_ONCE 1048576
+// Multiple of 3 so each chunk encodes to exactly 4/3 its size without padding
+#define BYTES_TO_STREAM_AT_ONCE 24576
+#define STREAMED_ENCODED_SIZE (BYTES_TO_STREAM_AT_ONCE / 3 * 4)
+
 // CRawImageView Start
 static PyMemberDef CRawImageView_members[] = {
     {"view", Py_T_OBJECT_EX, offsetof(CRawImageView, view), Py_READONLY, 0},
@@ -37,28 +55,387 @@ static const char *WEBP = "WebP";
 static const char *AVIF = "AVIF";
 static const char *DDS = "DDS";
 
-static inline void _magic_number_guess(PyObject *self, CRawImageView *view_buffer) {
-    if (strncmp(view_buffer->buffer, "\x89PNG", 4) == 0) {
-        view_buffer->format = PyObject_GetAttrString(self, VARIABLE_NAME(PNG));
-    } else if (strncmp(view_buffer->buffer, "\xff\xd8\xff", 3) == 0) {
-        view_buffer->format = PyObject_GetAttrString(self, VARIABLE_NAME(JPEG));
-    } else if (strncmp(view_buffer->buffer, "RIFF", 4) == 0) {
-        view_buffer->format = PyObject_GetAttrString(self, VARIABLE_NAME(WEBP));
-    } else if (strncmp(view_buffer->buffer, "GIF8", 4) == 0) {
-        view_buffer->format = PyObject_GetAttrString(self, VARIABLE_NAME(GIF));
-    } else if (strncmp(view_buffer->buffer, "DDS ", 4) == 0) {
-        view_buffer->format = PyObject_GetAttrString(self, VARIABLE_NAME(DDS));
+/**
+ * Formats that can be detected from a file's header.
+ */
+enum ImageFormat
+{
+    FORMAT_UNKNOWN,
+    FORMAT_PNG,
+    FORMAT_JPEG,
+    FORMAT_GIF,
+    FORMAT_WEBP,
+    FORMAT_AVIF,
+    FORMAT_DDS,
+};
+
+/**
+ * Header information found by probing an image.
+ * A frame count of 0 means the image may be animated, but the count is unknown.
+ */
+struct ImageProbe
+{
+    enum ImageFormat format;
+    uint32_t width;
+    uint32_t height;
+    uint32_t frame_count;
+};
+
+static inline uint16_t _read_be16(const unsigned char *buffer) {
+    return (uint16_t)(buffer[0] << 8 | buffer[1]);
+}
+
+static inline uint32_t _read_be32(const unsigned char *buffer) {
+    return (uint32_t)buffer[0] << 24 | (uint32_t)buffer[1] << 16 | (uint32_t)buffer[2] << 8 | buffer[3];
+}
+
+static inline uint16_t _read_le16(const unsigned char *buffer) {
+    return (uint16_t)(buffer[0] | buffer[1] << 8);
+}
+
+static inline uint32_t _read_le24(const unsigned char *buffer) {
+    return (uint32_t)buffer[0] | (uint32_t)buffer[1] << 8 | (uint32_t)buffer[2] << 16;
+}
+
+static inline uint32_t _read_le32(const unsigned char *buffer) {
+    return _read_le24(buffer) | (uint32_t)buffer[3] << 24;
+}
+
+/**
+ * Finds the first ISO base media box of a type between start and end.
+ *
+ * @param buffer Buffer containing boxes
+ * @param start Offset of the first box
+ * @param end Offset to stop searching at
+ * @param type Four character box type
+ * @return Offset of the box's content or 0 if not found
+ */
+static size_t _find_box(const unsigned char *buffer, size_t start, size_t end, const char *type) {
+    while (start + 8 <= end) {
+        const uint32_t box_size = _read_be32(buffer + start);
+        if (memcmp(buffer + start + 4, type, 4) == 0) {
+            return start + 8;
+        }
+        if (box_size < 8) {
+            break;
+        }
+        start += box_size;
+    }
+
+    return 0;
+}
+
+/**
+ * Checks if an ftyp box contains a brand, checking both
+ * the major brand and compatible brands.
+ *
+ * @param buffer Buffer starting with an ftyp box
+ * @param size Size of the buffer
+ * @param brand Four character brand
+ * @return true if brand was found
+ */
+static bool _ftyp_has_brand(const unsigned char *buffer, size_t size, const char *brand) {
+    size_t ftyp_size = _read_be32(buffer);
+    if (ftyp_size > size) {
+        ftyp_size = size;
+    }
+
+    if (memcmp(buffer + 8, brand, 4) == 0) {
+        return true;
+    }
+
+    // Compatible brands start after major brand and minor version
+    for (size_t offset = 16; offset + 4 <= ftyp_size; offset += 4) {
+        if (memcmp(buffer + offset, brand, 4) == 0) {
+            return true;
+        }
+    }
+
+    return false;
+}
+
+/**
+ * Detects an image's format from the start of its file.
+ *
+ * @param buffer Start of a file
+ * @param size Size of buffer
+ * @return The detected format or FORMAT_UNKNOWN
+ */
+static enum ImageFormat _detect_format(const unsigned char *buffer, size_t size) {
+    if (size >= 8 && memcmp(buffer, "\x89PNG\r\n\x1a\n", 8) == 0) {
+        return FORMAT_PNG;
+    }
+    if (size >= 3 && memcmp(buffer, "\xff\xd8\xff", 3) == 0) {
+        return FORMAT_JPEG;
+    }
+    if (size >= 12 && memcmp(buffer, "RIFF", 4) == 0 && memcmp(buffer + 8, "WEBP", 4) == 0) {
+        return FORMAT_WEBP;
+    }
+    if (size >= 6 && (memcmp(buffer, "GIF87a", 6) == 0 || memcmp(buffer, "GIF89a", 6) == 0)) {
+        return FORMAT_GIF;
+    }
+    if (size >= 4 && memcmp(buffer, "DDS ", 4) == 0) {
+        return FORMAT_DDS;
+    }
+    // HEIF files share the ftyp box, but only AVIF brands can be decoded
+    if (size >= 12 && memcmp(buffer + 4, "ftyp", 4) == 0 && (_ftyp_has_brand(buffer, size, "avif") || _ftyp_has_brand(buffer, size, "avis"))) {
+        return FORMAT_AVIF;
+    }
+
+    return FORMAT_UNKNOWN;
+}
+
+static bool _probe_png(const unsigned char *buffer, size_t size, struct ImageProbe *probe) {
+    if (size < 24 || memcmp(buffer + 12, "IHDR", 4) != 0) {
+        return false;
+    }
+
+    probe->width = _read_be32(buffer + 16);
+    probe->height = _read_be32(buffer + 20);
+    probe->frame_count = 1;
+
+    // APNG must have acTL before the first IDAT
+    for (size_t offset = 8; offset + 12 <= size;) {
+        const uint32_t chunk_size = _read_be32(buffer + offset);
+        const unsigned char *chunk_type = buffer + offset + 4;
+
+        if (memcmp(chunk_type, "IDAT", 4) == 0) {
+            break;
+        }
+        if (memcmp(chunk_type, "acTL", 4) == 0) {
+            probe->frame_count = _read_be32(buffer + offset + 8);
+            break;
+        }
+
+        offset += 12 + (size_t)chunk_size;
+    }
+
+    return true;
+}
+
+/**
+ * Finds a JPEG's start of frame by seeking over segments,
+ * so large metadata segments are never read.
+ */
+static bool _probe_jpeg(FILE *file, struct ImageProbe *probe) {
+    unsigned char segment[9];
+    long offset = 2;
+
+    for (int i = 0; i < MAX_JPEG_SEGMENTS; ++i) {
+        if (fseek(file, offset, SEEK_SET) != 0 || fread(segment, 1, 4, file) != 4 || segment[0] != 0xFF) {
+            return false;
+        }
+
+        const unsigned char marker = segment[1];
+        if (marker == 0xFF) {
+            ++offset; // Fill byte
+            continue;
+        }
+        if (marker == 0xD8 || marker == 0x01 || (marker >= 0xD0 && marker <= 0xD7)) {
+            offset += 2; // Standalone markers have no length
+            continue;
+        }
+        if (marker == 0xD9 || marker == 0xDA) {
+            return false; // End of image or start of scan before any frame
+        }
+
+        const uint16_t segment_size = _read_be16(segment + 2);
+        const bool is_start_of_frame = marker >= 0xC0 && marker <= 0xCF && marker != 0xC4 && marker != 0xC8 && marker != 0xCC;
+        if (is_start_of_frame) {
+            if (fread(segment + 4, 1, 5, file) != 5) {
+                return false;
+            }
+
+            probe->height = _read_be16(segment + 5);
+            probe->width = _read_be16(segment + 7);
+            probe->frame_count = 1;
+            return true;
+        }
+
+        offset += 2 + segment_size;
+    }
+
+    return false;
+}
+
+static bool _probe_webp(const unsigned char *buffer, size_t size, struct ImageProbe *probe) {
+    if (size < 30) {
+        return false;
+    }
+
+    const unsigned char *chunk = buffer + 12;
+    const unsigned char *data = chunk + 8;
+    probe->frame_count = 1;
+
+    if (memcmp(chunk, "VP8 ", 4) == 0) {
+        if (memcmp(data + 3, "\x9d\x01\x2a", 3) != 0) {
+            return false;
+        }
+        probe->width = _read_le16(data + 6) & 0x3FFF;
+        probe->height = _read_le16(data + 8) & 0x3FFF;
+    } else if (memcmp(chunk, "VP8L", 4) == 0) {
+        if (data[0] != 0x2F) {
+            return false;
+        }
+        const uint32_t bits = _read_le32(data + 1);
+        probe->width = (bits & 0x3FFF) + 1;
+        probe->height = ((bits >> 14) & 0x3FFF) + 1;
+    } else if (memcmp(chunk, "VP8X", 4) == 0) {
+        if (data[0] & 0x02) {
+            probe->frame_count = 0; // Animation flag set
+        }
+        probe->width = _read_le24(data + 4) + 1;
+        probe->height = _read_le24(data + 7) + 1;
     } else {
-        view_buffer->format = PyObject_GetAttrString(self, VARIABLE_NAME(AVIF));
+        return false;
+    }
+
+    return true;
+}
+
+static bool _probe_gif(const unsigned char *buffer, size_t size, struct ImageProbe *probe) {
+    if (size < 10) {
+        return false;
+    }
+
+    // Finding the number of frames would require reading the whole file
+    probe->width = _read_le16(buffer + 6);
+    probe->height = _read_le16(buffer + 8);
+    probe->frame_count = 0;
+    return true;
+}
+
+static bool _probe_dds(const unsigned char *buffer, size_t size, struct ImageProbe *probe) {
+    if (size < 20) {
+        return false;
+    }
+
+    probe->height = _read_le32(buffer + 12);
+    probe->width = _read_le32(buffer + 16);
+    probe->frame_count = 1;
+    return true;
+}
+
+static bool _probe_avif(const unsigned char *buffer, size_t size, struct ImageProbe *probe) {
+    const size_t ftyp_size = _read_be32(buffer);
+    probe->frame_count = _ftyp_has_brand(buffer, size, "avis") ? 0 : 1;
+
+    // ispe is found in meta -> iprp -> ipco, meta is a full box with 4 extra bytes
+    size_t meta = _find_box(buffer, ftyp_size, size, "meta");
+    size_t iprp = meta == 0 ? 0 : _find_box(buffer, meta + 4, size, "iprp");
+    size_t ipco = iprp == 0 ? 0 : _find_box(buffer, iprp, size, "ipco");
+    size_t ispe = ipco == 0 ? 0 : _find_box(buffer, ipco, size, "ispe");
+    if (ispe == 0 || ispe + 12 > size) {
+        return false;
+    }
+
+    probe->width = _read_be32(buffer + ispe + 4);
+    probe->height = _read_be32(buffer + ispe + 8);
+    return true;
+}
+
+/**
+ * Reads just enough of a file to find its format, dimensions, and frame count.
+ *
+ * @param path Path to an image
+ * @param probe Output for the probe's findings
+ * @return true if the format and dimensions were found
+ */
+static bool _probe_image(const char *path, struct ImageProbe *probe) {
+    FILE *file = fopen(path, "rb");
+    if (file == NULL) {
+        return false;
+    }
+
+    unsigned char buffer[PROBE_SIZE];
+    const size_t size = fread(buffer, 1, PROBE_SIZE, file);
+
+    bool success = false;
+    probe->format = _detect_format(buffer, size);
+    switch (probe->format) {
+    case FORMAT_PNG:
+        success = _probe_png(buffer, size, probe);
+        break;
+    case FORMAT_JPEG:
+        success = _probe_jpeg(file, probe);
+        break;
+    case FORMAT_WEBP:
+        success = _probe_webp(buffer, size, probe);
+        break;
+    case FORMAT_GIF:
+        success = _probe_gif(buffer, size, probe);
+        break;
+    case FORMAT_DDS:
+        success = _probe_dds(buffer, size, probe);
+        break;
+    case FORMAT_AVIF:
+        success = _probe_avif(buffer, size, probe);
+        break;
+    case FORMAT_UNKNOWN:
+        break;
+    }
+
+    fclose(file);
+    return success;
+}
+
+/**
+ * Gets this module's Python string constant for a format.
+ *
+ * @param self This module
+ * @param format A known format
+ * @return New reference to a format string
+ */
+static PyObject *_format_to_py_string(PyObject *self, enum ImageFormat format) {
+    switch (format) {
+    case FORMAT_PNG:
+        return PyObject_GetAttrString(self, VARIABLE_NAME(PNG));
+    case FORMAT_JPEG:
+        return PyObject_GetAttrString(self, VARIABLE_NAME(JPEG));
+    case FORMAT_GIF:
+        return PyObject_GetAttrString(self, VARIABLE_NAME(GIF));
+    case FORMAT_WEBP:
+        return PyObject_GetAttrString(self, VARIABLE_NAME(WEBP));
+    case FORMAT_DDS:
+        return PyObject_GetAttrString(self, VARIABLE_NAME(DDS));
+    default:
+        return PyObject_GetAttrString(self, VARIABLE_NAME(AVIF));
     }
 }
 
-static inline CRawImageView *CRawImageView_New(PyObject *self, PyObject *py_memory_view, char *buffer, unsigned long buffer_size) {
+static PyObject *probe_image(PyObject *self, PyObject *arg) {
+    // Encoded like os.fsencode so names that aren't valid UTF-8 work
+    PyObject *py_path;
+    if (unlikely(!PyUnicode_FSConverter(arg, &py_path))) {
+        return NULL;
+    }
+
+    const char *path = PyBytes_AS_STRING(py_path);
+    struct ImageProbe probe;
+    bool success;
+    Py_BEGIN_ALLOW_THREADS;
+    success = _probe_image(path, &probe);
+    Py_END_ALLOW_THREADS;
+    Py_DECREF(py_path);
+
+    if (!success) {
+        return Py_None;
+    }
+
+    PyObject *py_format = _format_to_py_string(self, probe.format);
+    if (unlikely(py_format == NULL)) {
+        return NULL;
+    }
+
+    return Py_BuildValue("(NIII)", py_format, probe.width, probe.height, probe.frame_count);
+}
+
+static inline CRawImageView *CRawImageView_New(PyObject *self, PyObject *py_memory_view, char *buffer, unsigned long buffer_size, enum ImageFormat format) {
     CRawImageView *image_view = (CRawImageView *)PyObject_New(CRawImageView, &CRawImageView_Type);
     image_view->view = py_memory_view;
     image_view->buffer = buffer;
     image_view->buffer_size = buffer_size;
-    _magic_number_guess(self, image_view);
+    image_view->format = _format_to_py_string(self, format);
 
     return image_view;
 }
@@ -128,15 +505,23 @@ static PyObject *read_image_into_buffer(PyObject *self, PyObject *arg) {
     const size_t read_bytes = fread(buffer, sizeof(char), size, file);
     fclose(file);
     if (unlikely(read_bytes != size)) {
-        goto error;
+        goto error_free_buffer;
+    }
+
+    // Reject unsupported files here so PIL never tries to decode them
+    const enum ImageFormat format = _detect_format((unsigned char *)buffer, size);
+    if (format == FORMAT_UNKNOWN) {
+        goto error_free_buffer;
     }
 
     PyObject *py_memory_view = PyMemoryView_FromMemory(buffer, size, PyBUF_READ);
     if (unlikely(py_memory_view == NULL)) {
-        goto error;
+        goto error_free_buffer;
     }
 
-    return (PyObject *)CRawImageView_New(self, py_memory_view, buffer, size);
+    return (PyObject *)CRawImageView_New(self, py_memory_view, buffer, size, format);
+error_free_buffer:
+    free(buffer);
 error:
     return Py_None;
 }
@@ -212,9 +597,117 @@ error_free_handle:
     return NULL;
 }
 
+static PyObject *encode_as_base64(PyObject *self, PyObject *arg) {
+    CRawImageView *raw_image_view = (CRawImageView *)arg;
+    unsigned long remaining_bytes = raw_image_view->buffer_size;
+    const char *buffer_start = raw_image_view->buffer;
+
+    // Every 3 bytes become 4 characters, with the last group padded
+    const Py_ssize_t encoded_size = 4 * (((Py_ssize_t)remaining_bytes + 2) / 3);
+    PyObject *py_encoded = PyUnicode_New(encoded_size, 127);
+    if (unlikely(py_encoded == NULL)) {
+        return NULL;
+    }
+
+    char *encoded_buffer_position = (char *)PyUnicode_1BYTE_DATA(py_encoded);
+
+    Py_BEGIN_ALLOW_THREADS;
+
+    base64_encodestate state;
+    base64_init_encodestate(&state);
+
+    while (remaining_bytes > 0) {
+        unsigned bytes_to_encode = (unsigned)(remaining_bytes < MAX_BYTES_TO_ENCODE_AT_ONCE ? remaining_bytes : MAX_BYTES_TO_ENCODE_AT_ONCE);
+
+        encoded_buffer_position += base64_encode_block(buffer_start, bytes_to_encode, encoded_buffer_position, &state);
+        remaining_bytes -= bytes_to_encode;
+        buffer_start += bytes_to_encode;
+    }
+
+    base64_encode_blockend(encoded_buffer_position, &state);
+
+    Py_END_ALLOW_THREADS;
+
+    return py_encoded;
+}
+
+/**
+ * Writes all of a buffer to a file descriptor, retrying partial writes.
+ *
+ * @param fd File descriptor to write to
+ * @param buffer Data to write
+ * @param size Bytes to write
+ * @return 0 on success or the errno of the failed write
+ */
+static int _write_all(int fd, const char *buffer, size_t size) {
+    while (size > 0) {
+        const long bytes_written = write(fd, buffer, size);
+        if (unlikely(bytes_written < 0)) {
+            if (errno == EINTR) {
+                continue;
+            }
+            return errno;
+        }
+
+        buffer += bytes_written;
+        size -= bytes_written;
+    }
+
+    return 0;
+}
+
+static PyObject *write_as_base64(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    if (unlikely(nargs != 2)) {
+        PyErr_SetString(PyExc_TypeError, "");
+        return NULL;
+    }
+
+    CRawImageView *raw_image_view = (CRawImageView *)args[0];
+    const int fd = PyObject_AsFileDescriptor(args[1]);
+    if (unlikely(fd == -1)) {
+        return NULL;
+    }
+
+    unsigned long remaining_bytes = raw_image_view->buffer_size;
+    const char *buffer_start = raw_image_view->buffer;
+    int write_error = 0;
+
+    Py_BEGIN_ALLOW_THREADS;
+
+    char encoded_chunk[STREAMED_ENCODED_SIZE];
+    base64_encodestate state;
+    base64_init_encodestate(&state);
+
+    while (remaining_bytes > 0 && write_error == 0) {
+        unsigned bytes_to_encode = (unsigned)(remaining_bytes < BYTES_TO_STREAM_AT_ONCE ? remaining_bytes : BYTES_TO_STREAM_AT_ONCE);
+
+        int encoded_size = base64_encode_block(buffer_start, bytes_to_encode, encoded_chunk, &state);
+        remaining_bytes -= bytes_to_encode;
+        buffer_start += bytes_to_encode;
+
+        if (remaining_bytes == 0) {
+            encoded_size += base64_encode_blockend(encoded_chunk + encoded_size, &state);
+        }
+
+        write_error = _write_all(fd, encoded_chunk, encoded_size);
+    }
+
+    Py_END_ALLOW_THREADS;
+
+    if (unlikely(write_error != 0)) {
+        errno = write_error;
+        return PyErr_SetFromErrno(PyExc_OSError);
+    }
+
+    Py_RETURN_NONE;
+}
+
 static PyMethodDef image_read_methods[] = {
     {"read_image_into_buffer", read_image_into_buffer, METH_O, NULL},
     {"decode_jpeg_downscaled", (PyCFunction)decode_jpeg_downscaled, METH_FASTCALL, NULL},
+    {"probe_image", probe_image, METH_O, NULL},
+    {"encode_as_base64", encode_as_base64, METH_O, NULL},
+    {"write_as_base64", (PyCFunction)write_as_base64, METH_FASTCALL, NULL},
     {NULL, NULL, 0, NULL}
 };
 
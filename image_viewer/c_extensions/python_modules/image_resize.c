@@ -0,0 +1,424 @@
+#define PY_SSIZE_T_CLEAN
+
+#include "includes/c_optimizations.h"
+
+#include <Python.h>
+#include <math.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+// Matches PIL's fixed point precision so results are identical
+#define PRECISION_BITS (32 - 8 - 2)
+#define MULDIV255(a, b) ((((a) * (b) + 128) + (((a) * (b) + 128) >> 8)) >> 8)
+
+// Values of PIL's Resampling enum
+enum Resampling
+{
+    RESAMPLING_NEAREST = 0,
+    RESAMPLING_LANCZOS = 1,
+    RESAMPLING_BILINEAR = 2,
+    RESAMPLING_BICUBIC = 3,
+    RESAMPLING_BOX = 4,
+    RESAMPLING_HAMMING = 5,
+};
+
+struct Filter
+{
+    double (*filter)(double x);
+    double support;
+};
+
+static inline double _box_filter(double x) {
+    return x > -0.5 && x <= 0.5 ? 1.0 : 0.0;
+}
+
+static inline double _bilinear_filter(double x) {
+    x = fabs(x);
+    return x < 1.0 ? 1.0 - x : 0.0;
+}
+
+static inline double _hamming_filter(double x) {
+    x = fabs(x);
+    if (x == 0.0) {
+        return 1.0;
+    }
+    if (x >= 1.0) {
+        return 0.0;
+    }
+    x = x * M_PI;
+    return sin(x) / x * (0.54f + 0.46f * cos(x));
+}
+
+static inline double _bicubic_filter(double x) {
+    const double a = -0.5;
+    x = fabs(x);
+    if (x < 1.0) {
+        return ((a + 2.0) * x - (a + 3.0)) * x * x + 1;
+    }
+    if (x < 2.0) {
+        return (((x - 5) * x + 8) * x - 4) * a;
+    }
+    return 0.0;
+}
+
+static inline double _sinc_filter(double x) {
+    if (x == 0.0) {
+        return 1.0;
+    }
+    x = x * M_PI;
+    return sin(x) / x;
+}
+
+static inline double _lanczos_filter(double x) {
+    return -3.0 <= x && x < 3.0 ? _sinc_filter(x) * _sinc_filter(x / 3) : 0.0;
+}
+
+static const struct Filter BOX = {_box_filter, 0.5};
+static const struct Filter BILINEAR = {_bilinear_filter, 1.0};
+static const struct Filter HAMMING = {_hamming_filter, 1.0};
+static const struct Filter BICUBIC = {_bicubic_filter, 2.0};
+static const struct Filter LANCZOS = {_lanczos_filter, 3.0};
+
+/**
+ * Fixed point coefficients for resampling along one axis.
+ */
+struct Coefficients
+{
+    int32_t *weights;
+    int *bounds;
+    int kernel_size;
+};
+
+static inline uint8_t _clip8(int32_t value) {
+    value >>= PRECISION_BITS;
+    return value <= 0 ? 0 : value >= 255 ? 255
+                                         : (uint8_t)value;
+}
+
+/**
+ * Computes the same fixed point coefficients PIL uses for resampling.
+ *
+ * @param in_size Size of the input along this axis
+ * @param out_size Size of the output along this axis
+ * @param filter Resampling filter
+ * @param coefficients Output for weights and bounds, free both when done
+ * @return false on failure to allocate memory
+ */
+static bool _compute_coefficients(int in_size, int out_size, const struct Filter *filter, struct Coefficients *coefficients) {
+    const double scale = (double)in_size / out_size;
+    const double filter_scale = scale < 1.0 ? 1.0 : scale;
+    const double inverse_filter_scale = 1.0 / filter_scale;
+    const double support = filter->support * filter_scale;
+    const int kernel_size = (int)ceil(support) * 2 + 1;
+
+    double *weights = (double *)malloc((size_t)out_size * kernel_size * sizeof(double));
+    int *bounds = (int *)malloc((size_t)out_size * 2 * sizeof(int));
+    if (unlikely(weights == NULL || bounds == NULL)) {
+        free(weights);
+        free(bounds);
+        return false;
+    }
+
+    for (int xx = 0; xx < out_size; ++xx) {
+        const double center = (xx + 0.5) * scale;
+        int min = (int)(center - support + 0.5);
+        if (min < 0) {
+            min = 0;
+        }
+        int max = (int)(center + support + 0.5);
+        if (max > in_size) {
+            max = in_size;
+        }
+        max -= min;
+
+        double *kernel = weights + (size_t)xx * kernel_size;
+        double total = 0.0;
+        int x = 0;
+        for (; x < max; ++x) {
+            kernel[x] = filter->filter((x + min - center + 0.5) * inverse_filter_scale);
+            total += kernel[x];
+        }
+        if (total != 0.0) {
+            for (x = 0; x < max; ++x) {
+                kernel[x] /= total;
+            }
+        }
+        for (x = max; x < kernel_size; ++x) {
+            kernel[x] = 0.0;
+        }
+
+        bounds[xx * 2] = min;
+        bounds[xx * 2 + 1] = max;
+    }
+
+    // Reuse the buffer since int32 is never bigger than double
+    int32_t *fixed_weights = (int32_t *)weights;
+    for (size_t i = 0; i < (size_t)out_size * kernel_size; ++i) {
+        fixed_weights[i] = (int32_t)(weights[i] < 0 ? -0.5 + weights[i] * (1 << PRECISION_BITS) : 0.5 + weights[i] * (1 << PRECISION_BITS));
+    }
+
+    coefficients->weights = fixed_weights;
+    coefficients->bounds = bounds;
+    coefficients->kernel_size = kernel_size;
+    return true;
+}
+
+/**
+ * Multiplies color channels by alpha, alpha is always the last band.
+ */
+static inline __attribute__((always_inline)) void _premultiply_row(uint8_t *out, const uint8_t *in, int width, int bands) {
+    for (int x = 0; x < width; ++x, in += bands, out += bands) {
+        const unsigned int alpha = in[bands - 1];
+        for (int band = 0; band < bands - 1; ++band) {
+            const unsigned int value = in[band];
+            out[band] = (uint8_t)MULDIV255(value, alpha);
+        }
+        out[bands - 1] = (uint8_t)alpha;
+    }
+}
+
+/**
+ * Divides color channels by alpha, alpha is always the last band.
+ */
+static inline __attribute__((always_inline)) void _unpremultiply_row(uint8_t *row, int width, int bands) {
+    for (int x = 0; x < width; ++x, row += bands) {
+        const unsigned int alpha = row[bands - 1];
+        if (alpha == 0 || alpha == 255) {
+            continue;
+        }
+        for (int band = 0; band < bands - 1; ++band) {
+            const unsigned int value = (255 * row[band]) / alpha;
+            row[band] = value > 255 ? 255 : (uint8_t)value;
+        }
+    }
+}
+
+/**
+ * Resamples a premultiplied row horizontally.
+ */
+static inline __attribute__((always_inline)) void _resample_row(uint8_t *out, const uint8_t *in, int out_width, int bands, const struct Coefficients *coefficients) {
+    for (int xx = 0; xx < out_width; ++xx) {
+        const int min = coefficients->bounds[xx * 2];
+        const int max = coefficients->bounds[xx * 2 + 1];
+        const int32_t *kernel = coefficients->weights + (size_t)xx * coefficients->kernel_size;
+        const uint8_t *source = in + (size_t)min * bands;
+
+        int32_t sums[4] = {1 << (PRECISION_BITS - 1), 1 << (PRECISION_BITS - 1), 1 << (PRECISION_BITS - 1), 1 << (PRECISION_BITS - 1)};
+        for (int x = 0; x < max; ++x, source += bands) {
+            for (int band = 0; band < bands; ++band) {
+                sums[band] += source[band] * kernel[x];
+            }
+        }
+
+        for (int band = 0; band < bands; ++band) {
+            out[(size_t)xx * bands + band] = _clip8(sums[band]);
+        }
+    }
+}
+
+/**
+ * Premultiplies, resamples, and unpremultiplies an image with alpha as its last band.
+ * Rows are premultiplied as they are resampled, so no premultiplied copy
+ * of the full input is ever made.
+ *
+ * @return false on failure to allocate memory
+ */
+static inline __attribute__((always_inline)) bool _resize_premultiplied(uint8_t *out, const uint8_t *in, int bands, int width, int height, int new_width, int new_height, const struct Filter *filter) {
+    const bool need_horizontal = new_width != width;
+    const bool need_vertical = new_height != height;
+    const size_t in_row_size = (size_t)width * bands;
+    const size_t out_row_size = (size_t)new_width * bands;
+
+    bool success = false;
+    struct Coefficients horizontal = {NULL, NULL, 0};
+    struct Coefficients vertical = {NULL, NULL, 0};
+    uint8_t *premultiplied_row = NULL;
+    uint8_t *temp = NULL;
+    int32_t *sums = NULL;
+
+    if (unlikely(!_compute_coefficients(width, new_width, filter, &horizontal) || !_compute_coefficients(height, new_height, filter, &vertical))) {
+        goto end;
+    }
+
+    // Only rows used by the vertical pass need a horizontal pass
+    const int first_row = need_vertical ? vertical.bounds[0] : 0;
+    const int last_row = need_vertical ? vertical.bounds[new_height * 2 - 2] + vertical.bounds[new_height * 2 - 1] : height;
+
+    premultiplied_row = (uint8_t *)malloc(in_row_size);
+    if (unlikely(premultiplied_row == NULL)) {
+        goto end;
+    }
+
+    if (!need_vertical) {
+        for (int y = 0; y < height; ++y) {
+            _premultiply_row(premultiplied_row, in + y * in_row_size, width, bands);
+            _resample_row(out + y * out_row_size, premultiplied_row, new_width, bands, &horizontal);
+            _unpremultiply_row(out + y * out_row_size, new_width, bands);
+        }
+        success = true;
+        goto end;
+    }
+
+    // Premultiplied rows after the horizontal pass, or the input if not needed
+    temp = (uint8_t *)malloc((size_t)(last_row - first_row) * out_row_size);
+    sums = (int32_t *)malloc(out_row_size * sizeof(int32_t));
+    if (unlikely(temp == NULL || sums == NULL)) {
+        goto end;
+    }
+
+    for (int y = first_row; y < last_row; ++y) {
+        uint8_t *temp_row = temp + (size_t)(y - first_row) * out_row_size;
+        if (need_horizontal) {
+            _premultiply_row(premultiplied_row, in + y * in_row_size, width, bands);
+            _resample_row(temp_row, premultiplied_row, new_width, bands, &horizontal);
+        } else {
+            _premultiply_row(temp_row, in + y * in_row_size, width, bands);
+        }
+    }
+
+    for (int yy = 0; yy < new_height; ++yy) {
+        const int min = vertical.bounds[yy * 2] - first_row;
+        const int max = vertical.bounds[yy * 2 + 1];
+        const int32_t *kernel = vertical.weights + (size_t)yy * vertical.kernel_size;
+
+        for (size_t i = 0; i < out_row_size; ++i) {
+            sums[i] = 1 << (PRECISION_BITS - 1);
+        }
+
+        // Accumulate whole rows at a time to read the temp buffer sequentially
+        for (int y = 0; y < max; ++y) {
+            const uint8_t *temp_row = temp + (size_t)(y + min) * out_row_size;
+            const int32_t weight = kernel[y];
+            for (size_t i = 0; i < out_row_size; ++i) {
+                sums[i] += temp_row[i] * weight;
+            }
+        }
+
+        uint8_t *out_row = out + yy * out_row_size;
+        for (size_t i = 0; i < out_row_size; ++i) {
+            out_row[i] = _clip8(sums[i]);
+        }
+        _unpremultiply_row(out_row, new_width, bands);
+    }
+
+    success = true;
+end:
+    free(horizontal.weights);
+    free(horizontal.bounds);
+    free(vertical.weights);
+    free(vertical.bounds);
+    free(premultiplied_row);
+    free(temp);
+    free(sums);
+    return success;
+}
+
+/**
+ * Band count is passed as a constant so the inner loops can be unrolled.
+ */
+static bool _resize_premultiplied_rgba(uint8_t *out, const uint8_t *in, int width, int height, int new_width, int new_height, const struct Filter *filter) {
+    return _resize_premultiplied(out, in, 4, width, height, new_width, new_height, filter);
+}
+
+static bool _resize_premultiplied_la(uint8_t *out, const uint8_t *in, int width, int height, int new_width, int new_height, const struct Filter *filter) {
+    return _resize_premultiplied(out, in, 2, width, height, new_width, new_height, filter);
+}
+
+static const struct Filter *_get_filter(long resample) {
+    switch (resample) {
+    case RESAMPLING_LANCZOS:
+        return &LANCZOS;
+    case RESAMPLING_BILINEAR:
+        return &BILINEAR;
+    case RESAMPLING_BICUBIC:
+        return &BICUBIC;
+    case RESAMPLING_BOX:
+        return &BOX;
+    case RESAMPLING_HAMMING:
+        return &HAMMING;
+    default:
+        return NULL;
+    }
+}
+
+static PyObject *resize_premultiplied(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    if (unlikely(nargs != 7)) {
+        PyErr_SetString(PyExc_TypeError, "");
+        return NULL;
+    }
+
+    const long bands = PyLong_AsLong(args[1]);
+    const long width = PyLong_AsLong(args[2]);
+    const long height = PyLong_AsLong(args[3]);
+    const long new_width = PyLong_AsLong(args[4]);
+    const long new_height = PyLong_AsLong(args[5]);
+    const struct Filter *filter = _get_filter(PyLong_AsLong(args[6]));
+    if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+
+    if (unlikely((bands != 2 && bands != 4) || width <= 0 || height <= 0 || new_width <= 0 || new_height <= 0 || filter == NULL)) {
+        PyErr_SetString(PyExc_ValueError, "");
+        return NULL;
+    }
+
+    Py_buffer in;
+    if (unlikely(PyObject_GetBuffer(args[0], &in, PyBUF_SIMPLE) < 0)) {
+        return NULL;
+    }
+
+    PyObject *py_out = NULL;
+    if (unlikely(in.len != (Py_ssize_t)width * height * bands)) {
+        PyErr_SetString(PyExc_ValueError, "");
+        goto end;
+    }
+
+    py_out = PyBytes_FromStringAndSize(NULL, (Py_ssize_t)new_width * new_height * bands);
+    if (unlikely(py_out == NULL)) {
+        goto end;
+    }
+
+    bool success;
+    Py_BEGIN_ALLOW_THREADS;
+    success = (bands == 4 ? _resize_premultiplied_rgba : _resize_premultiplied_la)((uint8_t *)PyBytes_AS_STRING(py_out), (const uint8_t *)in.buf, width, height, new_width, new_height, filter);
+    Py_END_ALLOW_THREADS;
+
+    if (unlikely(!success)) {
+        Py_CLEAR(py_out);
+        PyErr_NoMemory();
+    }
+
+end:
+    PyBuffer_Release(&in);
+    return py_out;
+}
+
+static PyMethodDef image_resize_methods[] = {
+    {"resize_premultiplied", (PyCFunction)resize_premultiplied, METH_FASTCALL, NULL},
+    {NULL, NULL, 0, NULL}
+};
+
+static int image_resize_exec(PyObject *Py_UNUSED(module)) {
+    return 0;
+}
+
+static PyModuleDef_Slot image_resize_slots[] = {
+    {Py_mod_exec, image_resize_exec},
+    {Py_mod_multiple_interpreters, Py_MOD_MULTIPLE_INTERPRETERS_NOT_SUPPORTED},
+#ifdef Py_GIL_DISABLED
+    {Py_mod_gil, Py_MOD_GIL_NOT_USED},
+#endif
+    {0, NULL}
+};
+
+static struct PyModuleDef image_resize_module = {
+    PyModuleDef_HEAD_INIT,
+    .m_name = "_resize",
+    .m_size = 0,
+    .m_methods = image_resize_methods,
+    .m_slots = image_resize_slots
+};
+
+PyMODINIT_FUNC PyInit__resize(void) {
+    return PyModuleDef_Init(&image_resize_module);
+}
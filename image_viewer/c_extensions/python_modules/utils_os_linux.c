@@ -0,0 +1,340 @@
+#define _GNU_SOURCE
+#define PY_SSIZE_T_CLEAN
+
+#include "includes/c_optimizations.h"
+
+#include <Python.h>
+#include <dirent.h>
+#include <fcntl.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include <strings.h>
+#include <sys/stat.h>
+#include <sys/syscall.h>
+#include <unistd.h>
+
+#define DIRENT_BUFFER_SIZE 32768
+#define MAX_SUFFIXES 32
+
+struct linux_dirent64
+{
+    ino64_t d_ino;
+    off64_t d_off;
+    unsigned short d_reclen;
+    unsigned char d_type;
+    char d_name[];
+};
+
+/**
+ * Checks if a directory entry is a directory.
+ * Entries that can't be checked are considered not to be directories.
+ *
+ * @param folder_fd File descriptor of the folder containing the entry
+ * @param entry The directory entry to check
+ * @param follow_symlinks If symlinks to directories should count as directories
+ * @return true if entry is a directory
+ */
+static inline bool _is_dir(int folder_fd, const struct linux_dirent64 *entry, bool follow_symlinks) {
+    switch (entry->d_type) {
+    case DT_DIR:
+        return true;
+    case DT_UNKNOWN:
+        break;
+    case DT_LNK:
+        if (follow_symlinks) {
+            break;
+        }
+        return false;
+    default:
+        return false;
+    }
+
+    // Symlinks and file systems that don't fill d_type need a stat call
+    struct stat entry_stat;
+    return fstatat(folder_fd, entry->d_name, &entry_stat, follow_symlinks ? 0 : AT_SYMLINK_NOFOLLOW) == 0 && S_ISDIR(entry_stat.st_mode);
+}
+
+/**
+ * Checks if a file name ends in one of the provided suffixes, ignoring case.
+ * The suffix is considered to start after the last dot.
+ *
+ * @param name Null terminated file name
+ * @param suffixes Array of null terminated suffixes without a leading dot
+ * @param suffix_count Length of `suffixes`
+ * @return true if name's suffix is in `suffixes`
+ */
+static inline bool _has_suffix(const char *name, const char *const *suffixes, Py_ssize_t suffix_count) {
+    const char *dot = strrchr(name, '.');
+    if (dot == NULL) {
+        return false;
+    }
+
+    for (Py_ssize_t i = 0; i < suffix_count; ++i) {
+        if (strcasecmp(dot + 1, suffixes[i]) == 0) {
+            return true;
+        }
+    }
+
+    return false;
+}
+
+/**
+ * Lists either all non-directory entries in a folder or all directories, not
+ * following symlinks, in a folder. If suffixes is not NULL, only entries ending
+ * in one of the suffixes are included.
+ *
+ * @param path Path to a folder
+ * @param suffixes Array of suffixes to filter on or NULL to include all entries
+ * @param suffix_count Length of `suffixes`
+ * @param list_folders If directories should be listed instead of files
+ * @return New PyList of entry names, empty on failure to open the folder
+ */
+static PyObject *_list_folder(const char *path, const char *const *suffixes, Py_ssize_t suffix_count, bool list_folders) {
+    PyObject *py_files = PyList_New(0);
+    if (unlikely(py_files == NULL)) {
+        return NULL;
+    }
+
+    int folder_fd;
+    Py_BEGIN_ALLOW_THREADS;
+    folder_fd = open(path, O_RDONLY | O_DIRECTORY | O_CLOEXEC);
+    Py_END_ALLOW_THREADS;
+
+    if (folder_fd == -1) {
+        return py_files;
+    }
+
+    char *dirent_buffer = (char *)malloc(DIRENT_BUFFER_SIZE * sizeof(char));
+    if (unlikely(dirent_buffer == NULL)) {
+        close(folder_fd);
+        Py_DECREF(py_files);
+        return PyErr_NoMemory();
+    }
+
+    while (true) {
+        long bytes_read;
+        Py_BEGIN_ALLOW_THREADS;
+        bytes_read = syscall(SYS_getdents64, folder_fd, dirent_buffer, DIRENT_BUFFER_SIZE);
+        Py_END_ALLOW_THREADS;
+
+        if (bytes_read <= 0) {
+            break;
+        }
+
+        for (long offset = 0; offset < bytes_read;) {
+            const struct linux_dirent64 *entry = (struct linux_dirent64 *)(dirent_buffer + offset);
+            offset += entry->d_reclen;
+
+            const char *name = entry->d_name;
+            if (name[0] == '.' && (name[1] == '\0' || (name[1] == '.' && name[2] == '\0'))) {
+                continue;
+            }
+
+            if ((suffixes != NULL && !_has_suffix(name, suffixes, suffix_count)) || _is_dir(folder_fd, entry, !list_folders) != list_folders) {
+                continue;
+            }
+
+            PyObject *py_file_name = PyUnicode_DecodeFSDefault(name);
+            if (unlikely(py_file_name == NULL || PyList_Append(py_files, py_file_name) < 0)) {
+                Py_XDECREF(py_file_name);
+                Py_CLEAR(py_files);
+                goto end;
+            }
+            Py_DECREF(py_file_name);
+        }
+    }
+
+end:
+    free(dirent_buffer);
+    close(folder_fd);
+    return py_files;
+}
+
+static PyObject *get_files_in_folder(PyObject *self, PyObject *arg) {
+    PyObject *py_path;
+    if (unlikely(!PyUnicode_FSConverter(arg, &py_path))) {
+        return NULL;
+    }
+
+    PyObject *py_files = _list_folder(PyBytes_AS_STRING(py_path), NULL, 0, false);
+    Py_DECREF(py_path);
+
+    return py_files;
+}
+
+static PyObject *get_folders_in_folder(PyObject *self, PyObject *arg) {
+    PyObject *py_path;
+    if (unlikely(!PyUnicode_FSConverter(arg, &py_path))) {
+        return NULL;
+    }
+
+    PyObject *py_folders = _list_folder(PyBytes_AS_STRING(py_path), NULL, 0, true);
+    Py_DECREF(py_path);
+
+    return py_folders;
+}
+
+static PyObject *get_files_in_folder_with_suffixes(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    if (unlikely(nargs != 2)) {
+        PyErr_SetString(PyExc_TypeError, "");
+        return NULL;
+    }
+
+    PyObject *py_files = NULL;
+    PyObject *py_suffixes = NULL;
+    PyObject *py_path;
+    if (unlikely(!PyUnicode_FSConverter(args[0], &py_path))) {
+        return NULL;
+    }
+
+    py_suffixes = PySequence_Fast(args[1], "");
+    if (unlikely(py_suffixes == NULL)) {
+        goto end;
+    }
+
+    const Py_ssize_t suffix_count = PySequence_Fast_GET_SIZE(py_suffixes);
+    if (unlikely(suffix_count > MAX_SUFFIXES)) {
+        PyErr_SetString(PyExc_ValueError, "");
+        goto end;
+    }
+
+    // Pointers are valid as long as py_suffixes holds a reference to each str
+    const char *suffixes[MAX_SUFFIXES];
+    for (Py_ssize_t i = 0; i < suffix_count; ++i) {
+        suffixes[i] = PyUnicode_AsUTF8(PySequence_Fast_GET_ITEM(py_suffixes, i));
+        if (unlikely(suffixes[i] == NULL)) {
+            goto end;
+        }
+    }
+
+    py_files = _list_folder(PyBytes_AS_STRING(py_path), suffixes, suffix_count, false);
+
+end:
+    Py_XDECREF(py_suffixes);
+    Py_DECREF(py_path);
+    return py_files;
+}
+
+/**
+ * Result of a stat call on a single file.
+ */
+struct FileStat
+{
+    long long modified_ns;
+    long long size;
+    bool success;
+};
+
+static PyObject *get_file_stats_in_folder(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    if (unlikely(nargs != 2)) {
+        PyErr_SetString(PyExc_TypeError, "");
+        return NULL;
+    }
+
+    PyObject *py_path;
+    if (unlikely(!PyUnicode_FSConverter(args[0], &py_path))) {
+        return NULL;
+    }
+
+    PyObject *py_file_names = PySequence_Fast(args[1], "");
+    if (unlikely(py_file_names == NULL)) {
+        Py_DECREF(py_path);
+        return NULL;
+    }
+
+    PyObject *py_stats = NULL;
+    PyObject **py_encoded_names = NULL;
+    struct FileStat *file_stats = NULL;
+
+    const Py_ssize_t file_count = PySequence_Fast_GET_SIZE(py_file_names);
+    py_encoded_names = (PyObject **)calloc(file_count, sizeof(PyObject *));
+    file_stats = (struct FileStat *)malloc(file_count * sizeof(struct FileStat));
+    if (unlikely((py_encoded_names == NULL || file_stats == NULL) && file_count > 0)) {
+        PyErr_NoMemory();
+        goto end;
+    }
+
+    // Names are encoded like os.fsencode so names that aren't valid UTF-8 work
+    for (Py_ssize_t i = 0; i < file_count; ++i) {
+        if (unlikely(!PyUnicode_FSConverter(PySequence_Fast_GET_ITEM(py_file_names, i), py_encoded_names + i))) {
+            goto end;
+        }
+    }
+
+    const char *path = PyBytes_AS_STRING(py_path);
+    Py_BEGIN_ALLOW_THREADS;
+    const int folder_fd = open(path, O_RDONLY | O_DIRECTORY | O_CLOEXEC);
+    for (Py_ssize_t i = 0; i < file_count; ++i) {
+        struct stat file_stat;
+        struct FileStat *result = file_stats + i;
+        result->success = folder_fd != -1 && fstatat(folder_fd, PyBytes_AS_STRING(py_encoded_names[i]), &file_stat, 0) == 0;
+        if (result->success) {
+            result->modified_ns = file_stat.st_mtim.tv_sec * 1000000000LL + file_stat.st_mtim.tv_nsec;
+            result->size = file_stat.st_size;
+        }
+    }
+    if (folder_fd != -1) {
+        close(folder_fd);
+    }
+    Py_END_ALLOW_THREADS;
+
+    py_stats = PyList_New(file_count);
+    if (unlikely(py_stats == NULL)) {
+        goto end;
+    }
+
+    for (Py_ssize_t i = 0; i < file_count; ++i) {
+        const struct FileStat *result = file_stats + i;
+        PyObject *py_stat = result->success ? Py_BuildValue("(LL)", result->modified_ns, result->size) : Py_NewRef(Py_None);
+        if (unlikely(py_stat == NULL)) {
+            Py_CLEAR(py_stats);
+            goto end;
+        }
+        PyList_SET_ITEM(py_stats, i, py_stat);
+    }
+
+end:
+    if (py_encoded_names != NULL) {
+        for (Py_ssize_t i = 0; i < file_count; ++i) {
+            Py_XDECREF(py_encoded_names[i]);
+        }
+    }
+    free(py_encoded_names);
+    free(file_stats);
+    Py_DECREF(py_file_names);
+    Py_DECREF(py_path);
+    return py_stats;
+}
+
+static PyMethodDef os_methods[] = {
+    {"get_files_in_folder", get_files_in_folder, METH_O, NULL},
+    {"get_files_in_folder_with_suffixes", (PyCFunction)get_files_in_folder_with_suffixes, METH_FASTCALL, NULL},
+    {"get_folders_in_folder", get_folders_in_folder, METH_O, NULL},
+    {"get_file_stats_in_folder", (PyCFunction)get_file_stats_in_folder, METH_FASTCALL, NULL},
+    {NULL, NULL, 0, NULL}
+};
+
+static int os_exec(PyObject *Py_UNUSED(module)) {
+    return 0;
+}
+
+static PyModuleDef_Slot os_slots[] = {
+    {Py_mod_exec, os_exec},
+    {Py_mod_multiple_interpreters, Py_MOD_MULTIPLE_INTERPRETERS_NOT_SUPPORTED},
+#ifdef Py_GIL_DISABLED
+    {Py_mod_gil, Py_MOD_GIL_NOT_USED},
+#endif
+    {0, NULL}
+};
+
+static struct PyModuleDef os_module = {
+    PyModuleDef_HEAD_INIT,
+    .m_name = "_os_linux",
+    .m_size = 0,
+    .m_methods = os_methods,
+    .m_slots = os_slots
+};
+
+PyMODINIT_FUNC PyInit__os_linux(void) {
+    return PyModuleDef_Init(&os_module);
+}
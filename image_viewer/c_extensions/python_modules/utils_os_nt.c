@@ -388,13 +388,13 @@ static PyObject *read_buffer_as_base64_and_copy_to_clipboard(PyObject *self, PyO
         buffer_start += bytes_to_encode;
     }
 
-    base64_encode_blockend(encoded_buffer, &state);
+    encoded_buffer_position += base64_encode_blockend(encoded_buffer_position, &state);
 
     *encoded_buffer_position = '\0';
 
     GlobalUnlock(hGlobal);
 
-    _set_win_clipboard(CF_TEXT, encoded_buffer);
+    _set_win_clipboard(CF_TEXT, hGlobal);
 
 end:
     Py_END_ALLOW_THREADS;
@@ -25,6 +25,15 @@ class Movement(IntEnum):
     BACKWARD = -1
 
 
+class SortMode(IntEnum):
+    """Orders images can be sorted in."""
+
+    NAME = 0
+    MODIFIED_TIME = 1
+    SIZE = 2
+    DIMENSIONS = 3
+
+
 class TkTags(StrEnum):
     """Tags for items on the UI."""
 
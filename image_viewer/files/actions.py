@@ -3,19 +3,37 @@ Classes representing undoable actions that a user can do
 """
 
 import os
+import sys
 from abc import abstractmethod
 from typing import override
 
 from image_viewer.utils.os import restore_file, trash_file
 
 
+def split_path(path: str) -> tuple[str, str]:
+    """Splits a path so actions in the same folder share one folder string
+    and only store their own names, keeping large groups of actions small.
+
+    :param path: Path to split.
+    :returns: Interned folder, including its trailing separator, and name.
+    Joining them gives back path exactly."""
+    name: str = os.path.basename(path)
+    return sys.intern(path[: len(path) - len(name)]), name
+
+
 class FileAction:
     """Class used to track actions done to a file"""
 
-    __slots__ = ("original_path",)
+    __slots__ = ("_original_folder", "_original_name")
 
     def __init__(self, original_path: str) -> None:
-        self.original_path: str = original_path
+        self._original_folder: str
+        self._original_name: str
+        self._original_folder, self._original_name = split_path(original_path)
+
+    @property
+    def original_path(self) -> str:
+        return self._original_folder + self._original_name
 
     @abstractmethod
     def get_undo_message(self) -> str:
@@ -29,15 +47,27 @@ class FileAction:
         :returns: Tuple of path restored and path removed,
         paths will be empty if unchanged"""
 
+    def undo_all(self) -> list[tuple[str, str]]:
+        """Undoes this action and any grouped with it.
+
+        :returns: Path restored and path removed for each action undone"""
+        return [self.undo()]
+
 
 class Rename(FileAction):
     """Represents a file path changing"""
 
-    __slots__ = ("new_path",)
+    __slots__ = ("_new_folder", "_new_name")
 
     def __init__(self, original_path: str, new_path: str) -> None:
         super().__init__(original_path)
-        self.new_path: str = new_path
+        self._new_folder: str
+        self._new_name: str
+        self._new_folder, self._new_name = split_path(new_path)
+
+    @property
+    def new_path(self) -> str:
+        return self._new_folder + self._new_name
 
     @override
     def get_undo_message(self) -> str:
@@ -94,3 +124,49 @@ class Delete(FileAction):
     def undo(self) -> tuple[str, str]:
         restore_file(self.original_path)
         return (self.original_path, "")
+
+
+class ActionGroup(FileAction):
+    """Represents many actions done at once that are undone together,
+    such as converting every image in a folder"""
+
+    __slots__ = ("actions", "description")
+
+    def __init__(self, description: str, actions: list[FileAction]) -> None:
+        super().__init__(actions[0].original_path)
+        self.description: str = description
+        self.actions: list[FileAction] = actions
+
+    @override
+    def get_undo_message(self) -> str:
+        return f"Undo {self.description} ({len(self.actions)} files)?"
+
+    @override
+    def undo(self) -> tuple[str, str]:
+        """Undoes all actions. Use undo_all to get the paths each changed.
+
+        :returns: Empty paths"""
+        self.undo_all()
+        return ("", "")
+
+    @override
+    def undo_all(self) -> list[tuple[str, str]]:
+        """Undoes all actions, most recent first. Actions that fail to undo are
+        kept so undoing the group again retries them.
+
+        :returns: Path restored and path removed for each action undone
+        :raises OSError: If no action could be undone"""
+        results: list[tuple[str, str]] = []
+        failed: list[FileAction] = []
+
+        for action in reversed(self.actions):
+            try:
+                results.append(action.undo())
+            except OSError:
+                failed.append(action)
+
+        self.actions = failed[::-1]
+        if not results:
+            raise OSError
+
+        return results
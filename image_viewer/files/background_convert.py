@@ -0,0 +1,57 @@
+"""Converts a single image without blocking the UI."""
+
+from threading import Thread
+
+from image_viewer.utils.convert import ConvertProgress, convert_file
+
+
+class BackgroundConverter:
+    """Converts an image on a worker thread. Progress is polled while it runs
+    and the new file is removed if cancelled."""
+
+    __slots__ = (
+        "_thread",
+        "converted",
+        "new_path",
+        "original_path",
+        "progress",
+        "target_format",
+    )
+
+    def __init__(
+        self,
+        original_path: str,
+        new_path: str,
+        target_format: str,
+        quality: int,
+        speed: int,
+    ) -> None:
+        self.original_path: str = original_path
+        self.new_path: str = new_path
+        self.target_format: str = target_format
+        self.progress = ConvertProgress()
+        self.converted: bool = False
+
+        # Image is read again so frames of the displayed image aren't seeked
+        self._thread = Thread(target=self._convert, args=(quality, speed), daemon=True)
+        self._thread.start()
+
+    @property
+    def finished(self) -> bool:
+        """True once the conversion succeeded, failed, or was cancelled."""
+        return not self._thread.is_alive()
+
+    def cancel(self) -> None:
+        """Stops the conversion before its next frame. It is done stopping,
+        and the new file removed, once finished is True."""
+        self.progress.cancelled = True
+
+    def _convert(self, quality: int, speed: int) -> None:
+        self.converted = convert_file(
+            self.original_path,
+            self.new_path,
+            self.target_format,
+            quality,
+            speed,
+            self.progress,
+        )
@@ -0,0 +1,78 @@
+"""Exports images as base64 without blocking the UI or holding the whole
+encoding in memory."""
+
+import os
+from threading import Thread
+from typing import BinaryIO
+
+from image_viewer.image._read import CRawImageView, write_as_base64
+
+# Added to an image's path to name its exported data URI
+DATA_URI_SUFFIX: str = ".base64.txt"
+
+# Formats whose MIME type isn't image/<format>
+_MIME_TYPES: dict[str, str] = {"DDS": "image/vnd-ms.dds"}
+
+
+def get_data_uri_prefix(image_format: str) -> bytes:
+    """:param image_format: Format of the image, like PNG.
+    :returns: Start of a data URI for that format, before the base64."""
+    mime_type: str = _MIME_TYPES.get(image_format, f"image/{image_format.lower()}")
+    return f"data:{mime_type};base64,".encode("ascii")
+
+
+def export_base64(image_view: CRawImageView, fp: BinaryIO, data_uri: bool) -> None:
+    """Streams an image as base64 to a file or pipe in small chunks.
+
+    :param image_view: Image to export.
+    :param fp: Binary file to write to, like sys.stdout.buffer.
+    :param data_uri: If the base64 should be prefixed to make a data URI.
+    :raises OSError: If writing fails."""
+    if data_uri:
+        fp.write(get_data_uri_prefix(image_view.format))
+    # Buffered writes must land before the C encoder writes to the descriptor
+    fp.flush()
+    write_as_base64(image_view, fp)
+
+
+class BackgroundBase64Exporter:
+    """Exports an image as base64 to a file on a worker thread.
+    A partially written file is removed if writing fails."""
+
+    __slots__ = ("_thread", "exported", "output_path")
+
+    def __init__(
+        self, image_view: CRawImageView, output_path: str, data_uri: bool = True
+    ) -> None:
+        """:param image_view: Image to export, kept alive until exported.
+        :param output_path: Path of the file to write.
+        :param data_uri: If a data URI should be written instead of plain base64."""
+        self.output_path: str = output_path
+        self.exported: bool = False
+
+        self._thread = Thread(
+            target=self._export, args=(image_view, data_uri), daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def finished(self) -> bool:
+        """True once the export succeeded or failed."""
+        return not self._thread.is_alive()
+
+    def wait(self) -> None:
+        """Waits for the export to finish so no partial file is left."""
+        self._thread.join()
+
+    def _export(self, image_view: CRawImageView, data_uri: bool) -> None:
+        try:
+            with open(self.output_path, "wb") as fp:
+                export_base64(image_view, fp, data_uri)
+        except OSError:
+            try:
+                os.remove(self.output_path)
+            except OSError:
+                pass
+            return
+
+        self.exported = True
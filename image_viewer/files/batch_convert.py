@@ -0,0 +1,107 @@
+"""Converts many images to another format in worker processes."""
+
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from image_viewer.files.actions import Convert
+from image_viewer.utils.convert import convert_file
+from image_viewer.utils.os import get_process_context
+from image_viewer.utils.PIL import init_PIL_in_worker
+
+MAX_CONVERT_WORKERS: int = 8
+
+
+class BatchConverter:
+    """Converts a list of images in a process pool. Results are collected
+    by polling so the caller can show progress between them."""
+
+    __slots__ = (
+        "_executor",
+        "_pending",
+        "completed",
+        "converted",
+        "target_format",
+        "total",
+    )
+
+    def __init__(
+        self,
+        paths: list[tuple[str, str]],
+        target_format: str,
+        speed: int,
+        quality: int,
+    ) -> None:
+        """:param paths: Original path and new path for each image to convert.
+        :param target_format: Format to convert to.
+        :param speed: Encoder speed passed to every conversion.
+        :param quality: Encoder quality passed to every conversion."""
+        self.target_format: str = target_format
+        self.total: int = len(paths)
+        self.completed: int = 0
+        # Every successful conversion collected so far
+        self.converted: list[Convert] = []
+
+        self._executor: ProcessPoolExecutor | None = ProcessPoolExecutor(
+            min(MAX_CONVERT_WORKERS, os.cpu_count() or 1, max(self.total, 1)),
+            get_process_context(),
+            init_PIL_in_worker,
+        )
+        self._pending: list[tuple[Convert, Future[bool]]] = [
+            (
+                Convert(original_path, new_path),
+                self._executor.submit(
+                    convert_file,
+                    original_path,
+                    new_path,
+                    target_format,
+                    quality,
+                    speed,
+                ),
+            )
+            for original_path, new_path in paths
+        ]
+
+    @property
+    def finished(self) -> bool:
+        """True when every conversion has been collected or was cancelled."""
+        return not self._pending
+
+    @property
+    def cancelled(self) -> bool:
+        """True once cancel was called, even if conversions are still running."""
+        return self._executor is None
+
+    def collect_finished(self) -> list[Convert]:
+        """Gets conversions that completed since the last call.
+
+        :returns: Actions for each image successfully converted."""
+        converted: list[Convert] = []
+        running: list[tuple[Convert, Future[bool]]] = []
+
+        for action, future in self._pending:
+            if not future.done():
+                running.append((action, future))
+                continue
+
+            self.completed += 1
+            if (
+                not future.cancelled()
+                and future.exception() is None
+                and future.result()
+            ):
+                converted.append(action)
+
+        self._pending = running
+        self.converted += converted
+        return converted
+
+    def cancel(self) -> list[Convert]:
+        """Cancels conversions that have not started. Running ones are left to
+        finish and must still be collected until finished is True.
+
+        :returns: Actions for each image converted and not yet collected."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+        return self.collect_finished()
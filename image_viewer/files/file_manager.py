@@ -4,22 +4,36 @@ from enum import Enum
 from os import stat_result
 from time import ctime
 from tkinter.filedialog import askopenfilename
+from typing import TYPE_CHECKING
 
 from PIL.Image import Image
 
-from image_viewer.constants import VALID_FILE_TYPES, Movement
-from image_viewer.files.actions import Convert, Delete, FileAction, Rename
+from image_viewer._config import DEFAULT_UNDO_DEPTH
+from image_viewer.constants import VALID_FILE_TYPES, Movement, SortMode
+from image_viewer.files.actions import (
+    ActionGroup,
+    Convert,
+    Delete,
+    FileAction,
+    Rename,
+)
+from image_viewer.files.folder_walker import FolderScanResult, LazyFolderWalker
+from image_viewer.files.metadata_index import FileMetadataIndex
 from image_viewer.image.cache import ImageCache, ImageCacheEntry
 from image_viewer.image.file import ImageName, ImageNameList, ImageSearchResult
-from image_viewer.utils.convert import try_convert_image_and_save_new
+from image_viewer.utils.convert import can_convert, get_encoder_profile
 from image_viewer.utils.os import (
     ask_yes_no,
-    get_files_in_folder,
+    get_files_in_folder_with_suffixes,
     get_normalized_folder_name,
     trash_file,
 )
 from image_viewer.utils.PIL import get_mode_info
 
+if TYPE_CHECKING:
+    from image_viewer.files.background_convert import BackgroundConverter
+    from image_viewer.files.batch_convert import BatchConverter
+
 
 class _ShouldPreserveIndex(Enum):
     NO = 1
@@ -33,20 +47,40 @@ class ImageFileManager:
     __slots__ = (
         "_dialog_file_types",
         "_files",
+        "_folder_walker",
         "action_queue",
+        "convert_profiles",
         "current_image",
         "image_cache",
         "image_folder",
+        "metadata_index",
         "path_to_image",
+        "recursive",
+        "sort_mode",
     )
 
-    def __init__(self, first_image_path: str, image_cache: ImageCache) -> None:
-        """Load single file for display before we load the rest"""
+    def __init__(
+        self,
+        first_image_path: str,
+        image_cache: ImageCache,
+        convert_profiles: dict[str, dict[str, tuple[int, int]]] | None = None,
+        undo_depth: int = DEFAULT_UNDO_DEPTH,
+    ) -> None:
+        """Load single file for display before we load the rest
+
+        :param undo_depth: How many actions are kept to undo."""
         self.image_folder: str = get_normalized_folder_name(first_image_path)
         self.image_cache: ImageCache = image_cache
+        # Encoder speed and quality by format then profile name
+        self.convert_profiles: dict[str, dict[str, tuple[int, int]]] = (
+            convert_profiles or {}
+        )
+        self.recursive: bool = False
+        self._folder_walker: LazyFolderWalker | None = None
+        self.sort_mode: SortMode = SortMode.NAME
+        self.metadata_index = FileMetadataIndex(self.image_folder)
 
-        # TODO: Make maxlen configurable
-        self.action_queue: deque[FileAction] = deque(maxlen=8)
+        self.action_queue: deque[FileAction] = deque(maxlen=undo_depth)
         self._dialog_file_types: list[tuple[str, str]] = [
             ("", "*." + file_type) for file_type in VALID_FILE_TYPES
         ]
@@ -81,14 +115,22 @@ class ImageFileManager:
         if new_file_path == "":
             return False
 
+        self.move_to_path(new_file_path)
+        return True
+
+    def move_to_path(self, new_file_path: str) -> None:
+        """Points to an image, possibly in another folder. Images cached
+        from the current folder are kept if the image is in it.
+
+        :param new_file_path: Path to the image."""
         chosen_file: str = os.path.basename(new_file_path)
         new_dir: str = get_normalized_folder_name(new_file_path)
 
         if new_dir != self.image_folder:
             self.image_folder = new_dir
             self.refresh_files_with_known_starting_image(chosen_file)
-
-        return True
+        else:
+            self.update_files_with_known_starting_image(chosen_file)
 
     def get_path_to_image(self, image_name: str) -> str:
         """Given an image file name, returns the full path using the current folder.
@@ -97,6 +139,24 @@ class ImageFileManager:
 
         return os.path.normpath(f"{self.image_folder}/{image_name}")
 
+    def get_paths_to_nearby_images(self, distance: int) -> list[str]:
+        """Gets paths of images on both sides of the current image, closest first.
+
+        :param distance: How many images on each side to include.
+        :returns: The full paths, excluding the current image."""
+
+        image_count: int = len(self._files)
+        display_index: int = self._files.display_index
+        nearby_indexes: list[int] = []
+        for offset in range(1, min(distance, image_count // 2) + 1):
+            nearby_indexes.append((display_index + offset) % image_count)
+            nearby_indexes.append((display_index - offset) % image_count)
+
+        return [
+            self.get_path_to_image(self._files[index].name)
+            for index in dict.fromkeys(nearby_indexes)
+        ]
+
     def _update_after_move_or_edit(self) -> None:
         """Sets variables about current image.
         Should be called after adding/deleting an image"""
@@ -115,17 +175,147 @@ class ImageFileManager:
         if image_name_to_start_at is None:
             image_name_to_start_at = self.current_image.name
 
+        image_names: list[str] = self._get_image_names_in_folder()
+        self._index_images(image_names)
+
         self._files = ImageNameList(
-            [
-                image_name
-                for image_name_raw in get_files_in_folder(self.image_folder)
-                if (image_name := ImageName(image_name_raw)).suffix in VALID_FILE_TYPES
-            ]
+            [ImageName(image_name) for image_name in image_names],
+            self.metadata_index.get_sort_key(self.sort_mode),
         )
 
         self._files.sort_and_preserve_index(image_name_to_start_at)
         self._update_after_move_or_edit()
 
+        if self._folder_walker is not None:
+            self._folder_walker.scan_folders_near_index(self._files)
+
+    def _get_image_names_in_folder(self) -> list[str]:
+        """Finds images in the current folder. When browsing recursively,
+        only the root is scanned now and subfolders are scanned lazily.
+        Images already found in subfolders are kept while the folder is the same.
+
+        :returns: Names of images relative to the current folder."""
+
+        if self._folder_walker is not None and (
+            not self.recursive or self._folder_walker.root != self.image_folder
+        ):
+            self._folder_walker.stop()
+            self._folder_walker = None
+
+        if not self.recursive:
+            return get_files_in_folder_with_suffixes(
+                self.image_folder, VALID_FILE_TYPES
+            )
+
+        if self._folder_walker is None:
+            self._folder_walker = LazyFolderWalker(self.image_folder)
+            return self._folder_walker.scan_root()
+
+        # Only images in subfolders have a folder in their name
+        return self._folder_walker.scan_root() + [
+            image.name for image in self._files if "/" in image.name
+        ]
+
+    def toggle_recursive_browsing(self) -> None:
+        """Switches between browsing only the current folder and browsing all
+        folders under it as one sequence of images."""
+
+        self.recursive = not self.recursive
+        image_name_to_start_at: str = self.current_image.name
+
+        if not self.recursive:
+            # Continue in whichever subfolder the current image is in
+            self.image_folder = get_normalized_folder_name(self.path_to_image)
+            image_name_to_start_at = os.path.basename(image_name_to_start_at)
+
+        self.update_files_with_known_starting_image(image_name_to_start_at)
+
+    def cycle_sort_mode(self) -> None:
+        """Sorts images by the next sort mode, keeping index at the same image.
+        Only images missing from the index are stat'd since the rest were
+        stat'd when the folder was last updated."""
+
+        self.sort_mode = SortMode((self.sort_mode + 1) % len(SortMode))
+
+        self._index_images([image.name for image in self._files], only_unindexed=True)
+        if self.sort_mode == SortMode.DIMENSIONS:
+            # Otherwise images all have no dimensions and stay in the same order
+            self.metadata_index.collect_loaded_dimensions(wait=True)
+
+        self._files.sort_key = self.metadata_index.get_sort_key(self.sort_mode)
+        self._files.sort_and_preserve_index(self.current_image.name)
+        self._update_after_move_or_edit()
+
+        if self._folder_walker is not None:
+            self._folder_walker.scan_folders_near_index(self._files)
+
+    def _index_images(
+        self, image_names: list[str], only_unindexed: bool = False
+    ) -> None:
+        """Gathers metadata on images that the current sort mode needs.
+
+        :param image_names: Names of images relative to the current folder.
+        :param only_unindexed: If True, images already indexed are not stat'd."""
+
+        if self.sort_mode == SortMode.NAME:
+            return
+
+        if self.metadata_index.folder != self.image_folder:
+            self.metadata_index = FileMetadataIndex(self.image_folder)
+
+        if only_unindexed:
+            image_names = [
+                image_name
+                for image_name in image_names
+                if image_name not in self.metadata_index
+            ]
+
+        if image_names:
+            self.metadata_index.update_stats(image_names)
+        if self.sort_mode == SortMode.DIMENSIONS:
+            self.metadata_index.start_loading_dimensions()
+
+    def _sort_by_loaded_dimensions(self) -> None:
+        """Sorts again, keeping index at the same image, if dimensions
+        finished loading while sorted by them."""
+
+        if (
+            self.sort_mode == SortMode.DIMENSIONS
+            and self.metadata_index.collect_loaded_dimensions()
+        ):
+            self._files.sort_and_preserve_index(self.current_image.name)
+
+    def _add_images_from_finished_scans(self) -> None:
+        """Adds images found in subfolders by scans that completed since last
+        checked, keeping index at the same image."""
+
+        if self._folder_walker is None:
+            return
+
+        results: list[FolderScanResult] = self._folder_walker.collect_finished_scans()
+
+        if self._files.sort_key is not None:
+            image_names: list[str] = [
+                image_name for result in results for image_name in result.image_names
+            ]
+            if image_names:
+                self._index_images(image_names)
+                self._files.insert_by_sort_key_and_preserve_index(
+                    [*map(ImageName, image_names)], self._files.sort_key
+                )
+            return
+
+        result: FolderScanResult
+        for result in results:
+            if not result.image_names:
+                continue
+
+            # Names all start with the folder so they are contiguous once sorted
+            index: int = self._files.search(result.folder + "/").index
+            self._files.insert_sorted_and_preserve_index(
+                index, sorted(map(ImageName, result.image_names))
+            )
+
     def refresh_files_with_known_starting_image(
         self, image_name_to_start_at: str | None = None
     ) -> None:
@@ -196,9 +386,14 @@ class ImageFileManager:
 
     def move_index(self, amount: int) -> None:
         """Moves index with safe wrap around"""
+        self._add_images_from_finished_scans()
+        self._sort_by_loaded_dimensions()
         self._files.move_index(amount)
         self._update_after_move_or_edit()
 
+        if self._folder_walker is not None:
+            self._folder_walker.scan_folders_near_index(self._files)
+
     def trash_current_image(self) -> None:
         """Safely sends current image to trash."""
         try:
@@ -227,8 +422,18 @@ class ImageFileManager:
 
     def rename_or_convert_current_image(
         self, original_image: Image, new_name_or_path: str
-    ) -> None:
-        """Try to either rename or convert based on input"""
+    ) -> "BackgroundConverter | None":
+        """Try to either rename or convert based on input.
+        Input may end with :<profile> to pick encoder settings for a convert.
+        Renames are done immediately while converts are started in the background
+        and files are only updated once finish_convert is called.
+
+        :returns: The started conversion or None if renamed."""
+        profile_name: str
+        new_name_or_path, profile_name = self._split_encoder_profile(
+            new_name_or_path, self.current_image.suffix
+        )
+
         new_dir: str
         new_name: str
         new_dir, new_name = self._split_dir_and_name(new_name_or_path)
@@ -238,28 +443,30 @@ class ImageFileManager:
             new_name += "." + self.current_image.suffix
             new_image_name = ImageName(new_name)
 
+        speed: int
+        quality: int
+        speed, quality = get_encoder_profile(
+            new_image_name.suffix, profile_name, self.convert_profiles
+        )
+
         original_path: str = self.path_to_image
         new_path: str = self._construct_path_for_rename(new_dir, new_image_name.name)
 
+        if new_image_name.suffix != self.current_image.suffix and can_convert(
+            original_image, new_image_name.suffix
+        ):
+            from image_viewer.files.background_convert import BackgroundConverter
+
+            return BackgroundConverter(
+                original_path, new_path, new_image_name.suffix, quality, speed
+            )
+
         # if so, we will need to handle moving forward one index due to how future code
         # removes then adds the image back which will leave one image to the left of
-        # the original image after a rename/convert
+        # the original image after a rename
         was_at_last_index: bool = self._files.display_index == len(self._files) - 1
 
-        result: Rename
-        if (
-            new_image_name.suffix != self.current_image.suffix
-            and try_convert_image_and_save_new(
-                original_image, new_path, new_image_name.suffix
-            )
-        ):
-            result = self._ask_to_delete_old_image_after_convert(
-                original_path, new_path, new_image_name.suffix
-            )
-        else:
-            result = self._rename(original_path, new_path)
-
-        self.action_queue.append(result)
+        self.action_queue.append(self._rename(original_path, new_path))
 
         # Only add image if its still in the directory we are currently in
         if get_normalized_folder_name(new_path) == get_normalized_folder_name(
@@ -268,17 +475,157 @@ class ImageFileManager:
             preserve_index: _ShouldPreserveIndex = (
                 _ShouldPreserveIndex.YES
                 if was_at_last_index
-                else (
-                    _ShouldPreserveIndex.IF_INSERTED_AT_OR_BEFORE
-                    if self._should_preserve_index_on_rename(result)
-                    else _ShouldPreserveIndex.NO
-                )
+                else _ShouldPreserveIndex.NO
             )
 
-            self.add_new_image(new_name, preserve_index)
+            self.add_new_image(
+                self._get_name_in_current_folder(new_name), preserve_index
+            )
         else:
             self._update_after_move_or_edit()
 
+        return None
+
+    def finish_convert(self, converter: "BackgroundConverter") -> None:
+        """Records a finished conversion and adds the new image to files after
+        asking to delete the original. The converted image is displayed in place
+        of the original if it was deleted while displayed.
+
+        :param converter: A conversion that is no longer running."""
+        if not converter.converted:
+            return
+
+        original_path: str = converter.original_path
+        result: Convert = self._ask_to_delete_old_image_after_convert(
+            original_path, converter.new_path, converter.target_format
+        )
+        self.action_queue.append(result)
+
+        showing_original: bool = original_path == self.path_to_image
+        if result.original_file_deleted:
+            self._remove_image_and_preserve_index(original_path)
+
+        new_image_name: str = self._get_image_name_from_path(converter.new_path)
+        if get_normalized_folder_name(converter.new_path) == get_normalized_folder_name(
+            original_path
+        ):
+            self.add_new_image(
+                new_image_name, _ShouldPreserveIndex.IF_INSERTED_AT_OR_BEFORE
+            )
+            if result.original_file_deleted and showing_original:
+                self._files.set_index_to_image(new_image_name)
+
+        self._update_after_move_or_edit()
+
+    def _remove_image_and_preserve_index(self, path: str) -> None:
+        """Removes an image from files and cache while keeping the index at the
+        same image, or the next if the image removed was displayed.
+
+        :param path: Path to an image that may be in files."""
+        if path == self.path_to_image:
+            self._files.remove_current_image()
+        else:
+            search_result: ImageSearchResult = self._files.search(
+                self._get_image_name_from_path(path)
+            )
+            if not search_result.found:
+                return
+
+            self._files.pop(search_result.index)
+            if search_result.index < self._files.display_index:
+                self._files.move_index(-1)
+
+        self.image_cache.pop_safe(path)
+
+    def start_batch_convert(self, user_input: str) -> "BatchConverter":
+        """Starts converting every image with the current image's type to a new
+        format. Originals are kept and images whose new path exists are skipped.
+
+        :param user_input: *.<format> with an optional :<profile> for encoder
+        settings, like *.webp:fast.
+        :returns: The running conversions.
+        :raises ValueError: If format or profile is invalid or nothing to convert."""
+        target_format: str
+        profile_name: str
+        source_suffix: str = self.current_image.suffix
+        target_format, profile_name = self._split_encoder_profile(
+            user_input, source_suffix
+        )
+        target_format = target_format.removeprefix("*.").lower()
+
+        if (
+            target_format not in VALID_FILE_TYPES
+            or target_format[0] == source_suffix[0]
+        ):
+            raise ValueError
+
+        speed: int
+        quality: int
+        speed, quality = get_encoder_profile(
+            target_format, profile_name, self.convert_profiles
+        )
+
+        paths: list[tuple[str, str]] = []
+        for image in self._files:
+            if image.suffix != source_suffix:
+                continue
+            original_path: str = self.get_path_to_image(image.name)
+            new_path: str = f"{os.path.splitext(original_path)[0]}.{target_format}"
+            if not os.path.exists(new_path):
+                paths.append((original_path, new_path))
+
+        if not paths:
+            raise ValueError
+
+        from image_viewer.files.batch_convert import BatchConverter
+
+        return BatchConverter(paths, target_format, speed, quality)
+
+    def add_batch_converted_images(self, actions: list[Convert]) -> None:
+        """Adds images created by a batch conversion to the files list
+        while keeping the current image displayed.
+
+        :param actions: Conversions that completed."""
+        for action in actions:
+            self.add_new_image(
+                self._get_image_name_from_path(action.new_path),
+                _ShouldPreserveIndex.IF_INSERTED_AT_OR_BEFORE,
+            )
+
+    def finish_batch_convert(self, batch_converter: "BatchConverter") -> None:
+        """Records a finished or cancelled batch conversion as one undoable action.
+
+        :param batch_converter: A batch conversion with all results collected."""
+        if batch_converter.converted:
+            self.action_queue.append(
+                ActionGroup(
+                    f"converting to {batch_converter.target_format}",
+                    list(batch_converter.converted),
+                )
+            )
+
+    @staticmethod
+    def _split_encoder_profile(user_input: str, current_suffix: str) -> tuple[str, str]:
+        """Splits an optional :<profile> off the end of input when the rest
+        converts the image, so renames like notes:draft are kept whole.
+
+        :param user_input: A new name or path that may end with a profile.
+        :param current_suffix: Suffix of the image being renamed or converted.
+        :returns: Input without the profile and the profile name or ""."""
+        name: str
+        profile_name: str
+        name, _, profile_name = user_input.rpartition(":")
+
+        # Profiles are single words, so drive letters and the like are kept
+        if name == "" or not profile_name.isidentifier():
+            return user_input, ""
+
+        new_suffix: str = ImageName(name).suffix
+        if new_suffix not in VALID_FILE_TYPES or new_suffix == current_suffix:
+            return user_input, ""
+
+        return name, profile_name
+
     def _split_dir_and_name(self, new_name_or_path: str) -> tuple[str, str]:
         """Returns tuple with path and file name split up"""
         new_name: str = os.path.basename(new_name_or_path) or self.current_image.name
@@ -298,12 +645,20 @@ class ImageFileManager:
         new_full_path: str
         if will_move_dirs:
             if not os.path.isabs(new_dir):
-                new_dir = os.path.normpath(os.path.join(self.image_folder, new_dir))
+                new_dir = os.path.normpath(
+                    os.path.join(
+                        self.image_folder,
+                        os.path.dirname(self.current_image.name),
+                        new_dir,
+                    )
+                )
             if not os.path.exists(new_dir):
                 raise OSError
             new_full_path = os.path.join(new_dir, new_name)
         else:
-            new_full_path = self.get_path_to_image(new_name)
+            new_full_path = self.get_path_to_image(
+                self._get_name_in_current_folder(new_name)
+            )
 
         if os.path.exists(new_full_path):
             raise FileExistsError
@@ -315,8 +670,33 @@ class ImageFileManager:
 
         return new_full_path
 
+    def _get_name_in_current_folder(self, file_name: str) -> str:
+        """Given a file name, returns the image name it would have if it were in
+        the same folder as the current image. Only differs from the file name
+        when browsing recursively and the current image is in a subfolder.
+
+        :param file_name: A file name without any folder.
+        :returns: The image name relative to the current folder."""
+
+        folder: str = os.path.dirname(self.current_image.name)
+        return f"{folder}/{file_name}" if folder else file_name
+
+    def _get_image_name_from_path(self, path: str) -> str:
+        """Given a path, returns the image name it would have in the files list.
+
+        :param path: A path to an image or "".
+        :returns: The image name or "" if path was ""."""
+
+        if not self.recursive or path == "":
+            return os.path.basename(path)
+
+        return os.path.relpath(path, self.image_folder or os.curdir).replace(
+            os.sep, "/"
+        )
+
+    @staticmethod
     def _ask_to_delete_old_image_after_convert(
-        self, original_path: str, new_full_path: str, new_format: str
+        original_path: str, new_full_path: str, new_format: str
     ) -> Convert:
         """Asks user to delete old file and returns Convert result"""
         delete: bool = ask_yes_no(
@@ -325,9 +705,9 @@ class ImageFileManager:
 
         if delete:
             try:
-                self.trash_current_image()
-            except IndexError:
-                pass  # even if no images left, a new one will be added after this
+                trash_file(original_path)
+            except OSError:
+                delete = False
 
         return Convert(original_path, new_full_path, delete)
 
@@ -338,15 +718,6 @@ class ImageFileManager:
         self.image_cache.update_key(self.path_to_image, new_path)
         return Rename(original_path, new_path)
 
-    @staticmethod
-    def _should_preserve_index_on_rename(result: Rename) -> bool:
-        """Index must be preserved when a new image was added due to a conversion
-        occurring.
-
-        :param result: A rename result which may have resulted in a conversion.
-        :returns: If index must be preserved."""
-        return isinstance(result, Convert) and not result.original_file_deleted
-
     def add_new_image(
         self,
         new_name: str,
@@ -358,6 +729,7 @@ class ImageFileManager:
         index: where the image is inserted if provided"""
         image_name: ImageName = ImageName(new_name)
         if index < 0:
+            self._index_images([new_name])
             index = self._files.search(image_name.name).index
 
         self._files.insert(index, image_name)
@@ -379,15 +751,62 @@ class ImageFileManager:
         if not ask_yes_no("Undo Action", self.action_queue[-1].get_undo_message()):
             return False
 
-        path_restored: str
-        path_removed: str
+        action: FileAction = self.action_queue.pop()
         try:
-            path_restored, path_removed = self.action_queue.pop().undo()
+            undo_results: list[tuple[str, str]] = action.undo_all()
         except OSError:
             return False  # TODO: error popup?
 
-        image_added: str = os.path.basename(path_restored)
-        image_removed: str = os.path.basename(path_removed)
+        if isinstance(action, ActionGroup):
+            if action.actions:
+                # Some could not be undone, keep them to try again
+                self.action_queue.append(action)
+            self._update_after_group_undo(undo_results)
+            return True
+
+        for path_restored, path_removed in undo_results:
+            self._update_after_undo(path_restored, path_removed)
+
+        return True
+
+    def _update_after_group_undo(self, undo_results: list[tuple[str, str]]) -> None:
+        """Updates the files list once after many actions were undone together,
+        keeping index at the current image if it still exists.
+
+        :param undo_results: Path restored and path removed of each action."""
+        images_removed: set[str] = {
+            self._get_image_name_from_path(path_removed)
+            for _, path_removed in undo_results
+        }
+        kept_images: list[ImageName] = [
+            image for image in self._files if image.name not in images_removed
+        ]
+        kept_names: set[str] = {image.name for image in kept_images}
+
+        images_added: list[str] = []
+        for path_restored, _ in undo_results:
+            image_added: str = self._get_image_name_from_path(path_restored)
+            if image_added != "" and image_added not in kept_names:
+                images_added.append(image_added)
+        self._index_images(images_added)
+
+        for image_name in images_removed:
+            self.image_cache.pop_safe(self.get_path_to_image(image_name))
+
+        self._files[:] = kept_images
+        self._files.extend(map(ImageName, images_added))
+        self._files.sort_and_preserve_index(self.current_image.name)
+        # Index is past the end if the current image was removed and sorted last
+        self._files.move_index(0)
+        self._update_after_move_or_edit()
+
+    def _update_after_undo(self, path_restored: str, path_removed: str) -> None:
+        """Updates the files list after an action was undone.
+
+        :param path_restored: Path of an image that exists again or "".
+        :param path_removed: Path of an image that no longer exists or ""."""
+        image_added: str = self._get_image_name_from_path(path_restored)
+        image_removed: str = self._get_image_name_from_path(path_removed)
 
         if image_removed != "":
             search_result: ImageSearchResult = self._files.search(image_removed)
@@ -404,8 +823,6 @@ class ImageFileManager:
         else:
             self._update_after_move_or_edit()
 
-        return True
-
     def current_image_cache_still_fresh(self) -> bool:
         """Checks if cache for currently displayed image is still up to date.
 
@@ -0,0 +1,167 @@
+"""Lazily finds images in subfolders for recursive browsing."""
+
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from image_viewer.constants import VALID_FILE_TYPES
+from image_viewer.image.file import ImageNameList
+from image_viewer.utils.os import (
+    get_files_in_folder_with_suffixes,
+    get_folders_in_folder,
+)
+
+# How close, in images, navigation must get to a folder before it is scanned
+SCAN_AHEAD_DISTANCE: int = 32
+MAX_SCAN_WORKERS: int = 8
+
+
+class FolderScanResult:
+    """Images and subfolders found in a single folder.
+    All names are relative to the walker's root folder."""
+
+    __slots__ = ("folder", "image_names", "subfolders")
+
+    def __init__(
+        self, folder: str, image_names: list[str], subfolders: list[str]
+    ) -> None:
+        self.folder: str = folder
+        self.image_names: list[str] = image_names
+        self.subfolders: list[str] = subfolders
+
+
+class LazyFolderWalker:
+    """Walks all folders under a root. Subfolders are scanned in parallel on
+    worker threads once navigation gets close to where their images would be."""
+
+    __slots__ = ("_executor", "_known_folders", "_pending_folders", "_scans", "root")
+
+    def __init__(self, root: str) -> None:
+        self.root: str = root
+        self._executor: ThreadPoolExecutor | None = None
+        # Relative paths of every subfolder found, scanned or not
+        self._known_folders: set[str] = set()
+        # Relative paths of folders that are known, but not yet scanned
+        self._pending_folders: list[str] = []
+        self._scans: list[Future[FolderScanResult]] = []
+
+    @property
+    def finished(self) -> bool:
+        """True when every folder under root has been scanned and collected."""
+        return not self._pending_folders and not self._scans
+
+    def scan_root(self) -> list[str]:
+        """Scans only the root folder, queueing subfolders not found before
+        for later. Can be called again to find changes in the root folder.
+
+        :returns: Names of images in the root folder."""
+        result: FolderScanResult = _scan_folder(self.root, "")
+        self._queue_new_folders(result.subfolders)
+        return result.image_names
+
+    def scan_folders_near_index(self, files: ImageNameList) -> None:
+        """Starts scanning any known folders whose images would be inserted close
+        to the currently displayed image. When not sorted by name, images from
+        any folder could be close, so only enough folders to keep each worker
+        busy are scanned each time this is called.
+
+        :param files: The sorted images found so far."""
+        if not self._pending_folders:
+            return
+
+        sorted_by_name: bool = files.sort_key is None
+        free_workers: int = MAX_SCAN_WORKERS - len(self._scans)
+        still_pending: list[str] = []
+
+        for folder in self._pending_folders:
+            if (
+                _is_close_to_display_index(files, folder)
+                if sorted_by_name
+                else free_workers > 0
+            ):
+                self._scans.append(
+                    self._get_executor().submit(_scan_folder, self.root, folder)
+                )
+                free_workers -= 1
+            else:
+                still_pending.append(folder)
+
+        self._pending_folders = still_pending
+
+    def collect_finished_scans(self) -> list[FolderScanResult]:
+        """Gets results of scans that completed and queues their subfolders.
+
+        :returns: Results for each completed scan."""
+        finished: list[FolderScanResult] = []
+        running: list[Future[FolderScanResult]] = []
+
+        for scan in self._scans:
+            if scan.done():
+                result: FolderScanResult = scan.result()
+                self._queue_new_folders(result.subfolders)
+                finished.append(result)
+            else:
+                running.append(scan)
+
+        self._scans = running
+        return finished
+
+    def _queue_new_folders(self, folders: list[str]) -> None:
+        """Queues folders for scanning unless they were found before.
+
+        :param folders: Paths of folders relative to root."""
+        for folder in folders:
+            if folder not in self._known_folders:
+                self._known_folders.add(folder)
+                self._pending_folders.append(folder)
+
+    def stop(self) -> None:
+        """Cancels all scans that have not started and forgets pending folders."""
+        self._pending_folders = []
+        self._scans = []
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Creates worker threads on first use so roots
+        without subfolders never start them.
+
+        :returns: The executor scans are submitted to."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                min(MAX_SCAN_WORKERS, os.cpu_count() or 1), "folder_walker"
+            )
+
+        return self._executor
+
+
+def _is_close_to_display_index(files: ImageNameList, folder: str) -> bool:
+    """Checks if a folder's images would be inserted close to the current image
+    when sorted by name.
+
+    :param files: The sorted images found so far.
+    :param folder: Path of a folder relative to root.
+    :returns: True if within SCAN_AHEAD_DISTANCE of the current image."""
+    distance: int = abs(files.search(folder + "/").index - files.display_index)
+    # Account for wrap around when navigating past either end
+    return min(distance, len(files) - distance) <= SCAN_AHEAD_DISTANCE
+
+
+def _scan_folder(root: str, folder: str) -> FolderScanResult:
+    """Lists images and non-hidden subfolders in a folder.
+
+    :param root: The root folder being walked.
+    :param folder: Path of the folder to scan relative to root, or "" for root.
+    :returns: Images and subfolders with names relative to root."""
+    prefix: str = f"{folder}/" if folder else ""
+    path: str = os.path.join(root, folder) if folder else root or os.curdir
+
+    image_names: list[str] = [
+        prefix + name
+        for name in get_files_in_folder_with_suffixes(path, VALID_FILE_TYPES)
+    ]
+    subfolders: list[str] = [
+        prefix + name for name in get_folders_in_folder(path) if name[0] != "."
+    ]
+
+    return FolderScanResult(folder, image_names, subfolders)
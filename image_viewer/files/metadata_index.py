@@ -0,0 +1,185 @@
+"""Index of file metadata used to sort images by something other than name."""
+
+import os
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from PIL.Image import open as open_image
+
+from image_viewer.constants import SortMode
+from image_viewer.image._read import probe_image
+from image_viewer.image.file import ImageName
+from image_viewer.utils.os import get_file_stats_in_folder
+
+MAX_DIMENSION_WORKERS: int = 8
+
+
+class FileMetadata:
+    """Metadata on a single file. Dimensions are None until read."""
+
+    __slots__ = ("dimensions", "modified_ns", "size")
+
+    def __init__(self, modified_ns: int, size: int) -> None:
+        self.modified_ns: int = modified_ns
+        self.size: int = size
+        self.dimensions: tuple[int, int] | None = None
+
+    @property
+    def pixel_count(self) -> int:
+        return 0 if self.dimensions is None else self.dimensions[0] * self.dimensions[1]
+
+
+class FileMetadataIndex(dict[str, FileMetadata]):
+    """Maps image names to their metadata for a single folder.
+    Dimensions are kept across updates as long as a file has not changed."""
+
+    __slots__ = ("_dimension_executor", "_dimension_loads", "folder")
+
+    def __init__(self, folder: str) -> None:
+        super().__init__()
+        self.folder: str = folder
+        self._dimension_executor: ThreadPoolExecutor | None = None
+        # Metadata being read and the future giving their dimensions in order
+        self._dimension_loads: list[
+            tuple[list[FileMetadata], Future[list[tuple[int, int]]]]
+        ] = []
+
+    def update_stats(self, image_names: list[str]) -> None:
+        """Stats all provided images in one call and stores the results.
+
+        :param image_names: Names of images relative to folder."""
+
+        stat: tuple[int, int] | None
+        for image_name, stat in zip(
+            image_names,
+            get_file_stats_in_folder(self.folder or os.curdir, image_names),
+            strict=True,
+        ):
+            if stat is None:
+                self.pop(image_name, None)
+                continue
+
+            modified_ns, size = stat
+            metadata: FileMetadata | None = self.get(image_name)
+            if (
+                metadata is None
+                or metadata.modified_ns != modified_ns
+                or metadata.size != size
+            ):
+                self[image_name] = FileMetadata(modified_ns, size)
+
+    def start_loading_dimensions(self) -> None:
+        """Starts reading dimensions from the headers of any images missing them
+        on a worker thread. Images are not decoded. Dimensions are stored once
+        collect_loaded_dimensions is called after they are read."""
+
+        loading: set[int] = {
+            id(metadata)
+            for metadata_list, _ in self._dimension_loads
+            for metadata in metadata_list
+        }
+        missing: list[tuple[str, FileMetadata]] = [
+            (image_name, metadata)
+            for image_name, metadata in self.items()
+            if metadata.dimensions is None and id(metadata) not in loading
+        ]
+        if not missing:
+            return
+
+        if self._dimension_executor is None:
+            self._dimension_executor = ThreadPoolExecutor(1, "metadata_index")
+
+        paths: list[str] = [
+            os.path.join(self.folder, image_name) for image_name, _ in missing
+        ]
+        self._dimension_loads.append(
+            (
+                [metadata for _, metadata in missing],
+                self._dimension_executor.submit(_read_all_dimensions, paths),
+            )
+        )
+
+    def collect_loaded_dimensions(self, wait: bool = False) -> bool:
+        """Stores dimensions read since last collected. Files that changed while
+        being read are read again by the next start_loading_dimensions.
+
+        :param wait: If True, waits for all started reads to finish.
+        :returns: True if any dimensions were stored."""
+
+        loaded: bool = False
+        running: list[tuple[list[FileMetadata], Future[list[tuple[int, int]]]]] = []
+
+        for metadata_list, load in self._dimension_loads:
+            if not wait and not load.done():
+                running.append((metadata_list, load))
+                continue
+
+            # Metadata replaced by update_stats since is no longer indexed
+            for metadata, dimensions in zip(metadata_list, load.result(), strict=True):
+                metadata.dimensions = dimensions
+            loaded = True
+
+        self._dimension_loads = running
+        return loaded
+
+    def get_sort_key(
+        self, sort_mode: SortMode
+    ) -> Callable[[ImageName], tuple[int, str]] | None:
+        """Returns a function that gives an image's sort key for a sort mode.
+        Images with equal metadata are ordered by name so sorting is the same
+        regardless of the order the OS lists files in.
+
+        :param sort_mode: The order images should be sorted in.
+        :returns: The sort key function or None if sorting by name."""
+
+        empty_metadata = FileMetadata(0, 0)
+
+        match sort_mode:
+            case SortMode.MODIFIED_TIME:
+                return lambda image: (
+                    self.get(image.name, empty_metadata).modified_ns,
+                    image.name,
+                )
+            case SortMode.SIZE:
+                return lambda image: (
+                    self.get(image.name, empty_metadata).size,
+                    image.name,
+                )
+            case SortMode.DIMENSIONS:
+                return lambda image: (
+                    self.get(image.name, empty_metadata).pixel_count,
+                    image.name,
+                )
+            case _:
+                return None
+
+
+def _read_all_dimensions(paths: list[str]) -> list[tuple[int, int]]:
+    """Reads dimensions of many images in parallel.
+
+    :param paths: Paths to images.
+    :returns: Width and height of each image, in the same order."""
+
+    with ThreadPoolExecutor(
+        min(MAX_DIMENSION_WORKERS, os.cpu_count() or 1)
+    ) as executor:
+        return list(executor.map(_read_dimensions, paths))
+
+
+def _read_dimensions(path: str) -> tuple[int, int]:
+    """Reads an image's dimensions from its header.
+
+    :param path: Path to an image.
+    :returns: The image's width and height or 0, 0 on failure."""
+
+    try:
+        probe: tuple[str, int, int, int] | None = probe_image(path)
+        if probe is not None:
+            return probe[1], probe[2]
+
+        # Fallback for headers too unusual to probe, PIL only reads
+        # the header until pixel data is accessed
+        with open_image(path) as image:
+            return image.size
+    except (OSError, ValueError, UnicodeError):
+        return (0, 0)
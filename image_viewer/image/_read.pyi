@@ -1,5 +1,7 @@
 """C extensions that interact with image files."""
 
+from _typeshed import FileDescriptorLike
+
 PNG: str = "PNG"
 JPEG: str = "JPEG"
 GIF: str = "GIF"
@@ -31,7 +33,8 @@ def read_image_into_buffer(image_path: str, /) -> CRawImageView | None:
     """Reads an image file path and stores it in a buffer.
 
     :param image_path: A path to a file containing an image
-    :returns: A buffer containing the image data or None on failure"""
+    :returns: A buffer containing the image data or None on failure
+    or if the file's signature is not a supported format"""
 
 def decode_jpeg_downscaled(
     image_view: CRawImageView, scale_factor: int, /
@@ -41,3 +44,27 @@ def decode_jpeg_downscaled(
     :param image_view: View to a buffer
     :param scale_factor: Factor to downscale by
     :returns: A new view to a buffer containing the decoded and downscaled jpeg"""
+
+def encode_as_base64(image_view: CRawImageView, /) -> str:
+    """Encodes an image buffer as base64 directly into a new string,
+    without a trailing newline.
+
+    :param image_view: View to a buffer
+    :returns: The buffer encoded as base64"""
+
+def write_as_base64(image_view: CRawImageView, fd: FileDescriptorLike, /) -> None:
+    """Encodes an image buffer as base64 in small chunks, writing each to
+    a file descriptor so the whole encoding is never held in memory.
+    Releases the GIL while encoding and writing.
+
+    :param image_view: View to a buffer
+    :param fd: File descriptor, or object with fileno, of a file or pipe
+    :raises OSError: If writing fails"""
+
+def probe_image(image_path: str, /) -> tuple[str, int, int, int] | None:
+    """Reads only the header of an image to find its format, width, height,
+    and frame count. The frame count is 0 when the image may be animated,
+    but the count would require reading the whole file.
+
+    :param image_path: A path to a file containing an image
+    :returns: Format, width, height, and frame count or None on failure"""
@@ -0,0 +1,23 @@
+"""C extensions that resize image data."""
+
+def resize_premultiplied(
+    data: bytes,
+    bands: int,
+    width: int,
+    height: int,
+    new_width: int,
+    new_height: int,
+    resample: int,
+    /,
+) -> bytes:
+    """Resizes raw image data with alpha as its last band, premultiplying
+    and unpremultiplying alpha as part of the resize.
+
+    :param data: Raw pixel data, such as from Image.tobytes
+    :param bands: Number of bands, 2 for LA or 4 for RGBA
+    :param width: Width of data
+    :param height: Height of data
+    :param new_width: Width to resize to
+    :param new_height: Height to resize to
+    :param resample: A PIL Resampling filter other than NEAREST
+    :returns: Raw pixel data of the resized image"""
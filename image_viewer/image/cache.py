@@ -6,6 +6,59 @@ from os import stat
 from PIL.Image import Image
 
 from image_viewer.utils.os import get_byte_display
+from image_viewer.utils.PIL import get_mode_info
+
+# Zoom levels kept with an image's cache entry after moving to another image
+PERSISTED_ZOOM_LEVELS: int = 2
+MAX_PERSISTED_ZOOM_BYTES: int = 128 * 1024 * 1024
+
+
+class ZoomLevelCache(dict[int, Image]):
+    """Zoom levels of a single image, keyed by zoom level, bounded by bytes.
+    Level 0 is the image fit to screen and is never evicted."""
+
+    __slots__ = ("byte_size", "max_bytes")
+
+    def __init__(self, max_bytes: int) -> None:
+        super().__init__()
+        self.max_bytes: int = max_bytes
+        self.byte_size: int = 0
+
+    def add(self, zoom_level: int, image: Image, current_zoom_level: int) -> None:
+        """Caches a zoom level, then evicts levels farthest from the current
+        zoom level until within max_bytes.
+
+        :param zoom_level: The zoom level of image.
+        :param image: The image resized for zoom_level.
+        :param current_zoom_level: The zoom level being displayed."""
+
+        self.pop_level(zoom_level)
+        super().__setitem__(zoom_level, image)
+        self.byte_size += _get_image_byte_size(image)
+
+        evictable_levels: list[int] = sorted(
+            (level for level in self if level not in (0, zoom_level)),
+            key=lambda level: abs(level - current_zoom_level),
+        )
+        while self.byte_size > self.max_bytes and evictable_levels:
+            self.pop_level(evictable_levels.pop())
+
+    def pop_level(self, zoom_level: int) -> None:
+        """Removes a zoom level if cached.
+
+        :param zoom_level: The zoom level to remove."""
+
+        image: Image | None = self.pop(zoom_level, None)
+        if image is not None:
+            self.byte_size -= _get_image_byte_size(image)
+
+    def trim(self, max_levels: int) -> None:
+        """Keeps only level 0 and the max_levels zoom levels closest to it.
+
+        :param max_levels: How many zoom levels, other than 0, to keep."""
+
+        for zoom_level in sorted(self)[max_levels + 1 :]:
+            self.pop_level(zoom_level)
 
 
 class ImageCacheEntry:
@@ -19,6 +72,7 @@ class ImageCacheEntry:
         "image",
         "mode",
         "width",
+        "zoom_levels",
     )
 
     def __init__(
@@ -37,6 +91,7 @@ class ImageCacheEntry:
         # Store original mode since resizing some images converts to RGB
         self.mode: str = mode
         self.format: str = file_format
+        self.zoom_levels: ZoomLevelCache | None = None
 
     @property
     def byte_size(self) -> int:
@@ -117,6 +172,33 @@ class ImageCache(OrderedDict[str, ImageCacheEntry]):
             if new_mode is not None:
                 self[image_path].mode = new_mode
 
+    def persist_zoom_levels(self, image_path: str, zoom_levels: ZoomLevelCache) -> None:
+        """Keeps the first few zoom levels of an image with its entry so revisiting
+        it does not need to resize again. Zoom levels of the least recently used
+        entries are dropped to stay within MAX_PERSISTED_ZOOM_BYTES.
+
+        :param image_path: The key of the image that was zoomed.
+        :param zoom_levels: The image's zoom levels."""
+
+        cache_entry: ImageCacheEntry | None = self.get(image_path)
+        if cache_entry is None:
+            return
+
+        zoom_levels.trim(PERSISTED_ZOOM_LEVELS)
+        cache_entry.zoom_levels = zoom_levels if len(zoom_levels) > 1 else None
+
+        persisted_bytes: int = sum(
+            entry.zoom_levels.byte_size
+            for entry in self.values()
+            if entry.zoom_levels is not None
+        )
+        for entry in self.values():
+            if persisted_bytes <= MAX_PERSISTED_ZOOM_BYTES:
+                break
+            if entry.zoom_levels is not None:
+                persisted_bytes -= entry.zoom_levels.byte_size
+                entry.zoom_levels = None
+
     def __setitem__(self, key: str, value: ImageCacheEntry) -> None:
         """Adds check for size of the cache and purges
         least recently used (LRU) if over the limit."""
@@ -128,3 +210,12 @@ class ImageCache(OrderedDict[str, ImageCacheEntry]):
             self.popitem(last=False)
 
         super().__setitem__(key, value)
+
+
+def _get_image_byte_size(image: Image) -> int:
+    """Approximates memory used by an image's pixels.
+
+    :param image: A PIL Image.
+    :returns: Size of the image's pixel data in bytes."""
+
+    return image.width * image.height * get_mode_info(image.mode)[1] >> 3
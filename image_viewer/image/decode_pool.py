@@ -0,0 +1,266 @@
+"""Decodes images in worker processes so the pure Python parts of PIL plugins
+can run on more than one core. Pixels are handed back through shared memory."""
+
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.shared_memory import SharedMemory
+from threading import get_native_id
+from time import perf_counter_ns
+from typing import Any
+
+from PIL.Image import Image, frombuffer
+
+from image_viewer.image.cache import ImageCache, ImageCacheEntry
+from image_viewer.image.image_io import ImageIO, ReadImageResponse
+from image_viewer.image.resizer import ImageResizer
+from image_viewer.utils.os import get_process_context
+from image_viewer.utils.PIL import init_PIL_in_worker
+from image_viewer.utils.timing import span_tracer, traced
+
+# How many images on each side of the current one to decode ahead of time
+PREFETCH_DISTANCE: int = 1
+
+
+class DecodedImage:
+    """An image fit to screen by a worker. Its pixels, as returned by tobytes,
+    are in the shared memory block named shared_memory_name."""
+
+    __slots__ = (
+        "byte_size",
+        "format",
+        "info",
+        "mode",
+        "original_mode",
+        "original_size",
+        "palette",
+        "shared_memory_name",
+        "size",
+        "worker_span",
+    )
+
+    def __init__(
+        self,
+        shared_memory_name: str,
+        image: Image,
+        read_image_response: ReadImageResponse,
+        start_ns: int,
+    ) -> None:
+        self.shared_memory_name: str = shared_memory_name
+        self.mode: str = image.mode
+        self.size: tuple[int, int] = image.size
+        self.info: dict[str | tuple[int, int], Any] = image.info
+        self.palette: tuple[str, bytes] | None = (
+            (image.palette.mode, image.palette.tobytes())
+            if image.palette is not None
+            else None
+        )
+
+        original_image: Image = read_image_response.image
+        self.original_mode: str = original_image.mode
+        self.original_size: tuple[int, int] = original_image.size
+        self.byte_size: int = read_image_response.image_view.view.nbytes
+        self.format: str = read_image_response.image_view.format
+        # Start and end perf_counter_ns, process id, and thread id of the decode
+        self.worker_span: tuple[int, int, int, int] = (
+            start_ns,
+            perf_counter_ns(),
+            os.getpid(),
+            get_native_id(),
+        )
+
+    def to_image(self) -> Image:
+        """Creates an image backed by the shared memory block. Modes PIL can map,
+        like L, P, and RGBA, are not copied. The block is freed with the image.
+
+        :returns: The decoded image."""
+
+        image: Image = frombuffer(
+            self.mode,
+            self.size,
+            SharedPixels(self.shared_memory_name),  # type: ignore[arg-type]
+            "raw",
+            self.mode,
+            0,
+            1,
+        )
+        image.info = self.info
+        if self.palette is not None:
+            palette_mode, palette_data = self.palette
+            image.putpalette(palette_data, palette_mode)
+
+        return image
+
+
+class SharedPixels:
+    """Exposes a shared memory block through the buffer protocol so PIL can
+    map it. The block is closed once PIL releases its buffer."""
+
+    __slots__ = ("_shared_memory",)
+
+    def __init__(self, name: str) -> None:
+        self._shared_memory = SharedMemory(name)
+        # Mapping stays valid after unlinking, so nothing leaks if this process dies
+        self._shared_memory.unlink()
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return self._shared_memory.buf  # type: ignore[return-value]
+
+    def __release_buffer__(self, view: memoryview) -> None:
+        pass
+
+    def __del__(self) -> None:
+        self._shared_memory.close()
+
+
+class DecodePool:
+    """Reads and fits images to screen in worker processes ahead of time,
+    caching them so they display without decoding on the UI thread.
+    Only supported where shared memory outlives its creator, so not Windows."""
+
+    __slots__ = (
+        "_executor",
+        "_pending",
+        "image_cache",
+        "screen_height",
+        "screen_width",
+    )
+
+    def __init__(
+        self,
+        processes: int,
+        screen_width: int,
+        screen_height: int,
+        image_cache: ImageCache,
+    ) -> None:
+        self.screen_width: int = screen_width
+        self.screen_height: int = screen_height
+        self.image_cache: ImageCache = image_cache
+        self._executor: ProcessPoolExecutor | None = ProcessPoolExecutor(
+            processes, get_process_context(), init_PIL_in_worker
+        )
+        self._pending: dict[str, Future[DecodedImage | None]] = {}
+
+    @traced
+    def prefetch(self, image_paths: list[str]) -> None:
+        """Starts decoding images that are not cached or already decoding.
+        Decodes that have not started and are not in image_paths are cancelled.
+
+        :param image_paths: Paths of images likely to be opened soon."""
+
+        if self._executor is None:
+            return
+
+        for image_path, future in list(self._pending.items()):
+            if image_path not in image_paths and future.cancel():
+                del self._pending[image_path]
+
+        try:
+            for image_path in image_paths:
+                if (
+                    image_path not in self._pending
+                    and image_path not in self.image_cache
+                ):
+                    self._pending[image_path] = self._executor.submit(
+                        _decode_into_shared_memory,
+                        image_path,
+                        self.screen_width,
+                        self.screen_height,
+                    )
+        except BrokenProcessPool:
+            # A worker crashed, likely in a decoder, fall back to decoding on threads
+            self.stop()
+
+    @traced
+    def collect_finished(self, wait_for_path: str = "") -> None:
+        """Caches images that finished decoding.
+
+        :param wait_for_path: An image about to be opened. If its decode is
+        running, waits for it. If it has not started, it is cancelled."""
+
+        waiting: Future[DecodedImage | None] | None = self._pending.get(wait_for_path)
+        if waiting is not None and not waiting.cancel():
+            wait((waiting,))
+
+        for image_path, future in list(self._pending.items()):
+            if not future.done():
+                continue
+
+            del self._pending[image_path]
+            if future.cancelled() or future.exception() is not None:
+                continue
+
+            decoded: DecodedImage | None = future.result()
+            if decoded is not None:
+                if span_tracer.enabled:
+                    span_tracer.name_process(decoded.worker_span[2], "Decode Worker")
+                    span_tracer.add_span(
+                        "decode_into_shared_memory", *decoded.worker_span, image_path
+                    )
+                self.image_cache[image_path] = ImageCacheEntry(
+                    decoded.to_image(),
+                    decoded.original_size,
+                    decoded.byte_size,
+                    decoded.original_mode,
+                    decoded.format,
+                )
+
+    def stop(self) -> None:
+        """Stops all workers, cancelling decodes that have not started.
+        Shared memory of decodes that finish after this is freed as they finish."""
+        if self._executor is None:
+            return
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+
+        for future in self._pending.values():
+            # Runs now if already done
+            future.add_done_callback(_unlink_unwanted_decode)
+        self._pending = {}
+
+
+def _unlink_unwanted_decode(future: Future[DecodedImage | None]) -> None:
+    """Frees the shared memory block of a decode whose result won't be used.
+
+    :param future: A finished decode."""
+    if future.cancelled() or future.exception() is not None:
+        return
+
+    decoded: DecodedImage | None = future.result()
+    if decoded is not None:
+        SharedMemory(decoded.shared_memory_name).unlink()
+
+
+def _decode_into_shared_memory(
+    image_path: str, screen_width: int, screen_height: int
+) -> DecodedImage | None:
+    """Reads an image, fits it to screen, and copies its pixels to a new shared
+    memory block. Runs in a worker process.
+
+    :param image_path: Path to an image.
+    :param screen_width: Width of the screen to fit to.
+    :param screen_height: Height of the screen to fit to.
+    :returns: The decoded image or None if it could not be read. Images that
+    fail to decode are left for the main process to show an error for."""
+
+    start_ns: int = perf_counter_ns()
+    read_image_response: ReadImageResponse | None = ImageIO.read_image(image_path)
+    if read_image_response is None:
+        return None
+
+    try:
+        image: Image = ImageResizer(
+            screen_width, screen_height
+        ).get_image_fit_to_screen(
+            read_image_response.image, read_image_response.image_view
+        )
+        data: bytes = image.tobytes()
+    except OSError:
+        return None
+
+    shared_memory = SharedMemory(create=True, size=max(len(data), 1))
+    shared_memory.buf[: len(data)] = data  # type: ignore[index]
+    shared_memory.close()
+
+    return DecodedImage(shared_memory.name, image, read_image_response, start_ns)
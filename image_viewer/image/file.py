@@ -2,7 +2,8 @@
 Deals with storing known image file paths and determining their true file extension.
 """
 
-from collections.abc import Iterable
+from bisect import bisect_right
+from collections.abc import Callable, Iterable
 
 from image_viewer.constants import Movement
 from image_viewer.utils.os import file_name_compare
@@ -35,13 +36,19 @@ class ImageSearchResult:
 
 
 class ImageNameList(list[ImageName]):
-    """Represents list of ImageName objects with extension methods."""
+    """Represents list of ImageName objects with extension methods.
+    Sorted by name unless a sort key is set."""
 
-    __slots__ = ("_display_index",)
+    __slots__ = ("_display_index", "sort_key")
 
-    def __init__(self, iterable: Iterable[ImageName]) -> None:
+    def __init__(
+        self,
+        iterable: Iterable[ImageName],
+        sort_key: Callable[[ImageName], tuple[int, str]] | None = None,
+    ) -> None:
         super().__init__(iterable)
         self._display_index: int = 0
+        self.sort_key: Callable[[ImageName], tuple[int, str]] | None = sort_key
 
     @property
     def display_index(self) -> int:
@@ -77,9 +84,38 @@ class ImageNameList(list[ImageName]):
 
         :param target_image_name: The name to set index to after sorting."""
 
-        super().sort()
+        super().sort(key=self.sort_key)
         self.set_index_to_image(target_image_name)
 
+    def insert_sorted_and_preserve_index(
+        self, index: int, image_names: list[ImageName]
+    ) -> None:
+        """Inserts sorted images while keeping index at the same image.
+
+        :param index: Where to insert the images.
+        :param image_names: Sorted images that all belong at index."""
+
+        should_move_index: bool = len(self) > 0 and index <= self._display_index
+        self[index:index] = image_names
+
+        if should_move_index:
+            self._display_index += len(image_names)
+
+    def insert_by_sort_key_and_preserve_index(
+        self,
+        image_names: list[ImageName],
+        sort_key: Callable[[ImageName], tuple[int, str]],
+    ) -> None:
+        """Inserts each image where its key belongs while keeping index at
+        the same image, without sorting the whole list again.
+
+        :param image_names: Images not already in the list.
+        :param sort_key: The key the list is sorted by."""
+
+        for image_name in image_names:
+            index: int = bisect_right(self, sort_key(image_name), key=sort_key)
+            self.insert_sorted_and_preserve_index(index, [image_name])
+
     def remove_current_image(self, index_movement: Movement = Movement.NONE) -> None:
         """Safely removes the entry at the current index.
 
@@ -115,6 +151,9 @@ class ImageNameList(list[ImageName]):
         :param target_image_name: The name to search for.
         :returns: Search result with index and boolean if a match was found or not."""
 
+        if self.sort_key is not None:
+            return self._search_with_sort_key(target_image_name, self.sort_key)
+
         low: int = 0
         high: int = len(self) - 1
         while low <= high:
@@ -130,3 +169,23 @@ class ImageNameList(list[ImageName]):
                 low = mid + 1
 
         return ImageSearchResult(index=low, found=False)
+
+    def _search_with_sort_key(
+        self,
+        target_image_name: str,
+        sort_key: Callable[[ImageName], tuple[int, str]],
+    ) -> ImageSearchResult:
+        """Searches for index of target when not sorted by name.
+        Names are not ordered, so finding a match needs a linear search.
+
+        :param target_image_name: The name to search for.
+        :param sort_key: The key the list is sorted by.
+        :returns: Search result with index and boolean if a match was found or not."""
+
+        for index, image_name in enumerate(self):
+            if image_name.name == target_image_name:
+                return ImageSearchResult(index=index, found=True)
+
+        index = bisect_right(self, sort_key(ImageName(target_image_name)), key=sort_key)
+
+        return ImageSearchResult(index=index, found=False)
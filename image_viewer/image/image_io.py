@@ -5,24 +5,28 @@
 import io
 from collections.abc import Callable
 from io import BytesIO
-from threading import Thread
+from threading import Lock, Thread
 
 from PIL.Image import Image
 from PIL.Image import open as open_image
 
 from image_viewer.constants import ZoomDirection
 from image_viewer.image._read import CRawImageView, read_image_into_buffer
-from image_viewer.image.cache import ImageCache, ImageCacheEntry
-from image_viewer.image.resizer import ImageResizer
+from image_viewer.image.cache import ImageCache, ImageCacheEntry, ZoomLevelCache
+from image_viewer.image.resizer import ImageResizer, MipChain
 from image_viewer.image.state import ImageState
 from image_viewer.utils.PIL import (
     get_placeholder_for_errored_image,
     optimize_image_mode,
 )
+from image_viewer.utils.timing import span_tracer, stage_timer, traced
 
 DEFAULT_DURATION_MS: int = 100
 ZOOM_AMOUNT: float = 1.35
 MAX_ZOOM_RATIO_TO_SCREEN: float = 2.2
+MAX_ZOOM_CACHE_BYTES: int = 512 * 1024 * 1024
+# Zoom levels resized in the background after an image loads
+PRECOMPUTED_ZOOM_LEVELS: int = 2
 
 
 class AnimationFrame:
@@ -53,7 +57,10 @@ class ImageIO:
     __slots__ = (
         "PIL_image",
         "_image_optimized",
+        "_image_path",
         "_state",
+        "_zoom_cache_lock",
+        "_zoom_level_thread",
         "_zoom_pixel_boundary",
         "animation_callback",
         "animation_frames",
@@ -62,6 +69,7 @@ class ImageIO:
         "image_cache",
         "image_resizer",
         "image_view",
+        "mip_chain",
         "zoomed_image_cache",
     )
 
@@ -79,19 +87,39 @@ class ImageIO:
 
         self.PIL_image = Image()
         self._image_optimized: bool = False
+        self._image_path: str = ""
         self.image_view: CRawImageView
+        self.mip_chain: MipChain
         self.current_load_id: int = 0
 
         self.animation_frames: list[AnimationFrame | None] = []
         self.frame_index: int = 0
         self._state = ImageState()
         self._zoom_pixel_boundary: int
-        self.zoomed_image_cache: list[Image] = []
+        self.zoomed_image_cache = ZoomLevelCache(MAX_ZOOM_CACHE_BYTES)
+        # Guards changes to zoomed_image_cache while precomputing zoom levels
+        self._zoom_cache_lock = Lock()
+        self._zoom_level_thread: Thread | None = None
 
     @property
     def zoom_allowed(self) -> bool:
         return self._state.zoom_allowed
 
+    @property
+    def zoom_level(self) -> int:
+        return self._state.zoom_level
+
+    @property
+    def zoom_level_cached(self) -> bool:
+        return self._state.zoom_level in self.zoomed_image_cache
+
+    @property
+    def zoom_level_loading(self) -> bool:
+        """True while a zoom level is being resized on another thread."""
+        return (
+            self._zoom_level_thread is not None and self._zoom_level_thread.is_alive()
+        )
+
     def get_next_frame(self) -> AnimationFrame | None:
         """Gets next frame of animated image or empty frame while its being loaded"""
         try:
@@ -129,17 +157,20 @@ class ImageIO:
         """Tries to open file on disk as PIL Image
         Returns Image or None on failure"""
         try:
-            image_view: CRawImageView | None = read_image_into_buffer(path_to_image)
+            with stage_timer.measure("Read"):
+                image_view: CRawImageView | None = read_image_into_buffer(path_to_image)
             if image_view is None:
                 return None
 
             image_bytes_io = BytesIO(image_view.view)
-            image: Image = open_image(image_bytes_io, "r", (image_view.format,))
+            with stage_timer.measure("Open"):
+                image: Image = open_image(image_bytes_io, "r", (image_view.format,))
 
             return ReadImageResponse(image_view, image)
         except OSError:
             return None
 
+    @traced
     def load_image(self, image_path: str) -> Image | None:
         """Loads an image, resizes it to screen, and caches it.
         Returns Image or None on failure"""
@@ -152,13 +183,20 @@ class ImageIO:
 
         self.image_view = read_image_response.image_view
         self.PIL_image = original_image
+        self.mip_chain = MipChain(original_image, self.image_view)
+        self._image_path = image_path
         self.current_load_id += 1
 
+        self.zoomed_image_cache = ZoomLevelCache(MAX_ZOOM_CACHE_BYTES)
+
         # check if cached and not changed outside of program
         resized_image: Image
         cached_image_data = self.image_cache.get(image_path)
         if cached_image_data is not None and byte_size == cached_image_data.byte_size:
             resized_image = cached_image_data.image
+            stage_timer.note("Resize", "cached")
+            if cached_image_data.zoom_levels is not None:
+                self.zoomed_image_cache = cached_image_data.zoom_levels
         else:
             original_mode: str = original_image.mode
             resized_image = self._resize_or_get_placeholder()
@@ -177,7 +215,7 @@ class ImageIO:
             self.begin_animation(original_image, resized_image, frame_count)
 
         # first zoom level is just the image as is
-        self.zoomed_image_cache = [resized_image]
+        self.zoomed_image_cache.add(0, resized_image, 0)
         self._zoom_pixel_boundary = int(
             (
                 original_image.width
@@ -239,6 +277,7 @@ class ImageIO:
 
         return current_image
 
+    @traced
     def get_zoomed_image(self, direction: ZoomDirection) -> Image | None:
         """Gets current image resized for zoom."""
         if __debug__ and not self._state.zoom_allowed:
@@ -247,42 +286,217 @@ class ImageIO:
         if not self._state.try_update(direction):
             return None
 
+        return self.get_zoomed_image_at_current_level()
+
+    @traced
+    def get_zoom_preview(self, direction: ZoomDirection) -> Image | None:
+        """Zooms and gets a fast, low quality, resize of the nearest cached
+        zoom level to display until the current zoom level is loaded.
+
+        :param direction: Direction to zoom in.
+        :returns: The cached zoom level if present, a preview of it if not,
+        or None if zoom did not change"""
+        if __debug__ and not self._state.zoom_allowed:
+            return None
+
+        if not self._state.try_update(direction):
+            return None
+
         zoom_level: int = self._state.zoom_level
-        if zoom_level < len(self.zoomed_image_cache):
-            return self.zoomed_image_cache[zoom_level]
+        cached_image: Image | None = self.zoomed_image_cache.get(zoom_level)
+        if cached_image is not None:
+            return cached_image
 
-        zoom_scaling: float = ZOOM_AMOUNT**zoom_level
+        new_width, new_height = self._get_zoom_dimensions(
+            self.zoomed_image_cache, zoom_level
+        )
+        if new_width > self._zoom_pixel_boundary:
+            self._state.set_max_zoom()
 
-        width, height = self.zoomed_image_cache[0].size
-        new_width = int(width * zoom_scaling)
-        new_height = int(height * zoom_scaling)
+        with self._zoom_cache_lock:
+            nearest_level: int = min(
+                self.zoomed_image_cache, key=lambda level: abs(level - zoom_level)
+            )
+            # Fetched here since another thread may evict the level once released
+            nearest_image: Image = self.zoomed_image_cache[nearest_level]
+        preview: Image | None = self.image_resizer.get_image_zoom_preview(
+            nearest_image, new_width, new_height
+        )
 
-        original_width: int = self.PIL_image.width
-        last_cached_width: int = self.zoomed_image_cache[-1].width
+        if preview is None:
+            self._state.decrement_and_set_max_zoom()
 
-        base_image: Image
-        if new_width < original_width or original_width > last_cached_width:
-            base_image = self.PIL_image
-        else:
-            base_image = self.zoomed_image_cache[-1]
+        return preview
+
+    @traced
+    def get_zoomed_image_at_current_level(self) -> Image | None:
+        """Gets current image resized for the current zoom level."""
+        zoom_level: int = self._state.zoom_level
+        cached_image: Image | None = self.zoomed_image_cache.get(zoom_level)
+        if cached_image is not None:
+            return cached_image
+
+        new_width, _ = self._get_zoom_dimensions(self.zoomed_image_cache, zoom_level)
 
         if new_width > self._zoom_pixel_boundary:
             self._state.set_max_zoom()
 
-        fit_image: Image | None = self.image_resizer.get_image_zoomed_to(
-            base_image,
-            new_width,
-            new_height,
+        fit_image: Image | None = self._get_image_zoomed_to_level(
+            self.mip_chain,
+            self.zoomed_image_cache,
+            zoom_level,
             self._state.zoom_level == self._state.zoom_level_max,
         )
 
         if fit_image is not None:
-            self.zoomed_image_cache.append(fit_image)
+            with self._zoom_cache_lock:
+                self.zoomed_image_cache.add(zoom_level, fit_image, zoom_level)
         else:
             self._state.decrement_and_set_max_zoom()
 
         return fit_image
 
+    def begin_zoom_level_load(self) -> None:
+        """Begins new thread to resize the current zoom level. It is cached once
+        done, so zoom_level_cached reports when it can be displayed"""
+        zoom_level: int = self._state.zoom_level
+        if zoom_level in self.zoomed_image_cache:
+            return
+
+        self._zoom_level_thread = Thread(
+            target=self.load_zoom_level,
+            args=(
+                self.mip_chain,
+                self.zoomed_image_cache,
+                zoom_level,
+                zoom_level == self._state.zoom_level_max,
+                self.current_load_id,
+            ),
+            daemon=True,
+        )
+        self._zoom_level_thread.start()
+
+    @traced
+    def load_zoom_level(
+        self,
+        mip_chain: MipChain,
+        zoomed_image_cache: ZoomLevelCache,
+        zoom_level: int,
+        snap_if_small: bool,
+        load_id: int,
+    ) -> None:
+        """Resizes and caches a zoom level unless another image was loaded.
+        Nothing is cached if the zoom level is too large to resize"""
+        try:
+            zoomed_image: Image | None = self._get_image_zoomed_to_level(
+                mip_chain, zoomed_image_cache, zoom_level, snap_if_small
+            )
+        except (OSError, ValueError):
+            # Image was closed by loading another
+            return
+
+        if zoomed_image is None:
+            return
+
+        with self._zoom_cache_lock:
+            if load_id == self.current_load_id:
+                zoomed_image_cache.add(zoom_level, zoomed_image, zoom_level)
+
+    def begin_zoom_precompute(self) -> None:
+        """Begins new thread to resize the first zoom levels of a static image
+        so the first zoom is usually already cached"""
+        if not self._state.zoom_allowed or all(
+            zoom_level in self.zoomed_image_cache
+            for zoom_level in range(1, PRECOMPUTED_ZOOM_LEVELS + 1)
+        ):
+            return
+
+        Thread(
+            target=self.precompute_zoom_levels,
+            args=(self.mip_chain, self.zoomed_image_cache, self.current_load_id),
+            daemon=True,
+        ).start()
+
+    @traced
+    def precompute_zoom_levels(
+        self, mip_chain: MipChain, zoomed_image_cache: ZoomLevelCache, load_id: int
+    ) -> None:
+        """Resizes zoom levels up to PRECOMPUTED_ZOOM_LEVELS that are not cached"""
+        for zoom_level in range(1, PRECOMPUTED_ZOOM_LEVELS + 1):
+            if load_id != self.current_load_id:
+                break
+            if zoom_level in zoomed_image_cache:
+                continue
+
+            # Levels past the boundary snap to the screen when zoomed to
+            new_width, _ = self._get_zoom_dimensions(zoomed_image_cache, zoom_level)
+            if new_width > self._zoom_pixel_boundary:
+                break
+
+            try:
+                with span_tracer.span("precompute_zoom_level", str(zoom_level)):
+                    zoomed_image: Image | None = self._get_image_zoomed_to_level(
+                        mip_chain, zoomed_image_cache, zoom_level, False
+                    )
+            except (OSError, ValueError):
+                # Image was closed by loading another
+                break
+
+            if zoomed_image is None:
+                break
+
+            with self._zoom_cache_lock:
+                if load_id != self.current_load_id:
+                    break
+                zoomed_image_cache.add(zoom_level, zoomed_image, 0)
+
+    def _get_image_zoomed_to_level(
+        self,
+        mip_chain: MipChain,
+        zoomed_image_cache: ZoomLevelCache,
+        zoom_level: int,
+        snap_if_small: bool,
+    ) -> Image | None:
+        """Resizes an image for a zoom level using the best available source.
+
+        :param mip_chain: Reductions of the image as read from disk.
+        :param zoomed_image_cache: The image's cached zoom levels.
+        :param zoom_level: The zoom level to resize for.
+        :param snap_if_small: Snaps dimensions to screen edges if not already.
+        :returns: Resized Image or None if dimensions too large"""
+        new_width, new_height = self._get_zoom_dimensions(
+            zoomed_image_cache, zoom_level
+        )
+
+        base_image: Image = mip_chain.get_source_for(new_width, new_height)
+        previous_image: Image | None = zoomed_image_cache.get(zoom_level - 1)
+        # Upscale from previous level when it is already bigger than the original
+        if (
+            new_width >= base_image.width
+            and previous_image is not None
+            and previous_image.width >= base_image.width
+        ):
+            base_image = previous_image
+
+        return self.image_resizer.get_image_zoomed_to(
+            base_image, new_width, new_height, snap_if_small
+        )
+
+    @staticmethod
+    def _get_zoom_dimensions(
+        zoomed_image_cache: ZoomLevelCache, zoom_level: int
+    ) -> tuple[int, int]:
+        """Gets dimensions an image will have at a zoom level.
+
+        :param zoomed_image_cache: The image's cached zoom levels.
+        :param zoom_level: The zoom level.
+        :returns: Width and height at that zoom level"""
+        zoom_scaling: float = ZOOM_AMOUNT**zoom_level
+        width, height = zoomed_image_cache[0].size
+
+        return int(width * zoom_scaling), int(height * zoom_scaling)
+
+    @traced
     def load_remaining_frames(
         self, original_image: Image, last_frame: int, load_id: int
     ) -> None:
@@ -291,10 +505,11 @@ class ImageIO:
             if load_id != self.current_load_id:
                 break
             try:
-                original_image.seek(i)
-                frame_image: Image = self.image_resizer.get_image_fit_to_screen(
-                    original_image, self.image_view
-                )
+                with span_tracer.span("load_frame", str(i)):
+                    original_image.seek(i)
+                    frame_image: Image = self.image_resizer.get_image_fit_to_screen(
+                        original_image, self.image_view
+                    )
 
                 self.animation_frames[i] = AnimationFrame(frame_image)
             except (IndexError, ValueError):
@@ -310,4 +525,12 @@ class ImageIO:
         self.frame_index = 0
         self.PIL_image.close()
         self._state.reset()
-        self.zoomed_image_cache.clear()
+        if self._image_path:
+            with self._zoom_cache_lock:
+                # Zoom threads still running must not add to the persisted levels
+                self.current_load_id += 1
+                self.image_cache.persist_zoom_levels(
+                    self._image_path, self.zoomed_image_cache
+                )
+            self._image_path = ""
+        self.zoomed_image_cache = ZoomLevelCache(MAX_ZOOM_CACHE_BYTES)
@@ -1,5 +1,7 @@
 """Handles resizing of PIL images."""
 
+from threading import Lock
+
 from PIL.Image import Image, Resampling, frombytes
 
 from image_viewer.image._read import (
@@ -9,8 +11,78 @@ from image_viewer.image._read import (
     decode_jpeg_downscaled,
 )
 from image_viewer.utils.PIL import resize
+from image_viewer.utils.timing import stage_timer
 
 JPEG_MAX_DIMENSION: int = 65_535
+# Largest downscale libjpeg-turbo can do while decoding
+JPEG_MAX_DOWNSCALE_FACTOR: int = 8
+
+
+class MipChain:
+    """Power of two reductions of an image, made as needed, so zoom levels can be
+    resampled from a source close to their size instead of the full image."""
+
+    __slots__ = ("_image_view", "_mips", "_mips_lock")
+
+    def __init__(self, image: Image, image_view: CRawImageView) -> None:
+        self._image_view: CRawImageView = image_view
+        self._mips: dict[int, Image] = {1: image}
+        # Zoom levels are resized on the Tk thread and worker threads
+        self._mips_lock = Lock()
+
+    def get_source_for(self, width: int, height: int) -> Image:
+        """Gets the smallest reduction of the image still at least width x height.
+
+        :param width: Width that will be resized to
+        :param height: Height that will be resized to
+        :returns: The image or a reduction of it"""
+        image: Image = self._mips[1]
+        # Averaging palette indexes would create the wrong colors
+        if image.mode in ("1", "P"):
+            return image
+
+        factor: int = 1
+        while (
+            _get_reduced_dimension(image.width, factor << 1) >= width
+            and _get_reduced_dimension(image.height, factor << 1) >= height
+        ):
+            factor <<= 1
+
+        with self._mips_lock:
+            mip: Image | None = self._mips.get(factor)
+            if mip is None:
+                mip = self._reduce(factor)
+                self._mips[factor] = mip
+
+        return mip
+
+    def _reduce(self, factor: int) -> Image:
+        """Makes a reduction from the largest existing mip that divides factor.
+        RGB JPEGs are reduced while decoding by libjpeg-turbo instead.
+        Must hold _mips_lock.
+
+        :param factor: Power of 2 to reduce by
+        :returns: The reduced image"""
+        source_factor: int = max(
+            mip_factor for mip_factor in self._mips if mip_factor < factor
+        )
+
+        if (
+            source_factor == 1
+            and self._image_view.format == JPEG
+            and self._mips[1].mode == "RGB"
+        ):
+            source_factor = min(factor, JPEG_MAX_DOWNSCALE_FACTOR)
+            self._mips[source_factor] = _decode_jpeg_downscaled(
+                self._image_view, source_factor
+            )
+
+        source: Image = self._mips[source_factor]
+        return (
+            source
+            if source_factor == factor
+            else source.reduce(factor // source_factor)
+        )
 
 
 class ImageResizer:
@@ -55,6 +127,24 @@ class ImageResizer:
 
         return resize(image, (new_width, new_height), resampling)
 
+    def get_image_zoom_preview(
+        self, image: Image, new_width: int, new_height: int
+    ) -> Image | None:
+        """Quickly resizes image to provided dimensions with low quality resampling.
+
+        :param new_width: To resize to
+        :param new_height: To resize to
+        :returns: Resized Image or None if dimensions too large"""
+
+        if self._too_big(new_width, new_height):
+            return None
+
+        resampling: Resampling = (
+            Resampling.BOX if new_width < image.width else Resampling.NEAREST
+        )
+
+        return resize(image, (new_width, new_height), resampling)
+
     def _too_big(self, width: int, height: int) -> bool:
         """Returns if dimenons are too big and Resizer will not accept them."""
         return width > JPEG_MAX_DIMENSION or height > JPEG_MAX_DIMENSION
@@ -77,9 +167,13 @@ class ImageResizer:
         if scale_factor < 2:
             return self._get_generic_fit_to_screen(image)
 
-        return self._get_generic_fit_to_screen(
-            self._get_jpeg_downscaled(image_view, scale_factor)
-        )
+        stage_timer.note("Decode", f"libjpeg-turbo 1/{scale_factor}")
+        with stage_timer.measure("Decode"):
+            downscaled_image: Image = self._get_jpeg_downscaled(
+                image_view, scale_factor
+            )
+
+        return self._get_generic_fit_to_screen(downscaled_image)
 
     def _get_jpeg_fit_to_screen_downscale_factor(
         self, image_width: int, image_height: int
@@ -105,6 +199,9 @@ class ImageResizer:
             image_width, image_height
         )
 
+        with stage_timer.measure("Decode"):
+            image.load()
+
         resampling: Resampling
         if image.getcolors(150) is not None:
             resampling = Resampling.NEAREST
@@ -113,14 +210,18 @@ class ImageResizer:
         else:
             resampling = Resampling.LANCZOS
 
-        return resize(image, dimensions, resampling)
+        stage_timer.note(
+            "Resize",
+            f"{resampling.name} {image_width}x{image_height}"
+            f" to {dimensions[0]}x{dimensions[1]}",
+        )
+        with stage_timer.measure("Resize"):
+            return resize(image, dimensions, resampling)
 
     def _get_jpeg_downscaled(
         self, image_view: CRawImageView, scale_factor: int
     ) -> Image:
-        jpeg_result: CDecodedJpegView = decode_jpeg_downscaled(image_view, scale_factor)
-        # TODO: Remove ignore after https://github.com/python-pillow/Pillow/pull/9410
-        return frombytes("RGB", jpeg_result.dimensions, jpeg_result.view)  # type: ignore[arg-type]
+        return _decode_jpeg_downscaled(image_view, scale_factor)
 
     def fit_dimensions_to_screen(
         self, image_width: int, image_height: int
@@ -150,3 +251,23 @@ class ImageResizer:
         """Fits dimensions to screen's width"""
         height: int = round(image_height * (self.screen_width / image_width))
         return (self.screen_width, height)
+
+
+def _decode_jpeg_downscaled(image_view: CRawImageView, scale_factor: int) -> Image:
+    """Decodes a JPEG with libjpeg-turbo, downscaling while decoding.
+
+    :param image_view: View to a JPEG's bytes
+    :param scale_factor: Power of 2, up to 8, to downscale by
+    :returns: The decoded RGB image"""
+    jpeg_result: CDecodedJpegView = decode_jpeg_downscaled(image_view, scale_factor)
+    # TODO: Remove ignore after https://github.com/python-pillow/Pillow/pull/9410
+    return frombytes("RGB", jpeg_result.dimensions, jpeg_result.view)  # type: ignore[arg-type]
+
+
+def _get_reduced_dimension(dimension: int, factor: int) -> int:
+    """Gets a dimension after reduction, rounding up like PIL and libjpeg-turbo.
+
+    :param dimension: Width or height to reduce
+    :param factor: Factor to reduce by
+    :returns: The reduced dimension"""
+    return (dimension + factor - 1) // factor
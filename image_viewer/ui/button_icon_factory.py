@@ -1,6 +1,13 @@
+"""Draws UI icons scaled to screen size. Icons of each size are drawn once and
+cached on disk as one atlas image, so later launches decode a single file."""
+
+import os
+from tkinter import PhotoImage as tkPhotoImage
+
 from PIL import ImageOps
 from PIL.Image import Image
 from PIL.Image import new as new_image
+from PIL.Image import open as open_image
 from PIL.ImageDraw import ImageDraw
 from PIL.ImageTk import PhotoImage
 
@@ -12,24 +19,126 @@ DEFAULT_ICON_SIZE: tuple[int, int] = (32, 32)
 LINE_RGB: tuple[int, int, int] = (170, 170, 170)
 ICON_RGB: tuple[int, int, int] = (100, 104, 102)
 ICON_HOVERED_RGB: tuple[int, int, int] = (95, 92, 88)
+TOPBAR_RGBA: tuple[int, int, int, int] = (60, 60, 60, 170)
+
+# Increase when icons are drawn differently so old atlases aren't used
+ICON_ATLAS_VERSION: int = 1
+
+# Index of each icon in the atlas, each followed by its hovered version
+_EXIT_INDEX: int = 0
+_MINIFY_INDEX: int = 2
+_TRASH_INDEX: int = 4
+_DROPDOWN_DOWN_INDEX: int = 6
+_DROPDOWN_UP_INDEX: int = 8
+_RENAME_INDEX: int = 10
+_ICON_COUNT: int = 12
 
 
 class ButtonIconFactory:
     """Creates UI icons scaled to screen size"""
 
-    __slots__ = ("icon_size", "ratio")
+    __slots__ = ("_atlas", "icon_size")
 
-    def __init__(self, icon_size: int) -> None:
+    def __init__(self, icon_size: int, cache_folder: str) -> None:
+        """:param icon_size: Width and height of each icon.
+        :param cache_folder: Folder the atlas of icons this size is cached in."""
         self.icon_size: tuple[int, int] = (icon_size, icon_size)
 
+        atlas_path: str = os.path.join(
+            cache_folder, f"icons_v{ICON_ATLAS_VERSION}_{icon_size}.png"
+        )
+        atlas: Image | None = self._read_atlas(atlas_path)
+
+        if atlas is None:
+            atlas = self._draw_atlas()
+            try:
+                os.makedirs(cache_folder, exist_ok=True)
+                atlas.save(atlas_path, "PNG", compress_level=1)
+            except OSError:
+                pass  # Icons are drawn again next launch
+
+        self._atlas: Image = atlas
+
+    def _read_atlas(self, atlas_path: str) -> Image | None:
+        """Reads an atlas saved by a previous launch.
+
+        :param atlas_path: Path the atlas is cached at.
+        :returns: The atlas or None if it is missing or not the expected size."""
+        try:
+            with open_image(atlas_path, "r", ("PNG",)) as atlas:
+                atlas.load()
+        except OSError:
+            return None
+
+        expected_size: tuple[int, int] = (
+            self.icon_size[0] * _ICON_COUNT,
+            self.icon_size[1],
+        )
+        return atlas if atlas.size == expected_size and atlas.mode == "RGBA" else None
+
+    def _draw_atlas(self) -> Image:
+        """:returns: Every icon side by side in one image."""
+        atlas: Image = new_image(
+            "RGBA", (self.icon_size[0] * _ICON_COUNT, self.icon_size[1])
+        )
+
+        for index, icon in enumerate(self._draw_icons()):
+            atlas.paste(icon, (index * self.icon_size[0], 0))
+
+        return atlas
+
+    def _draw_icons(self) -> list[Image]:
+        """:returns: Every icon, in the order they are placed in the atlas."""
+        exit_rgb: tuple[int, int, int] = (190, 40, 40)
+        exit_hover_rgb: tuple[int, int, int] = (180, 25, 20)
+        draw, draw_hovered = self._make_icon_base(exit_rgb, exit_hover_rgb)
+        icons: list[Image] = [
+            self._resize_icon(draw._image),
+            self._draw_x_symbol(draw_hovered),
+        ]
+
+        draw, draw_hovered = self._make_icon_base()
+        icons += (
+            self._draw_minify_symbol(draw),
+            self._draw_minify_symbol(draw_hovered),
+        )
+
+        draw, draw_hovered = self._make_icon_base()
+        icons += (self._draw_trash_symbol(draw), self._draw_trash_symbol(draw_hovered))
+
+        draw, draw_hovered = self._make_icon_base()
+        down: Image = self._draw_down_arrow(draw)
+        down_hovered: Image = self._draw_down_arrow(draw_hovered)
+        icons += (down, down_hovered, ImageOps.flip(down), ImageOps.flip(down_hovered))
+
+        transparent_icon: Image = new_image("RGBA", DEFAULT_ICON_SIZE)
+        draw = ImageDraw(transparent_icon.copy())
+        draw_hovered = ImageDraw(transparent_icon)
+        draw_hovered.rectangle((4, 5, 28, 27), ICON_HOVERED_RGB, width=1)
+        icons += (
+            self._draw_rename_symbol(draw),
+            self._draw_rename_symbol(draw_hovered),
+        )
+
+        return icons
+
+    def _get_icons(self, index: int) -> IconImages:
+        """Gets an icon and its hovered version from the atlas.
+
+        :param index: Index of the icon in the atlas.
+        :returns: The icons as PhotoImages."""
+        width, height = self.icon_size
+        left: int = index * width
+
+        return IconImages(
+            PhotoImage(self._atlas.crop((left, 0, left + width, height))),
+            PhotoImage(self._atlas.crop((left + width, 0, left + width * 2, height))),
+        )
+
     def _resize_icon(self, image: Image) -> Image:
         """Returns copy of image that is icon size"""
         return resize(image, self.icon_size)
 
-    def make_icon_from_draw(self, draw: ImageDraw) -> PhotoImage:
-        """Resizes an ImageDraw to icon size and converts to a PhotoImage"""
-        return PhotoImage(self._resize_icon(draw._image))
-
     def _new_rgb_image(self, rgb: tuple[int, int, int]) -> Image:
         """Returns new default sized RGB Image"""
         return new_image("RGB", DEFAULT_ICON_SIZE, rgb)
@@ -44,79 +153,65 @@ class ButtonIconFactory:
             self._new_rgb_image(default_hovered_rgb)
         )
 
-    def make_topbar_image(self, screen_width: int) -> PhotoImage:
-        """Makes partially transparent bar used on the screen"""
-        topbar_rgba: tuple[int, int, int, int] = (60, 60, 60, 170)
-        size: tuple[int, int] = (screen_width, self.icon_size[0])
-        return PhotoImage(new_image("RGBA", size, topbar_rgba))
+    def make_topbar_image(self, screen_width: int) -> tkPhotoImage:
+        """Makes partially transparent bar used on the screen. A one pixel
+        wide strip is stretched by Tk instead of making a screen wide image."""
+        strip = PhotoImage(new_image("RGBA", (1, self.icon_size[1]), TOPBAR_RGBA))
 
-    def _draw_x_symbol(self, draw: ImageDraw) -> PhotoImage:
+        topbar = tkPhotoImage(width=screen_width, height=self.icon_size[1])
+        topbar.tk.call(
+            topbar, "copy", strip, "-zoom", screen_width, 1, "-compositingrule", "set"
+        )
+
+        return topbar
+
+    def _draw_x_symbol(self, draw: ImageDraw) -> Image:
         """Draws X on provided image"""
         draw.line((6, 6, 26, 26), LINE_RGB, 2)
         draw.line((6, 26, 26, 6), LINE_RGB, 2)
-        return self.make_icon_from_draw(draw)
+        return self._resize_icon(draw._image)
 
     def make_exit_icons(self) -> IconImages:
         """Makes red button with an X when hovered"""
-        exit_rgb: tuple[int, int, int] = (190, 40, 40)
-        exit_hover_rgb: tuple[int, int, int] = (180, 25, 20)
-        draw, draw_hovered = self._make_icon_base(exit_rgb, exit_hover_rgb)
-        return IconImages(
-            self.make_icon_from_draw(draw), self._draw_x_symbol(draw_hovered)
-        )
+        return self._get_icons(_EXIT_INDEX)
 
-    def _draw_minify_symbol(self, draw: ImageDraw) -> PhotoImage:
+    def _draw_minify_symbol(self, draw: ImageDraw) -> Image:
         """Draws common minify symbol on provided image"""
         draw.line((6, 24, 24, 24), LINE_RGB, 2)
-        return self.make_icon_from_draw(draw)
+        return self._resize_icon(draw._image)
 
     def make_minify_icons(self) -> IconImages:
-        draw, draw_hovered = self._make_icon_base()
-        return IconImages(
-            self._draw_minify_symbol(draw), self._draw_minify_symbol(draw_hovered)
-        )
+        return self._get_icons(_MINIFY_INDEX)
 
-    def _draw_trash_symbol(self, draw: ImageDraw) -> PhotoImage:
+    def _draw_trash_symbol(self, draw: ImageDraw) -> Image:
         """Draws a trash can on provided image"""
         draw.line((9, 9, 9, 22), LINE_RGB, 2)
         draw.line((21, 9, 21, 22), LINE_RGB, 2)
         draw.line((9, 22, 21, 22), LINE_RGB, 2)
         draw.line((7, 9, 24, 9), LINE_RGB, 2)
         draw.line((12, 8, 19, 8), LINE_RGB, 3)
-        return self.make_icon_from_draw(draw)
+        return self._resize_icon(draw._image)
 
     def make_trash_icons(self) -> IconImages:
-        draw, draw_hovered = self._make_icon_base()
-        return IconImages(
-            self._draw_trash_symbol(draw), self._draw_trash_symbol(draw_hovered)
-        )
+        return self._get_icons(_TRASH_INDEX)
 
-    def _draw_down_and_up_arrow(self, draw: ImageDraw) -> tuple[PhotoImage, PhotoImage]:
-        """Draws an arrow on provided image
-        Returns tuple of down arrow version and up arrow version"""
+    def _draw_down_arrow(self, draw: ImageDraw) -> Image:
+        """Draws a down arrow on provided image, flipped for the up arrow"""
         draw.line((6, 11, 16, 21), LINE_RGB, 2)
         draw.line((16, 21, 26, 11), LINE_RGB, 2)
-        resized_img: Image = self._resize_icon(draw._image)
-        return PhotoImage(resized_img), PhotoImage(ImageOps.flip(resized_img))
+        return self._resize_icon(draw._image)
 
     def make_dropdown_icons(self) -> tuple[IconImages, IconImages]:
         """Return down arrow icons and up arrow icons as a tuple"""
-        draw, draw_hovered = self._make_icon_base()
-        down, up = self._draw_down_and_up_arrow(draw)
-        down_hovered, up_hovered = self._draw_down_and_up_arrow(draw_hovered)
-        return IconImages(down, down_hovered), IconImages(up, up_hovered)
+        return self._get_icons(_DROPDOWN_DOWN_INDEX), self._get_icons(
+            _DROPDOWN_UP_INDEX
+        )
 
-    def _draw_rename_symbol(self, draw: ImageDraw) -> PhotoImage:
+    def _draw_rename_symbol(self, draw: ImageDraw) -> Image:
         draw.rectangle((7, 10, 25, 22), None, LINE_RGB, 1)
         draw.line((7, 16, 16, 16), LINE_RGB, 3)
         draw.line((16, 8, 16, 24), LINE_RGB, 2)
-        return self.make_icon_from_draw(draw)
+        return self._resize_icon(draw._image)
 
     def make_rename_icons(self) -> IconImages:
-        transparent_icon: Image = new_image("RGBA", DEFAULT_ICON_SIZE)
-        draw: ImageDraw = ImageDraw(transparent_icon.copy())
-        draw_hovered: ImageDraw = ImageDraw(transparent_icon)
-        draw_hovered.rectangle((4, 5, 28, 27), ICON_HOVERED_RGB, width=1)
-        return IconImages(
-            self._draw_rename_symbol(draw), self._draw_rename_symbol(draw_hovered)
-        )
+        return self._get_icons(_RENAME_INDEX)
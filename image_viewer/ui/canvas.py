@@ -1,6 +1,7 @@
 """Classes representing a canvas UI element"""
 
 from tkinter import Canvas, Event, Tk
+from tkinter import PhotoImage as tkPhotoImage
 from tkinter.font import Font  # noqa: TC003
 
 from PIL.ImageTk import PhotoImage
@@ -33,7 +34,7 @@ class CustomCanvas(Canvas):
 
         master.update()  # updates winfo width and height to the current size
         self._motion_id: str = ""
-        self._topbar: PhotoImage
+        self._topbar: tkPhotoImage
         self.button_name_to_object: dict[str, ButtonUIElementBase] = {}
         self.file_name_text_id: int = -1
         self.font: Font
@@ -118,7 +119,7 @@ class CustomCanvas(Canvas):
 
         return image_id
 
-    def create_topbar(self, topbar_img: PhotoImage) -> None:
+    def create_topbar(self, topbar_img: tkPhotoImage) -> None:
         """Creates the topbar and stores it"""
         self._topbar = topbar_img  # save from garbage collector
         self.create_image(
@@ -152,6 +153,28 @@ class CustomCanvas(Canvas):
         self.image_display.image = new_image
         self.update_idletasks()
 
+    def update_existing_image_display_around(
+        self, new_image: PhotoImage, x: int, y: int
+    ) -> None:
+        """Updates existing image on screen with a new, differently sized, PhotoImage
+        keeping the same part of the image under the provided coords.
+
+        :param new_image: A resized version of the current image.
+        :param x: X coord to keep in place, usually the mouse.
+        :param y: Y coord to keep in place, usually the mouse."""
+        left, top, right, bottom = self.bbox(self.image_display.id)
+        x_ratio: float = min(max((x - left) / max(right - left, 1), 0), 1)
+        y_ratio: float = min(max((y - top) / max(bottom - top, 1), 0), 1)
+
+        new_width: int = new_image.width()
+        new_height: int = new_image.height()
+        self.coords(
+            self.image_display.id,
+            x - x_ratio * new_width + (new_width >> 1),
+            y - y_ratio * new_height + (new_height >> 1),
+        )
+        self.update_existing_image_display(new_image)
+
     def update_file_name(self, new_name: str) -> int:
         """Updates file name. Returns width of new name"""
         expected_width: int = self.font.measure(new_name)
@@ -6,15 +6,13 @@ from textwrap import wrap
 from typing import IO
 
 from PIL import Image as _Image  # avoid name conflicts
-from PIL.Image import Image, Resampling, new, register_open
-from PIL.ImageDraw import ImageDraw
-from PIL.ImageFont import FreeTypeFont
+from PIL.Image import Image, Resampling, frombuffer, new, register_open
 from PIL.JpegImagePlugin import JpegImageFile
 
 from image_viewer.constants import TEXT_RGB
-
-if os.name == "nt":
-    from image_viewer.utils._os_nt import get_files_in_folder
+from image_viewer.image._resize import resize_premultiplied
+from image_viewer.utils.font_index import FONT_INDEX_FILE_NAME, find_font_path
+from image_viewer.utils.os import get_cache_folder
 
 # Modes that need more descriptive names or who's bpp
 # does not follow len(mode) * 8
@@ -27,7 +25,13 @@ _mode_info_special_cases: dict[str, tuple[str, int]] = {
     "1": ("Black And White", 1),
 }
 
-_alpha_to_precomputed: dict[str, str] = {"RGBA": "RGBa", "LA": "La"}
+# Modes resized with alpha premultiplied to avoid colors bleeding from
+# transparent pixels. Alpha is the last band in each
+_premultiplied_modes: set[str] = {"RGBA", "LA"}
+
+# Font set by init_PIL, found and loaded when text is first drawn
+_font_file: str = ""
+_font_size: int = 0
 
 
 def get_mode_info(mode: str) -> tuple[str, int]:
@@ -65,24 +69,28 @@ def resize(
     if image.size == size:
         return image.copy()
 
-    box: tuple[int, int, int, int] = (0, 0, *image.size)
     original_mode: str = image.mode
 
-    if original_mode in _alpha_to_precomputed:
-        new_mode: str = _alpha_to_precomputed[original_mode]
-        image = image.convert(new_mode)
+    if original_mode in _premultiplied_modes and resample != Resampling.NEAREST:
+        # Premultiply, resample, and unpremultiply in one pass in C
+        # instead of converting the whole image before and after
+        resized_data: bytes = resize_premultiplied(
+            image.tobytes(), len(original_mode), *image.size, *size, resample
+        )
+        resized_image: Image = frombuffer(
+            original_mode, size, resized_data, "raw", original_mode, 0, 1
+        )
+        resized_image.info = image.info.copy()
+        return resized_image
+
+    box: tuple[int, int, int, int] = (0, 0, *image.size)
 
-    resized_image: Image = image._new(
+    return image._new(
         image.im.resize(
             size, Resampling.NEAREST if original_mode in ("1", "P") else resample, box
         )
     )
 
-    if original_mode in _alpha_to_precomputed:
-        resized_image = resized_image.convert(original_mode)
-
-    return resized_image
-
 
 def optimize_image_mode(image: Image) -> Image:
     """Optimizes a PIL Image by removing useless color channels.
@@ -131,6 +139,8 @@ def _should_be_grayscale(image: Image) -> bool:
 
 def _get_longest_line_dimensions(text: str) -> tuple[int, int]:
     """Returns width and height of longest string in a string with multiple lines"""
+    from PIL.ImageDraw import ImageDraw
+
     longest_line: str = max(text.split("\n"), key=len)
 
     width_offset, height_offset, width, height = ImageDraw.font.getbbox(longest_line)  # type: ignore[union-attr]
@@ -140,6 +150,9 @@ def _get_longest_line_dimensions(text: str) -> tuple[int, int]:
 
 def create_dropdown_image(text: str) -> Image:
     """Creates a new Image with current images metadata"""
+    from PIL.ImageDraw import ImageDraw
+
+    _load_font_if_needed()
     line_width, line_height = _get_longest_line_dimensions(text)
 
     line_count: int = text.count("\n") + 1
@@ -164,6 +177,9 @@ def get_placeholder_for_errored_image(
     error: Exception, screen_width: int, screen_height: int
 ) -> Image:
     """Returns an Image with error message"""
+    from PIL.ImageDraw import ImageDraw
+
+    _load_font_if_needed()
     error_type: str = type(error).__name__
     error_title: str = f"{error_type} occurred while trying to load file"
 
@@ -240,42 +256,35 @@ def _stop_unwanted_PIL_imports() -> None:  # noqa: N802
 
 
 def init_PIL(font_file: str, font_size: int) -> None:  # noqa: N802
-    """Sets up font and edit PIL's internal list of plugins to load"""
+    """Edits PIL's internal list of plugins to load and sets the font to use.
+    The font is found when text is first drawn, keeping it out of startup"""
+    global _font_file, _font_size
+
+    _stop_unwanted_PIL_imports()
+
+    _font_file = font_file
+    _font_size = font_size
+
+
+def init_PIL_in_worker() -> None:  # noqa: N802
+    """Edits PIL's plugins in worker processes, which never draw text"""
 
     _stop_unwanted_PIL_imports()
 
-    ImageDraw.font = _get_PIL_font(font_file, font_size)
-
-
-def _get_PIL_font(font_file: str, font_size: int) -> FreeTypeFont:  # noqa: N802
-    """Returns font for PIL to use."""
-
-    font_folder: str
-    if os.name == "nt":
-        windir: str | None = os.environ.get("WINDIR")
-        if windir:
-            font_folder = os.path.join(windir, "fonts")
-            for file in get_files_in_folder(font_folder):
-                if file == font_file:
-                    return FreeTypeFont(os.path.join(font_folder, font_file), font_size)
-    else:
-        data_home: str | None = os.environ.get("XDG_DATA_HOME")
-        if not data_home:
-            data_home = os.path.expanduser("~/.local/share")
-
-        data_dirs: str | None = os.environ.get("XDG_DATA_DIRS")
-        if not data_dirs:
-            data_dirs = "/usr/local/share:/usr/share"
-
-        parent_folders: list[str] = [data_home, *data_dirs.split(":")]
-        font_folders: list[str] = [os.path.join(p, "fonts") for p in parent_folders]
-
-        for font_folder in font_folders:
-            for root_folder, __, files in os.walk(font_folder):
-                for file in files:
-                    if file == font_file:
-                        return FreeTypeFont(
-                            os.path.join(root_folder, font_file), font_size
-                        )
-
-    raise RuntimeError(f"Can't find font {font_file}, try adjusting config.ini")
+
+def _load_font_if_needed() -> None:
+    """Loads the font set by init_PIL as PIL's default if not yet loaded.
+    Falls back to PIL's own font if it can't be found or read, since this
+    runs while drawing placeholders for images that failed to load"""
+    from PIL.ImageDraw import ImageDraw
+
+    if ImageDraw.font is None:
+        from PIL.ImageFont import FreeTypeFont, load_default
+
+        try:
+            font_path: str = find_font_path(
+                _font_file, os.path.join(get_cache_folder(), FONT_INDEX_FILE_NAME)
+            )
+            ImageDraw.font = FreeTypeFont(font_path, _font_size)
+        except (OSError, RuntimeError):
+            ImageDraw.font = load_default(_font_size)
@@ -0,0 +1,37 @@
+"""C extensions that interact with the Linux file system."""
+
+import os
+from collections.abc import Iterable
+
+if os.name != "nt":  # noqa: PYI002
+    def get_files_in_folder(folder_path: str, /) -> list[str]:
+        """Gets all files in a folder, not checking subfolders.
+
+        :param folder_path: The folder path to check.
+        :returns: A list of file names."""
+
+    def get_files_in_folder_with_suffixes(
+        folder_path: str, suffixes: Iterable[str], /
+    ) -> list[str]:
+        """Gets all files in a folder whose suffix, the text after the last dot,
+        case insensitively matches one of the provided suffixes.
+
+        :param folder_path: The folder path to check.
+        :param suffixes: Suffixes to keep, without the leading dot.
+        :returns: A list of file names."""
+
+    def get_file_stats_in_folder(
+        folder_path: str, file_names: Iterable[str], /
+    ) -> list[tuple[int, int] | None]:
+        """Stats many files in a folder in one call.
+
+        :param folder_path: The folder path containing the files.
+        :param file_names: Names of files relative to folder_path.
+        :returns: Modified time in nanoseconds and size in bytes for each file,
+        or None for files that could not be read."""
+
+    def get_folders_in_folder(folder_path: str, /) -> list[str]:
+        """Gets all folders in a folder, not following symlinks.
+
+        :param folder_path: The folder path to check.
+        :returns: A list of folder names."""
@@ -1,27 +1,80 @@
 """Conversion between image file types and representations."""
 
+import os
+from typing import Any
+
 from PIL.Image import Image
 from PIL.ImageSequence import Iterator as ImageIterator
 from PIL.JpegImagePlugin import RAWMODE as VALID_JPEG_MODES
 
 from image_viewer.constants import VALID_FILE_TYPES
-from image_viewer.image.image_io import DEFAULT_DURATION_MS
+from image_viewer.image.image_io import (
+    DEFAULT_DURATION_MS,
+    ImageIO,
+    ReadImageResponse,
+)
 from image_viewer.utils.PIL import image_is_animated
 
+# Encoder speeds go from 0, the smallest files, to 10, the fastest encoding
+MAX_ENCODER_SPEED: int = 10
+DEFAULT_QUALITY: int = 96
+# Encoder speed and quality of profiles available for any format
+BUILTIN_ENCODER_PROFILES: dict[str, tuple[int, int]] = {
+    "best": (0, DEFAULT_QUALITY),
+    "balanced": (5, DEFAULT_QUALITY),
+    "fast": (MAX_ENCODER_SPEED, DEFAULT_QUALITY),
+}
 
-def try_convert_image_and_save_new(
-    original_image: Image,
-    new_path: str,
+
+class ConvertCancelledError(Exception):
+    """Raised in the converting thread when a conversion is cancelled"""
+
+
+class ConvertProgress:
+    """Tracks frames read by a conversion running on another thread.
+    Setting cancelled stops the conversion before its next frame."""
+
+    __slots__ = ("cancelled", "frame", "frame_count")
+
+    def __init__(self) -> None:
+        self.frame: int = 0
+        self.frame_count: int = 1
+        self.cancelled: bool = False
+
+
+def get_encoder_profile(
     target_format: str,
-    quality: int = 96,
-) -> bool:
-    """Tries to convert image at old_path to a target format at new_path.
+    profile_name: str,
+    convert_profiles: dict[str, dict[str, tuple[int, int]]],
+) -> tuple[int, int]:
+    """Gets encoder settings for a profile, preferring those configured
+    for the target format over built in ones.
+
+    :param target_format: Format being converted to.
+    :param profile_name: Name of the profile or "" for the default.
+    :param convert_profiles: Profiles from config by format then name.
+    :returns: Encoder speed and quality.
+    :raises ValueError: If no profile has that name."""
+    profile_name = profile_name.lower() or "default"
+    profile: tuple[int, int] | None = convert_profiles.get(
+        target_format.lower(), {}
+    ).get(profile_name, BUILTIN_ENCODER_PROFILES.get(profile_name))
+
+    if profile is None:
+        if profile_name != "default":
+            raise ValueError
+        profile = BUILTIN_ENCODER_PROFILES["best"]
+
+    return profile
+
+
+def can_convert(original_image: Image, target_format: str) -> bool:
+    """Checks if an image is a different format than target_format and could be
+    converted to it, without converting.
 
     :param original_image: PIL image to convert
-    :param new_path: Path to save the new image to
     :param target_format: Format to convert to
-    :param quality: Quality 0-100 to pass to encoder
-    :returns: bool if conversion performed successfully
+    :returns: True if a conversion would be done
     :raises ValueError: If converting animated file to non-animated format"""
 
     if original_image.format is None:
@@ -35,34 +88,153 @@ def try_convert_image_and_save_new(
     if target_format not in VALID_FILE_TYPES or original_format[0] == target_format[0]:
         return False
 
-    save_kwargs: dict = {
-        "optimize": True,
+    if image_is_animated(original_image) and target_format not in (
+        "webp",
+        "gif",
+        "png",
+    ):
+        raise ValueError
+
+    return True
+
+
+def try_convert_image_and_save_new(
+    original_image: Image,
+    new_path: str,
+    target_format: str,
+    quality: int = DEFAULT_QUALITY,
+    speed: int = 0,
+    progress: ConvertProgress | None = None,
+) -> bool:
+    """Tries to convert image at old_path to a target format at new_path.
+
+    :param original_image: PIL image to convert
+    :param new_path: Path to save the new image to
+    :param target_format: Format to convert to
+    :param quality: Quality 0-100 to pass to encoder
+    :param speed: Encoder speed 0-MAX_ENCODER_SPEED, trading file size for time
+    :param progress: Updated as frames are read and checked for cancellation
+    :returns: bool if conversion performed successfully
+    :raises ValueError: If converting animated file to non-animated format
+    :raises ConvertCancelledError: If cancelled through progress. A partially
+    written file may be left at new_path"""
+
+    if not can_convert(original_image, target_format):
+        return False
+
+    target_format = target_format.lower()
+    save_kwargs: dict[str, Any] = {
+        "optimize": speed == 0,
         "quality": quality,
         "icc_profile": original_image.info.get("icc_profile"),
     }
 
-    if image_is_animated(original_image):
-        if target_format not in ("webp", "gif", "png"):
-            raise ValueError
+    if progress is not None:
+        progress.frame_count = getattr(original_image, "n_frames", 1)
 
+    image: Image = original_image
+    if image_is_animated(original_image):
+        frames: list[Image]
+        durations: list[int]
+        frames, durations = _read_frames(original_image, progress)
+        image = frames[0]
         save_kwargs["save_all"] = True
+        save_kwargs["append_images"] = frames[1:]
+        save_kwargs["duration"] = durations
         save_kwargs["loop"] = original_image.info.get("loop", 0)
 
-        save_kwargs["duration"] = [
-            frame.info.get("duration", DEFAULT_DURATION_MS)
-            for frame in ImageIterator(original_image)
-        ]
-
     match target_format:
         case "avif":
-            save_kwargs["speed"] = 0
+            save_kwargs["speed"] = speed
         case "jpg" | "jpeg" | "jif" | "jfif" | "jpe":
             target_format = "jpeg"
-            if original_image.mode not in VALID_JPEG_MODES:
-                original_image = original_image.convert("RGB")
+            if image.mode not in VALID_JPEG_MODES:
+                image = image.convert("RGB")
+        case "png":
+            if speed > 0:
+                save_kwargs["compress_level"] = 9 - speed * 8 // MAX_ENCODER_SPEED
         case "webp":
-            save_kwargs["method"] = 6
+            save_kwargs["method"] = 6 - speed * 6 // MAX_ENCODER_SPEED
 
-    original_image.save(new_path, target_format, **save_kwargs)
+    image.save(new_path, target_format, **save_kwargs)
+
+    if progress is not None:
+        if progress.cancelled:
+            raise ConvertCancelledError
+        progress.frame = progress.frame_count
 
     return True
+
+
+def convert_file(
+    original_path: str,
+    new_path: str,
+    target_format: str,
+    quality: int,
+    speed: int,
+    progress: ConvertProgress | None = None,
+) -> bool:
+    """Reads and converts an image, removing the new file if conversion failed
+    or was cancelled. Safe to run in worker threads and processes.
+
+    :param original_path: Path to the image to convert
+    :param new_path: Path to save the converted image to
+    :param target_format: Format to convert to
+    :param quality: Quality 0-100 to pass to encoder
+    :param speed: Encoder speed 0-MAX_ENCODER_SPEED
+    :param progress: Updated as frames are saved and checked for cancellation
+    :returns: True if the new image was saved"""
+
+    read_image_response: ReadImageResponse | None = ImageIO.read_image(original_path)
+    if read_image_response is None:
+        return False
+
+    try:
+        return try_convert_image_and_save_new(
+            read_image_response.image,
+            new_path,
+            target_format,
+            quality,
+            speed,
+            progress,
+        )
+    except (OSError, ValueError, ConvertCancelledError):
+        # Don't leave partially written files behind
+        if os.path.exists(new_path):
+            os.remove(new_path)
+        return False
+
+
+def _read_frames(
+    image: Image, progress: ConvertProgress | None
+) -> tuple[list[Image], list[int]]:
+    """Reads each frame of an animated image once so encoders are given every
+    frame and its duration instead of seeking the image themselves.
+
+    :param image: Animated image to read
+    :param progress: Updated as frames are read and checked for cancellation
+    :returns: A copy of each frame in the same mode and its duration in
+    milliseconds
+    :raises ConvertCancelledError: If cancelled through progress"""
+
+    frames: list[Image] = []
+    durations: list[int] = []
+    for frame in ImageIterator(image):
+        if progress is not None:
+            if progress.cancelled:
+                raise ConvertCancelledError
+            progress.frame = len(frames) + 1
+
+        frames.append(frame.copy())
+        durations.append(frame.info.get("duration", DEFAULT_DURATION_MS))
+
+    # Like GIF frames after the first, which are RGB or RGBA. Encoders
+    # expect every frame in one mode
+    modes: set[str] = {frame.mode for frame in frames}
+    if len(modes) > 1:
+        mode: str = "RGBA" if "RGBA" in modes else "RGB"
+        frames = [
+            frame if frame.mode == mode else frame.convert(mode) for frame in frames
+        ]
+
+    return frames, durations
@@ -0,0 +1,145 @@
+"""Index of installed fonts cached on disk so fonts are found without walking
+font folders on each launch. Like fontconfig, the index is rebuilt when the
+modified time of any folder it read changes."""
+
+import os
+
+if os.name == "nt":
+    from image_viewer.utils._os_nt import get_files_in_folder
+
+FONT_INDEX_FILE_NAME: str = "font_index.txt"
+# Modified time stored for folders that don't exist
+_MISSING_FOLDER_MTIME: int = -1
+
+
+class FontIndex:
+    """Maps font file names to their paths"""
+
+    __slots__ = ("folder_mtimes", "fonts")
+
+    def __init__(self, folder_mtimes: dict[str, int], fonts: dict[str, str]) -> None:
+        """:param folder_mtimes: Modified time in nanoseconds of each folder read.
+        :param fonts: Font file name to path of the first font with that name."""
+        self.folder_mtimes: dict[str, int] = folder_mtimes
+        self.fonts: dict[str, str] = fonts
+
+    @classmethod
+    def build(cls, font_folders: list[str]) -> "FontIndex":
+        """Finds every font in font folders and their subfolders.
+
+        :param font_folders: Folders to search, earlier folders take priority.
+        :returns: A new index."""
+        folder_mtimes: dict[str, int] = {}
+        fonts: dict[str, str] = {}
+
+        for font_folder in font_folders:
+            folder_mtimes[font_folder] = _get_mtime(font_folder)
+
+            if os.name == "nt":
+                for file in get_files_in_folder(font_folder):
+                    fonts.setdefault(file, os.path.join(font_folder, file))
+                continue
+
+            for root_folder, __, files in os.walk(font_folder):
+                folder_mtimes[root_folder] = _get_mtime(root_folder)
+                for file in files:
+                    fonts.setdefault(file, os.path.join(root_folder, file))
+
+        return cls(folder_mtimes, fonts)
+
+    @classmethod
+    def read(cls, index_path: str) -> "FontIndex | None":
+        """Reads an index saved by write.
+
+        :param index_path: Path to the saved index.
+        :returns: The index or None if it could not be read."""
+        folder_mtimes: dict[str, int] = {}
+        fonts: dict[str, str] = {}
+
+        try:
+            with open(index_path, encoding="utf-8") as fp:
+                for line in fp:
+                    kind, key, value = line.rstrip("\n").split("\t", 2)
+                    if kind == "D":
+                        folder_mtimes[value] = int(key)
+                    else:
+                        fonts[key] = value
+        except (OSError, ValueError):
+            return None
+
+        return cls(folder_mtimes, fonts)
+
+    def write(self, index_path: str) -> None:
+        """Saves the index, creating its folder if needed.
+
+        :param index_path: Path to save to."""
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+
+        with open(index_path, "w", encoding="utf-8") as fp:
+            fp.writelines(
+                f"D\t{mtime}\t{folder}\n"
+                for folder, mtime in self.folder_mtimes.items()
+            )
+            fp.writelines(f"F\t{name}\t{path}\n" for name, path in self.fonts.items())
+
+    def is_current(self, font_folders: list[str]) -> bool:
+        """Checks if fonts were added or removed since the index was built.
+
+        :param font_folders: Folders that would be searched if rebuilt.
+        :returns: True if every folder read is unchanged."""
+        return all(
+            font_folder in self.folder_mtimes for font_folder in font_folders
+        ) and all(
+            _get_mtime(folder) == mtime for folder, mtime in self.folder_mtimes.items()
+        )
+
+
+def find_font_path(font_file: str, index_path: str) -> str:
+    """Finds a font using the index at index_path, rebuilding it if stale.
+
+    :param font_file: Name of the font file, like arial.ttf.
+    :param index_path: Path the index is cached at.
+    :returns: Path to the font.
+    :raises RuntimeError: If the font is not installed."""
+    font_folders: list[str] = get_font_folders()
+
+    font_index: FontIndex | None = FontIndex.read(index_path)
+    if font_index is None or not font_index.is_current(font_folders):
+        font_index = FontIndex.build(font_folders)
+        try:
+            font_index.write(index_path)
+        except OSError:
+            pass  # Fonts are still found, just not cached
+
+    font_path: str | None = font_index.fonts.get(font_file)
+    if font_path is None:
+        raise RuntimeError(f"Can't find font {font_file}, try adjusting config.ini")
+
+    return font_path
+
+
+def get_font_folders() -> list[str]:
+    """:returns: Folders fonts are installed to on this system."""
+    if os.name == "nt":
+        windir: str | None = os.environ.get("WINDIR")
+        return [os.path.join(windir, "fonts")] if windir else []
+
+    data_home: str | None = os.environ.get("XDG_DATA_HOME")
+    if not data_home:
+        data_home = os.path.expanduser("~/.local/share")
+
+    data_dirs: str | None = os.environ.get("XDG_DATA_DIRS")
+    if not data_dirs:
+        data_dirs = "/usr/local/share:/usr/share"
+
+    parent_folders: list[str] = [data_home, *data_dirs.split(":")]
+    return [os.path.join(p, "fonts") for p in parent_folders]
+
+
+def _get_mtime(folder: str) -> int:
+    """:returns: Modified time of a folder in nanoseconds or a placeholder
+    if it doesn't exist."""
+    try:
+        return os.stat(folder).st_mtime_ns
+    except OSError:
+        return _MISSING_FOLDER_MTIME
@@ -2,6 +2,10 @@
 
 import os
 from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
 
 if os.name == "nt":
     from ctypes import windll  # type: ignore[attr-defined]
@@ -14,6 +18,57 @@ if os.name == "nt":
         trash_file,
     )
 
+    def get_files_in_folder_with_suffixes(
+        folder_path: str, suffixes: Iterable[str], /
+    ) -> list[str]:
+        """Gets all files in a folder whose suffix, the text after the last dot,
+        case insensitively matches one of the provided suffixes.
+
+        :param folder_path: The folder path to check.
+        :param suffixes: Suffixes to keep, without the leading dot.
+        :returns: A list of file names."""
+        suffix_set: set[str] = {suffix.lower() for suffix in suffixes}
+
+        return [
+            file
+            for file in get_files_in_folder(folder_path)
+            if "." in file and file[file.rfind(".") + 1 :].lower() in suffix_set
+        ]
+
+    def get_file_stats_in_folder(
+        folder_path: str, file_names: Iterable[str], /
+    ) -> list[tuple[int, int] | None]:
+        """Stats many files in a folder.
+
+        :param folder_path: The folder path containing the files.
+        :param file_names: Names of files relative to folder_path.
+        :returns: Modified time in nanoseconds and size in bytes for each file,
+        or None for files that could not be read."""
+        stats: list[tuple[int, int] | None] = []
+        for file_name in file_names:
+            try:
+                stat: os.stat_result = os.stat(os.path.join(folder_path, file_name))
+                stats.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                stats.append(None)
+
+        return stats
+
+    def get_folders_in_folder(folder_path: str, /) -> list[str]:
+        """Gets all folders in a folder, not following symlinks.
+
+        :param folder_path: The folder path to check.
+        :returns: A list of folder names."""
+        try:
+            with os.scandir(folder_path) as scandir_iter:
+                return [
+                    entry.name
+                    for entry in scandir_iter
+                    if entry.is_dir(follow_symlinks=False)
+                ]
+        except OSError:
+            return []
+
 else:  # assume linux for now
     import re
     from configparser import ConfigParser
@@ -28,6 +83,13 @@ else:  # assume linux for now
         send2trash as trash_file,  # noqa: F401
     )
 
+    from image_viewer.utils._os_linux import (
+        get_file_stats_in_folder,  # noqa: F401
+        get_files_in_folder,
+        get_files_in_folder_with_suffixes,  # noqa: F401
+        get_folders_in_folder,  # noqa: F401
+    )
+
     TRASH_INFO: str = f"{HOMETRASH}/info/"
 
     # TODO: Port this to C and see if its faster
@@ -94,26 +156,28 @@ else:  # assume linux for now
         suffix_start: int = file_name.find(".")
         return _split_str_at_index(file_name, suffix_start)
 
-    def get_files_in_folder(folder_path: str, /) -> Iterable[str]:
-        """Yields each file in a folder. Edited version of OS module implementation.
 
-        :params folder_path: A path to a folder.
-        :returns: The iterator over that folder."""
+def get_process_context() -> "BaseContext":
+    """Gets the context worker processes should be started from.
+    Forking a process running Tk is unsafe, so workers start fresh.
+
+    :returns: Spawn on Windows, otherwise forkserver."""
+    from multiprocessing import get_context
+
+    return get_context("spawn" if os.name == "nt" else "forkserver")
 
-        with os.scandir(folder_path) as scandir_iter:
-            while True:
-                try:
-                    entry = next(scandir_iter)
-                except (StopIteration, OSError):
-                    return
 
-                try:
-                    is_dir = entry.is_dir()
-                except OSError:
-                    is_dir = False
+def get_cache_folder() -> str:
+    """Gets the folder data is cached in between launches. It may not exist yet.
+
+    :returns: A folder in LOCALAPPDATA on Windows, otherwise in XDG_CACHE_HOME."""
+    cache_home: str | None = os.environ.get(
+        "LOCALAPPDATA" if os.name == "nt" else "XDG_CACHE_HOME"
+    )
+    if not cache_home:
+        cache_home = os.path.expanduser("~/.cache")
 
-                if not is_dir:
-                    yield entry.name
+    return os.path.join(cache_home, "personal_image_viewer")
 
 
 def file_name_compare(a: str, b: str) -> bool:
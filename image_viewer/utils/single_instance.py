@@ -0,0 +1,134 @@
+"""Lets a running viewer open images for later launches, so they exit without
+starting Tk or PIL. Uses a UNIX socket, so only available on Linux.
+
+This is imported before anything else when a launch sends its image, so it
+should stay light on imports."""
+
+import os
+import socket
+
+SOCKET_FILE_NAME: str = "personal_image_viewer.sock"
+# How long a running viewer waits for a path before giving up on a launch
+RECEIVE_TIMEOUT_MS: int = 1000
+_RECEIVE_SIZE: int = 4096
+
+
+def get_socket_path() -> str:
+    """:returns: Path of the socket in XDG_RUNTIME_DIR, which only this user
+    can access, or in /tmp named with this user's id."""
+    runtime_folder: str | None = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_folder:
+        return os.path.join(runtime_folder, SOCKET_FILE_NAME)
+
+    return f"/tmp/{os.getuid()}-{SOCKET_FILE_NAME}"  # noqa: S108
+
+
+def send_path_to_running_viewer(socket_path: str, image_path: str) -> bool:
+    """Asks a running viewer to open an image.
+
+    :param socket_path: Path of the running viewer's socket.
+    :param image_path: Absolute path to the image.
+    :returns: True if a running viewer received the path."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+            client.sendall(os.fsencode(image_path))
+    except OSError:
+        return False
+
+    return True
+
+
+class InstanceServer:
+    """Listens for paths sent by later launches"""
+
+    __slots__ = ("_socket", "socket_path")
+
+    def __init__(self, socket_path: str) -> None:
+        """:param socket_path: Path to listen at, replacing any left by a
+        viewer that didn't exit cleanly.
+        :raises OSError: If the socket can't be created."""
+        self.socket_path: str = socket_path
+
+        try:
+            os.remove(socket_path)
+        except FileNotFoundError:
+            pass
+
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._socket.bind(socket_path)
+            os.chmod(socket_path, 0o600)
+            self._socket.listen()
+            # Accepting is only attempted when readable, but never wait on it
+            self._socket.setblocking(False)
+        except OSError:
+            self._socket.close()
+            raise
+
+    def fileno(self) -> int:
+        """:returns: File descriptor of the socket, readable when a launch
+        connects."""
+        return self._socket.fileno()
+
+    def accept(self) -> "SentPathConnection | None":
+        """Accepts a launch that connected without waiting for its path.
+
+        :returns: The connection or None if accepting failed."""
+        try:
+            connection, _ = self._socket.accept()
+        except OSError:
+            return None
+
+        return SentPathConnection(connection)
+
+    def close(self) -> None:
+        """Stops listening and removes the socket."""
+        self._socket.close()
+        try:
+            os.remove(self.socket_path)
+        except OSError:
+            pass
+
+
+class SentPathConnection:
+    """A launch's connection, read without blocking as its path arrives"""
+
+    __slots__ = ("_chunks", "_socket")
+
+    def __init__(self, connection: socket.socket) -> None:
+        connection.setblocking(False)
+        self._socket: socket.socket = connection
+        self._chunks: list[bytes] = []
+
+    @property
+    def closed(self) -> bool:
+        return self._socket.fileno() == -1
+
+    @property
+    def path(self) -> str | None:
+        """:returns: The path sent, which is only complete once receive
+        returns True, or None if nothing was received."""
+        return os.fsdecode(b"".join(self._chunks)) or None
+
+    def fileno(self) -> int:
+        """:returns: File descriptor of the connection, readable when more
+        of the path arrives."""
+        return self._socket.fileno()
+
+    def receive(self) -> bool:
+        """Reads what has arrived of the path.
+
+        :returns: True once the launch has sent the whole path or failed."""
+        try:
+            while chunk := self._socket.recv(_RECEIVE_SIZE):
+                self._chunks.append(chunk)
+        except BlockingIOError:
+            return False
+        except OSError:
+            self._chunks.clear()
+
+        return True
+
+    def close(self) -> None:
+        self._socket.close()
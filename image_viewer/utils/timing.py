@@ -0,0 +1,248 @@
+"""Records how long each stage of loading an image takes and spans of work
+on each thread, exported as Chrome trace events."""
+
+import os
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from threading import current_thread, get_ident, get_native_id
+from time import perf_counter, perf_counter_ns
+from typing import Any
+
+# How many image loads are kept to export
+MAX_RECORDED_LOADS: int = 1000
+# How many spans are kept to export, oldest are dropped in long sessions
+MAX_TRACE_EVENTS: int = 200_000
+
+
+class ImageLoadTimings:
+    """Time spent in each stage of loading one image"""
+
+    __slots__ = ("details", "path", "stages")
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        # Stage name to milliseconds, in the order stages ran
+        self.stages: dict[str, float] = {}
+        # Stage name to how it ran, like the resampling used to resize
+        self.details: dict[str, str] = {}
+
+    def format(self) -> str:
+        """:returns: A line per stage with its time and details."""
+        lines: list[str] = []
+        for stage in dict.fromkeys((*self.stages, *self.details)):
+            detail: str | None = self.details.get(stage)
+            name: str = stage if detail is None else f"{stage} ({detail})"
+            ms: float | None = self.stages.get(stage)
+            lines.append(name if ms is None else f"{name}: {ms:.1f} ms")
+
+        return "\n".join(lines)
+
+
+class StageTimer:
+    """Times stages of image loads when enabled. Only stages on the thread that
+    began the load are recorded so background work doesn't skew them."""
+
+    __slots__ = ("_thread_id", "current", "enabled", "history")
+
+    def __init__(self) -> None:
+        self.enabled: bool = False
+        self.current: ImageLoadTimings | None = None
+        self.history: deque[ImageLoadTimings] = deque(maxlen=MAX_RECORDED_LOADS)
+        self._thread_id: int = 0
+
+    def toggle(self) -> None:
+        """Enables or disables timing, ending the current load's timings."""
+        self.enabled = not self.enabled
+        self.current = None
+
+    def begin(self, path: str) -> None:
+        """Starts recording timings of loading an image on this thread.
+
+        :param path: Path to the image being loaded."""
+        if not self.enabled:
+            return
+
+        self.current = ImageLoadTimings(path)
+        self.history.append(self.current)
+        self._thread_id = get_ident()
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """Adds the time spent in the with block to a stage of the current load.
+
+        :param stage: Name of the stage."""
+        current: ImageLoadTimings | None = self.current
+        if current is None or get_ident() != self._thread_id:
+            yield
+            return
+
+        start: float = perf_counter()
+        try:
+            yield
+        finally:
+            current.stages[stage] = current.stages.get(stage, 0.0) + (
+                (perf_counter() - start) * 1000
+            )
+
+    def note(self, stage: str, detail: str) -> None:
+        """Describes how a stage of the current load ran.
+
+        :param stage: Name of the stage.
+        :param detail: Short description, like the resampling used."""
+        current: ImageLoadTimings | None = self.current
+        if current is not None and get_ident() == self._thread_id:
+            current.details[stage] = detail
+
+    def export(self, path: str) -> None:
+        """Writes timings of recorded loads to a JSON file.
+
+        :param path: Path to write to."""
+        import json
+
+        with open(path, "w", encoding="utf-8") as fp:
+            json.dump(
+                [
+                    {
+                        "path": timings.path,
+                        "stages_ms": timings.stages,
+                        "details": timings.details,
+                    }
+                    for timings in self.history
+                ],
+                fp,
+                indent=1,
+            )
+
+
+class SpanTracer:
+    """Records spans of work on every thread when enabled. Exported in the
+    Chrome trace format, which trace viewers like Perfetto can open."""
+
+    __slots__ = ("_process_names", "_thread_names", "enabled", "events")
+
+    def __init__(self) -> None:
+        self.enabled: bool = False
+        self.events: deque[dict[str, Any]] = deque(maxlen=MAX_TRACE_EVENTS)
+        # (pid, tid) to name of each thread seen, shown by trace viewers
+        self._thread_names: dict[tuple[int, int], str] = {}
+        self._process_names: dict[int, str] = {os.getpid(): "Image Viewer"}
+
+    @contextmanager
+    def span(self, name: str, detail: str = "") -> Iterator[None]:
+        """Records the with block as a span on the current thread.
+
+        :param name: Name of the span.
+        :param detail: Extra info shown with the span, like an image path."""
+        if not self.enabled:
+            yield
+            return
+
+        start_ns: int = perf_counter_ns()
+        try:
+            yield
+        finally:
+            thread_id: int = get_native_id()
+            self._thread_names.setdefault(
+                (os.getpid(), thread_id), current_thread().name
+            )
+            self.add_span(
+                name, start_ns, perf_counter_ns(), os.getpid(), thread_id, detail
+            )
+
+    def add_span(
+        self,
+        name: str,
+        start_ns: int,
+        end_ns: int,
+        process_id: int,
+        thread_id: int,
+        detail: str = "",
+    ) -> None:
+        """Records a span that already ended, possibly in another process.
+
+        :param name: Name of the span.
+        :param start_ns: perf_counter_ns when the span started.
+        :param end_ns: perf_counter_ns when the span ended.
+        :param process_id: Process the span ran in.
+        :param thread_id: Native id of the thread the span ran on.
+        :param detail: Extra info shown with the span."""
+        event: dict[str, Any] = {
+            "name": name,
+            "ph": "X",
+            "ts": start_ns / 1000,
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": process_id,
+            "tid": thread_id,
+        }
+        if detail:
+            event["args"] = {"detail": detail}
+
+        self.events.append(event)
+
+    def name_process(self, process_id: int, name: str) -> None:
+        """Names a process, like a worker, in exported traces.
+
+        :param process_id: Id of the process.
+        :param name: Name to show."""
+        self._process_names[process_id] = name
+
+    def export(self, path: str) -> None:
+        """Writes recorded spans to a Chrome trace JSON file.
+
+        :param path: Path to write to."""
+        # Copied since threads still tracing add names while exporting
+        process_names: dict[int, str] = dict(self._process_names)
+        thread_names: dict[tuple[int, int], str] = dict(self._thread_names)
+
+        metadata: list[dict[str, Any]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": process_id,
+                "args": {"name": name},
+            }
+            for process_id, name in process_names.items()
+        ]
+        metadata += [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": process_id,
+                "tid": thread_id,
+                "args": {"name": name},
+            }
+            for (process_id, thread_id), name in thread_names.items()
+        ]
+
+        import json
+
+        with open(path, "w", encoding="utf-8") as fp:
+            json.dump(
+                {"traceEvents": metadata + list(self.events)},
+                fp,
+                separators=(",", ":"),
+            )
+
+
+def traced[**P, R](function: Callable[P, R]) -> Callable[P, R]:
+    """Records each call of the decorated function as a span.
+
+    :param function: Function to trace.
+    :returns: The wrapped function."""
+    name: str = function.__qualname__
+
+    @wraps(function)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        if not span_tracer.enabled:
+            return function(*args, **kwargs)
+
+        with span_tracer.span(name):
+            return function(*args, **kwargs)
+
+    return wrapper
+
+
+stage_timer: StageTimer = StageTimer()
+span_tracer: SpanTracer = SpanTracer()
@@ -1,9 +1,10 @@
 import os
+import tkinter as tk
 from collections.abc import Callable
 from time import perf_counter
-from tkinter import Event, Tk
+from tkinter import CallWrapper, Event, Tk
 from tkinter.font import Font
-from typing import Never
+from typing import TYPE_CHECKING, Never
 
 from PIL.Image import Image
 from PIL.ImageTk import PhotoImage
@@ -14,12 +15,13 @@ from image_viewer.files.file_manager import ImageFileManager
 from image_viewer.image.cache import ImageCache
 from image_viewer.image.image_io import AnimationFrame, ImageIO
 from image_viewer.ui.button import HoverableButtonUIElement, ToggleableButtonUIElement
-from image_viewer.ui.button_icon_factory import ButtonIconFactory
 from image_viewer.ui.canvas import CustomCanvas
 from image_viewer.ui.image import DropdownImageUIElement
 from image_viewer.ui.rename_entry import RenameEntry
-from image_viewer.utils.os import ask_yes_no, show_info
+from image_viewer.utils.convert import ConvertProgress
+from image_viewer.utils.os import ask_yes_no, get_cache_folder, show_info
 from image_viewer.utils.PIL import create_dropdown_image, init_PIL
+from image_viewer.utils.timing import ImageLoadTimings, span_tracer, stage_timer
 
 if os.name == "nt":
     from image_viewer.utils._os_nt import (
@@ -29,9 +31,53 @@ if os.name == "nt":
         read_buffer_as_base64_and_copy_to_clipboard,
     )
 else:
-    import binascii
     from tkinter import PhotoImage as tkPhotoImage
 
+    from image_viewer.image._read import encode_as_base64
+
+if TYPE_CHECKING:
+    from image_viewer.files.background_convert import BackgroundConverter
+    from image_viewer.files.base64_export import BackgroundBase64Exporter
+    from image_viewer.files.batch_convert import BatchConverter
+    from image_viewer.image.decode_pool import DecodePool
+    from image_viewer.utils.single_instance import (
+        InstanceServer,
+        SentPathConnection,
+    )
+
+
+# How long the mouse wheel must stop before a zoom preview is replaced
+ZOOM_SETTLE_MS: int = 150
+# How often to check if the zoom level replacing a preview finished resizing
+ZOOM_LOAD_POLL_MS: int = 16
+# Files in the cache folder that timings of image loads and traced spans are
+# written to when timing is toggled off
+TIMINGS_EXPORT_FILE_NAME: str = "image_load_timings.json"
+TRACE_EXPORT_FILE_NAME: str = "image_viewer_trace.json"
+
+
+class TracedCallWrapper(CallWrapper):
+    """Records Tk callbacks, like after calls, as spans when tracing. Only
+    installed while tracing so other callbacks don't pay for the check"""
+
+    def __call__(self, *args: object) -> object:
+        if not span_tracer.enabled:
+            return super().__call__(*args)
+
+        with span_tracer.span(getattr(self.func, "__name__", "tk_callback")):
+            return super().__call__(*args)
+
+
+def _set_tracing(enabled: bool) -> None:
+    """Starts or stops tracing spans. Tk wraps Python callbacks in
+    tkinter.CallWrapper when registering them, so only callbacks registered
+    while tracing, like after calls, are traced. CallWrapper is shared by
+    every Tk root in the process, so the original must be restored"""
+    span_tracer.enabled = enabled
+    tk.CallWrapper = (  # type: ignore[misc]
+        TracedCallWrapper if enabled else CallWrapper
+    )
+
 
 class ViewerApp:
     """Main UI class handling IO and on screen widgets"""
@@ -39,22 +85,33 @@ class ViewerApp:
     __slots__ = (
         "animation_id",
         "app",
+        "base64_exporter",
+        "batch_convert_id",
+        "batch_converter",
         "canvas",
+        "convert_id",
+        "converter",
+        "decode_pool",
         "dropdown",
         "file_manager",
         "height_ratio",
         "image_io",
         "image_load_id",
+        "instance_server",
         "move_id",
         "rename_entry",
         "width_ratio",
+        "zoom_id",
     )
 
-    def __init__(self, first_image_path: str) -> None:
-        config: Config = parse_config_file()
+    def __init__(self, first_image_path: str, config: Config | None = None) -> None:
+        """:param first_image_path: Path to the image shown first.
+        :param config: Parsed config, read from config.ini if None."""
+        if config is None:
+            config = parse_config_file()
         image_cache: ImageCache = ImageCache(config.cache_size)
         self.file_manager: ImageFileManager = ImageFileManager(
-            first_image_path, image_cache
+            first_image_path, image_cache, config.convert_profiles, config.undo_depth
         )
         try:
             self.file_manager.validate_current_path()
@@ -64,6 +121,18 @@ class ViewerApp:
         self.move_id: str = ""
         self.image_load_id: str = ""
         self.animation_id: str = ""
+        self.zoom_id: str = ""
+        self.base64_exporter: BackgroundBase64Exporter | None = None
+        self.batch_convert_id: str = ""
+        self.batch_converter: BatchConverter | None = None
+        self.convert_id: str = ""
+        self.converter: BackgroundConverter | None = None
+        self.instance_server: InstanceServer | None = None
+
+        # Bound before the slow parts of startup so later launches send their
+        # image here instead of starting another viewer
+        if config.ui_single_instance and os.name != "nt":
+            self._bind_instance_server()
 
         self.app: Tk = self._setup_tk()
 
@@ -77,6 +146,16 @@ class ViewerApp:
         self.height_ratio: float = screen_height / 1080
         self.width_ratio: float = screen_width / 1920
 
+        self.image_io: ImageIO = ImageIO(
+            screen_width, screen_height, image_cache, self.animation_loop
+        )
+        self.decode_pool: DecodePool | None = None
+
+        init_PIL(config.ui_font, self._scale_pixels_to_height(23))
+
+        # Everything after this is not needed to show the first image
+        first_image_shown: bool = self._show_first_image()
+
         self._load_assets(
             self.canvas,
             config.ui_font,
@@ -84,16 +163,20 @@ class ViewerApp:
             self._scale_pixels_to_height(32),
         )
 
-        self.image_io: ImageIO = ImageIO(
-            screen_width, screen_height, image_cache, self.animation_loop
-        )
-
-        init_PIL(config.ui_font, self._scale_pixels_to_height(23))
+        if config.decode_processes > 0 and os.name != "nt":
+            self.decode_pool = self._create_decode_pool(
+                config.decode_processes, screen_width, screen_height, image_cache
+            )
 
-        self._init_image_display()
+        self._init_image_display(first_image_shown)
 
         self._add_binds_to_tk(config)
 
+        if self.instance_server is not None:
+            self.app.tk.createfilehandler(
+                self.instance_server, tk.READABLE, self.accept_sent_image
+            )
+
     @staticmethod
     def _setup_tk() -> Tk:
         """Creates and setups Tk class"""
@@ -111,19 +194,29 @@ class ViewerApp:
 
         return app
 
-    def _init_image_display(self) -> None:
-        """Loads first image and then finds all images files in the directory"""
+    def _show_first_image(self) -> bool:
+        """Loads and displays the first image before other images are found
+        or the topbar is created so it is on screen as soon as possible.
+
+        :returns: True if the first image loaded"""
         # Don't call this class's load_image here since we only consider there
         # to be one image now, and that function would throw if that one failed to load
         image: Image | None = self._load_image_at_current_path()
 
-        if image is not None:
-            self.update_after_image_load(image)
+        if image is None:
+            return False
+
+        self.update_after_image_load(image)
+        return True
 
+    def _init_image_display(self, first_image_shown: bool) -> None:
+        """Finds all images files in the directory after the first image is shown
+
+        :param first_image_shown: If the first image loaded. If not, the next
+        image is loaded once all images are found"""
         self.file_manager.update_files_with_known_starting_image()
 
-        # if first load failed, load new one now that all other images are found
-        if image is None:
+        if not first_image_shown:
             self.load_image()
 
     def _add_binds_to_tk(self, config: Config) -> None:
@@ -137,10 +230,14 @@ class ViewerApp:
             config.kb_copy_to_clipboard_as_base64,
             self.copy_to_clipboard_as_base64,
         )
+        app.bind(config.kb_cycle_sort_mode, self.cycle_sort_mode)
+        app.bind(config.kb_export_as_data_uri, self.export_as_data_uri)
         app.bind(config.kb_refresh, self.refresh)
         app.bind(config.kb_reload_image, lambda _: self.load_image_unblocking())
         app.bind(config.kb_rename, self.toggle_show_rename_window)
         app.bind(config.kb_show_details, self.show_details)
+        app.bind(config.kb_toggle_recursive_browsing, self.toggle_recursive_browsing)
+        app.bind(config.kb_toggle_timings, self.toggle_timings)
         app.bind(config.kb_move_to_new_file, self.move_to_new_file)
         app.bind(config.kb_undo_most_recent_action, self.undo_most_recent_action)
         app.bind(config.kb_optimize_image, self.optimize_current_image)
@@ -180,6 +277,26 @@ class ViewerApp:
 
         self.canvas.tag_bind(TkTags.BACKGROUND, "<Button-1>", self.handle_canvas_click)
 
+    @staticmethod
+    def _create_decode_pool(
+        processes: int, screen_width: int, screen_height: int, image_cache: ImageCache
+    ) -> "DecodePool":
+        """Starts worker processes that decode images near the current one"""
+        from image_viewer.image.decode_pool import DecodePool
+
+        return DecodePool(processes, screen_width, screen_height, image_cache)
+
+    def _bind_instance_server(self) -> None:
+        """Listens for images sent by later launches, continuing without
+        if the socket can't be created. Images sent before Tk handles the
+        socket wait in its backlog"""
+        from image_viewer.utils.single_instance import InstanceServer, get_socket_path
+
+        try:
+            self.instance_server = InstanceServer(get_socket_path())
+        except OSError:
+            pass
+
     def _load_assets(
         self,
         canvas: CustomCanvas,
@@ -189,6 +306,8 @@ class ViewerApp:
     ) -> None:
         """Load all assets on topbar and create canvas items"""
 
+        from image_viewer.ui.button_icon_factory import ButtonIconFactory
+
         icon_size: int = topbar_height + (topbar_height % 2)  # ensure even number
 
         font_family: str = font_file[:-4].lower()  # -4 chops extension .ttf/.otf
@@ -196,7 +315,7 @@ class ViewerApp:
         font = Font(family=font_family, size=-self._scale_pixels_to_height(18))
         self.canvas.font = font
 
-        button_icon_factory = ButtonIconFactory(icon_size)
+        button_icon_factory = ButtonIconFactory(icon_size, get_cache_folder())
 
         canvas.create_topbar(button_icon_factory.make_topbar_image(screen_width))
         # weird case, scale x offset by height, not width, since icon to its left
@@ -262,7 +381,10 @@ class ViewerApp:
 
     def start(self) -> None:
         """Starts tkinter main loop"""
-        self.app.mainloop()
+        try:
+            self.app.mainloop()
+        finally:
+            _set_tracing(False)
 
     def unresponsive_long_running_process[*Ts, R](
         self, function: Callable[[*Ts], R], *args: *Ts
@@ -304,8 +426,10 @@ class ViewerApp:
         forward_scroll: bool = event.delta > 0 if os.name == "nt" else event.num == 4
 
         if right_mouse_held:
-            self.load_zoomed_image_unblocking(
-                ZoomDirection.IN if forward_scroll else ZoomDirection.OUT
+            self.zoom_around_cursor(
+                ZoomDirection.IN if forward_scroll else ZoomDirection.OUT,
+                event.x,
+                event.y,
             )
         else:
             self.move(Movement.BACKWARD if forward_scroll else Movement.FORWARD)
@@ -353,7 +477,14 @@ class ViewerApp:
             self.move_id = self.app.after(ms, self._repeat_move, move_amount, 200)
 
     def handle_esc(self, _: Event) -> None:
-        """Closes rename window, then program on hitting escape"""
+        """Cancels conversions, closes rename window,
+        then program on hitting escape"""
+        if self.converter is not None:
+            self.cancel_convert()
+            return
+        if self.batch_converter is not None:
+            self.cancel_batch_convert()
+            return
         if self.canvas.is_widget_visible(self.rename_entry.id):
             self.hide_rename_window()
             return
@@ -386,15 +517,41 @@ class ViewerApp:
         if os.name == "nt":
             read_buffer_as_base64_and_copy_to_clipboard(self.image_io.image_view)
         else:
-            # TODO: See if I can use memoryview for clipboard_append
-            # so conversion can be in C
-            image_base64: str = binascii.b2a_base64(
-                self.image_io.image_view.view, newline=False
-            ).decode("ascii", errors="ignore")
+            image_base64: str = encode_as_base64(self.image_io.image_view)
 
             self.app.clipboard_clear()
             self.app.clipboard_append(image_base64)
 
+    def export_as_data_uri(self, _: Event) -> None:
+        """Writes a data URI of the current image next to it in the background.
+        Ignored while a previous export is running"""
+        if self.base64_exporter is not None:
+            return
+
+        from image_viewer.files.base64_export import (
+            DATA_URI_SUFFIX,
+            BackgroundBase64Exporter,
+        )
+
+        self.base64_exporter = BackgroundBase64Exporter(
+            self.image_io.image_view,
+            self.file_manager.path_to_image + DATA_URI_SUFFIX,
+        )
+        self._poll_base64_export()
+
+    def _poll_base64_export(self) -> None:
+        """Shows progress until the export finishes."""
+        if self.base64_exporter is None:
+            return
+
+        if self.base64_exporter.finished:
+            self.base64_exporter = None
+            self._hide_progress()
+            return
+
+        self._show_progress("Exporting data URI")
+        self.app.after(100, self._poll_base64_export)
+
     def show_details(self, _: Event | None = None) -> None:
         """Gets details on image and shows it in a UI popup"""
         details: str | None = self.file_manager.get_current_image_details(
@@ -420,6 +577,52 @@ class ViewerApp:
 
         self._start_image_load(self.load_zoomed_image, direction)
 
+    def zoom_around_cursor(self, direction: ZoomDirection, x: int, y: int) -> None:
+        """Shows a fast preview of the next zoom level with the cursor over the same
+        part of the image, then loads the zoom level once zooming stops.
+
+        :param direction: Direction to zoom in.
+        :param x: X coord of the cursor.
+        :param y: Y coord of the cursor."""
+        if not self.image_io.zoom_allowed:
+            return
+
+        preview: Image | None = self.image_io.get_zoom_preview(direction)
+        if preview is None:
+            return
+
+        if self.image_io.zoom_level == 0:
+            self._update_image_display(preview)  # Re-center when fully zoomed out
+        else:
+            self.canvas.update_existing_image_display_around(PhotoImage(preview), x, y)
+
+        if self.zoom_id != "":
+            self.app.after_cancel(self.zoom_id)
+            self.zoom_id = ""
+
+        if not self.image_io.zoom_level_cached:
+            self.zoom_id = self.app.after(
+                ZOOM_SETTLE_MS, self.load_zoomed_image_at_current_level
+            )
+
+    def load_zoomed_image_at_current_level(self) -> None:
+        """Resizes the zoom level the preview is showing on another thread
+        and replaces the preview once done"""
+        self.image_io.begin_zoom_level_load()
+        self.zoom_id = self.app.after(ZOOM_LOAD_POLL_MS, self._poll_zoomed_image)
+
+    def _poll_zoomed_image(self) -> None:
+        """Displays the current zoom level once resized"""
+        if self.image_io.zoom_level_loading:
+            self.zoom_id = self.app.after(ZOOM_LOAD_POLL_MS, self._poll_zoomed_image)
+            return
+
+        self.zoom_id = ""
+        # Cached by now, unless too large, which is handled here
+        zoomed_image: Image | None = self.image_io.get_zoomed_image_at_current_level()
+        if zoomed_image is not None:
+            self._update_existing_image_display(zoomed_image)
+
     # End functions handling specific user input
 
     def move_to_new_file(self, _: Event) -> None:
@@ -427,6 +630,50 @@ class ViewerApp:
         if self.file_manager.move_to_new_file():
             self.load_image()
 
+    def accept_sent_image(self, *_: object) -> None:
+        """Accepts a later launch and reads the image it sends as it arrives,
+        so a launch that stalls doesn't block the UI"""
+        if self.instance_server is None:
+            return
+
+        connection: SentPathConnection | None = self.instance_server.accept()
+        if connection is None:
+            return
+
+        from image_viewer.utils.single_instance import RECEIVE_TIMEOUT_MS
+
+        self.app.tk.createfilehandler(
+            connection,
+            tk.READABLE,
+            lambda *_: self._receive_sent_image(connection),
+        )
+        self.app.after(RECEIVE_TIMEOUT_MS, self._close_sent_image, connection)
+
+    def _receive_sent_image(self, connection: "SentPathConnection") -> None:
+        """Opens the image sent over a connection once all of its path arrives"""
+        if connection.receive():
+            self._close_sent_image(connection)
+            self.open_sent_image(connection.path)
+
+    def _close_sent_image(self, connection: "SentPathConnection") -> None:
+        """Stops reading from a connection if not already stopped"""
+        if not connection.closed:
+            self.app.tk.deletefilehandler(connection)
+            connection.close()
+
+    def open_sent_image(self, path: str | None) -> None:
+        """Opens an image sent by a later launch and brings the viewer to the
+        front. Images cached from the current folder are reused"""
+        if path is None or not os.path.isfile(path):
+            return
+
+        self.file_manager.move_to_path(path)
+        self.load_image()
+
+        self.app.deiconify()
+        self.app.lift()
+        self.app.focus_force()
+
     def exit(self, exit_code: int = 0) -> Never:
         """Safely exits the program.
 
@@ -435,10 +682,25 @@ class ViewerApp:
         if hasattr(self, "canvas"):
             self.canvas.delete(self.canvas.file_name_text_id)
 
+        if stage_timer.enabled:
+            self._export_timings()
+
         try:
+            if self.instance_server is not None:
+                self.instance_server.close()
             self.app.quit()
             self.app.destroy()
             self.image_io.reset_and_setup()
+            if self.decode_pool is not None:
+                self.decode_pool.stop()
+            if self.batch_converter is not None:
+                self.batch_converter.cancel()
+            # Not waited on since the thread is a daemon and
+            # removes its partial file if it gets to stop
+            if self.converter is not None:
+                self.converter.cancel()
+            if self.base64_exporter is not None:
+                self.base64_exporter.wait()
         except AttributeError:
             pass
 
@@ -462,6 +724,41 @@ class ViewerApp:
             self.exit()
         self.load_image_unblocking()
 
+    def cycle_sort_mode(self, _: Event) -> None:
+        """Sorts images by the next sort mode, staying on the current image"""
+        self.unresponsive_long_running_process(self.file_manager.cycle_sort_mode)
+
+    def toggle_recursive_browsing(self, _: Event) -> None:
+        """Switches between browsing the current folder and all folders under it"""
+        self.file_manager.toggle_recursive_browsing()
+
+        self.app.title(self.file_manager.current_image.name)
+        if self.canvas.is_widget_visible(TkTags.TOPBAR):
+            self.update_topbar()
+
+    def toggle_timings(self, _: Event) -> None:
+        """Starts or stops timing each stage of image loads and tracing spans.
+        Timings show in the dropdown while enabled and both are exported when
+        disabled"""
+        if stage_timer.enabled:
+            self._export_timings()
+        stage_timer.toggle()
+        _set_tracing(stage_timer.enabled)
+
+        self.dropdown.need_refresh = True
+        self.update_details_dropdown()
+
+    @staticmethod
+    def _export_timings() -> None:
+        """Writes recorded timings and spans to the cache folder"""
+        cache_folder: str = get_cache_folder()
+        try:
+            os.makedirs(cache_folder, exist_ok=True)
+            stage_timer.export(os.path.join(cache_folder, TIMINGS_EXPORT_FILE_NAME))
+            span_tracer.export(os.path.join(cache_folder, TRACE_EXPORT_FILE_NAME))
+        except OSError as e:
+            show_info("Image Load Timings", f"Failed to export timings: {e}")
+
     def undo_most_recent_action(self, _: Event) -> None:
         """Tries to undo most recent action and loads new image if needed"""
         if self.file_manager.undo_most_recent_action():
@@ -539,12 +836,19 @@ class ViewerApp:
 
     def rename_or_convert(self, _: Event) -> None:
         """Tries to rename or convert current image based on input.
+        Converts run in the background with progress shown until they finish.
         Makes window flash red if operation failed"""
         user_input: str = self.rename_entry.get().strip()
         if user_input == "":
             return
+        if user_input.startswith("*."):
+            self.start_batch_convert(user_input)
+            return
+        if self.converter is not None:
+            self.rename_entry.error_flash()
+            return
         try:
-            self.file_manager.rename_or_convert_current_image(
+            self.converter = self.file_manager.rename_or_convert_current_image(
                 self.image_io.PIL_image, user_input
             )
         except (OSError, FileExistsError, ValueError):
@@ -555,7 +859,133 @@ class ViewerApp:
 
         # Cleanup after successful rename
         self.hide_rename_window()
-        self.load_image_unblocking()
+        if self.converter is not None:
+            self._poll_convert()
+        else:
+            self.load_image_unblocking()
+
+    def _poll_convert(self) -> None:
+        """Shows progress until the conversion finishes."""
+        if self.converter is None:
+            return
+
+        if self.converter.finished:
+            self._end_convert()
+            return
+
+        progress: ConvertProgress = self.converter.progress
+        if progress.cancelled:
+            self._show_progress("Cancelling")
+        elif progress.frame_count > 1:
+            self._show_progress(
+                f"Converting frame {progress.frame} of {progress.frame_count}"
+            )
+        else:
+            self._show_progress("Converting")
+        self.convert_id = self.app.after(100, self._poll_convert)
+
+    def cancel_convert(self) -> None:
+        """Stops a running conversion. Its thread removes the partially written
+        file and polling cleans up once it stops."""
+        if self.converter is None:
+            return
+
+        self.converter.cancel()
+        self._show_progress("Cancelling")
+
+    def _end_convert(self) -> None:
+        """Updates files with the converted image, if any, and the display
+        if the current image changed."""
+        if self.converter is None:
+            return
+
+        previous_path: str = self.file_manager.path_to_image
+        try:
+            self.file_manager.finish_convert(self.converter)
+        except IndexError:
+            self.exit()
+        finally:
+            self.converter = None
+            self.convert_id = ""
+
+        if self.file_manager.path_to_image != previous_path:
+            self.load_image_unblocking()
+        else:
+            self._hide_progress()
+
+    def start_batch_convert(self, user_input: str) -> None:
+        """Starts converting all images of the current type in the background.
+        Makes window flash red if input was invalid or a batch is running.
+
+        :param user_input: *.<format> with an optional :<profile>."""
+        if self.batch_converter is not None:
+            self.rename_entry.error_flash()
+            return
+        try:
+            self.batch_converter = self.file_manager.start_batch_convert(user_input)
+        except ValueError:
+            self.rename_entry.error_flash()
+            return
+
+        self.hide_rename_window()
+        self._poll_batch_convert()
+
+    def _poll_batch_convert(self) -> None:
+        """Adds converted images to the files list and shows progress
+        until the batch finishes."""
+        if self.batch_converter is None:
+            return
+
+        self.file_manager.add_batch_converted_images(
+            self.batch_converter.collect_finished()
+        )
+        if self.batch_converter.finished:
+            self._end_batch_convert()
+            return
+
+        if self.batch_converter.cancelled:
+            self._show_progress("Cancelling")
+        else:
+            self._show_progress(
+                f"Converting {self.batch_converter.completed + 1}"
+                f" of {self.batch_converter.total}"
+            )
+        self.batch_convert_id = self.app.after(100, self._poll_batch_convert)
+
+    def cancel_batch_convert(self) -> None:
+        """Stops a running batch conversion. Polling continues until running
+        conversions finish. Images already converted are kept and can be
+        removed by undoing."""
+        if self.batch_converter is None:
+            return
+
+        self.file_manager.add_batch_converted_images(self.batch_converter.cancel())
+        self._show_progress("Cancelling")
+
+    def _end_batch_convert(self) -> None:
+        """Records the batch conversion as one undoable action
+        and restores the title and topbar."""
+        if self.batch_converter is None:
+            return
+
+        self.file_manager.finish_batch_convert(self.batch_converter)
+        self.batch_converter = None
+        self.batch_convert_id = ""
+        self._hide_progress()
+
+    def _show_progress(self, progress: str) -> None:
+        """Shows progress of a background task in place of the image's name.
+
+        :param progress: Text describing the progress."""
+        self.app.title(progress)
+        if self.canvas.is_widget_visible(TkTags.TOPBAR):
+            self.canvas.update_file_name(progress)
+
+    def _hide_progress(self) -> None:
+        """Shows the image's name again after a background task ends."""
+        self.app.title(self.file_manager.current_image.name)
+        if self.canvas.is_widget_visible(TkTags.TOPBAR):
+            self.update_topbar()
 
     def _update_existing_image_display(self, image: Image) -> None:
         """Updates display with PhotoImage version of provided Image.
@@ -566,7 +996,10 @@ class ViewerApp:
         """Updates display with PhotoImage version of provided Image.
         Use when a new image is replacing the previous and should be
         re-centered"""
-        self.canvas.update_image_display(PhotoImage(image))
+        with stage_timer.measure("PhotoImage"):
+            photo_image: PhotoImage = PhotoImage(image)
+        with stage_timer.measure("Canvas"):
+            self.canvas.update_image_display(photo_image)
 
     def update_after_image_load(self, image: Image) -> None:
         """Updates app title and displayed image"""
@@ -575,6 +1008,10 @@ class ViewerApp:
 
     def _load_image_at_current_path(self) -> Image | None:
         """Wraps ImageLoader's load call with path from FileManager"""
+        stage_timer.begin(self.file_manager.path_to_image)
+        if self.decode_pool is not None:
+            self.decode_pool.collect_finished(self.file_manager.path_to_image)
+
         return self.image_io.load_image(self.file_manager.path_to_image)
 
     def load_image(self, movement_on_failure: Movement = Movement.NONE) -> None:
@@ -595,6 +1032,13 @@ class ViewerApp:
         if self.canvas.is_widget_visible(TkTags.TOPBAR):
             self.update_topbar()
 
+        self.image_io.begin_zoom_precompute()
+        if self.decode_pool is not None:
+            from image_viewer.image.decode_pool import PREFETCH_DISTANCE
+
+            self.decode_pool.prefetch(
+                self.file_manager.get_paths_to_nearby_images(PREFETCH_DISTANCE)
+            )
         self._end_image_load()
 
     def load_image_unblocking(
@@ -680,6 +1124,9 @@ class ViewerApp:
         if self.currently_animating():
             self.app.after_cancel(self.animation_id)
             self.animation_id = ""
+        if self.zoom_id != "":
+            self.app.after_cancel(self.zoom_id)
+            self.zoom_id = ""
         self.image_io.reset_and_setup()
 
     def update_details_dropdown(self) -> None:
@@ -694,6 +1141,10 @@ class ViewerApp:
                 except KeyError:
                     return  # data not present in cache
 
+                timings: ImageLoadTimings | None = stage_timer.current
+                if timings is not None:
+                    details += f"\n{timings.format()}"
+
                 dropdown.image = PhotoImage(create_dropdown_image(details))
                 dropdown.need_refresh = False
 
@@ -3,14 +3,30 @@
 import sys
 
 if __name__ == "__main__" and len(sys.argv) > 1:
-    if not __debug__:
-        import os
+    import os
+
+    # Made absolute before changing directory so a running viewer can open it
+    image_path: str = os.path.abspath(sys.argv[1])
 
+    if not __debug__:
         from image_viewer.exceptions import exception_hook
 
         os.chdir(os.path.dirname(sys.argv[0]))
         sys.excepthook = exception_hook
 
+    from image_viewer._config import parse_config_file
+
+    config = parse_config_file()
+
+    if config.ui_single_instance and os.name != "nt":
+        from image_viewer.utils.single_instance import (
+            get_socket_path,
+            send_path_to_running_viewer,
+        )
+
+        if send_path_to_running_viewer(get_socket_path(), image_path):
+            sys.exit()
+
     from image_viewer.viewer import ViewerApp
 
-    ViewerApp(sys.argv[1]).start()
+    ViewerApp(image_path, config).start()
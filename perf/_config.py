@@ -24,23 +24,67 @@ def _validate_keybind_or_default(keybind: str, default: str) -> str:
     return keybind if is_valid_keybind(keybind) else default
 
 
+def _add_convert_profile(
+    convert_profiles: dict[str, dict[str, tuple[int, int]]], key: str, value: str
+) -> None:
+    """Adds a profile in the format <format>_<profile>=<speed>,<quality>
+    ignoring any that are invalid
+
+    :param convert_profiles: Profiles by format then name to add to
+    :param key: A possible format and profile name
+    :param value: A possible speed and quality"""
+
+    target_format, _, profile_name = key.lower().partition("_")
+    try:
+        speed, quality = map(int, value.split(","))
+    except ValueError:
+        return
+
+    if target_format and profile_name and 0 <= speed <= 10 and 0 <= quality <= 100:
+        convert_profiles.setdefault(target_format, {})[profile_name] = (
+            speed,
+            quality,
+        )
+
+
 class Config:
-    __slots__ = ("background_color", "font_file", "keybinds", "max_items_in_cache")
+    __slots__ = (
+        "background_color",
+        "convert_profiles",
+        "decode_processes",
+        "font_file",
+        "keybinds",
+        "max_items_in_cache",
+        "single_instance",
+        "undo_depth",
+    )
 
     def __init__(self, config_file: str = "image_viewer/config.ini") -> None:
         config_parser: ConfigParserExt = ConfigParserExt()
         config_parser.read(config_file)
 
         self.max_items_in_cache: int = config_parser.get_int_safe("CACHE", "SIZE", 20)
+        self.decode_processes: int = config_parser.get_int_safe(
+            "CACHE", "DECODE_PROCESSES", 0
+        )
+
+        self.convert_profiles: dict[str, dict[str, tuple[int, int]]] = {}
+        if config_parser.has_section("CONVERT"):
+            for key, value in config_parser.items("CONVERT"):
+                _add_convert_profile(self.convert_profiles, key, value)
 
         self.keybinds = KeybindConfig(
             config_parser.get_string_safe("KEYBINDS", "COPY_TO_CLIPBOARD_AS_BASE64"),
+            config_parser.get_string_safe("KEYBINDS", "CYCLE_SORT_MODE"),
+            config_parser.get_string_safe("KEYBINDS", "EXPORT_AS_DATA_URI"),
             config_parser.get_string_safe("KEYBINDS", "MOVE_TO_NEW_FILE"),
             config_parser.get_string_safe("KEYBINDS", "OPTIMIZE_IMAGE"),
             config_parser.get_string_safe("KEYBINDS", "REFRESH"),
             config_parser.get_string_safe("KEYBINDS", "RELOAD_IMAGE"),
             config_parser.get_string_safe("KEYBINDS", "RENAME"),
             config_parser.get_string_safe("KEYBINDS", "SHOW_DETAILS"),
+            config_parser.get_string_safe("KEYBINDS", "TOGGLE_RECURSIVE_BROWSING"),
+            config_parser.get_string_safe("KEYBINDS", "TOGGLE_TIMINGS"),
             config_parser.get_string_safe("KEYBINDS", "UNDO_MOST_RECENT_ACTION"),
         )
 
@@ -53,6 +97,11 @@ class Config:
             "FONT",
             "arial.ttf" if os.name == "nt" else "LiberationSans-Regular.ttf",
         )
+        self.single_instance: bool = (
+            config_parser.get_int_safe("UI", "SINGLE_INSTANCE", 0) == 1
+        )
+
+        self.undo_depth: int = config_parser.get_int_safe("UNDO", "DEPTH", 8)
 
 
 class KeybindConfig:
@@ -60,29 +109,43 @@ class KeybindConfig:
 
     __slots__ = (
         "copy_to_clipboard_as_base64",
+        "cycle_sort_mode",
+        "export_as_data_uri",
         "move_to_new_file",
         "optimize_image",
         "refresh",
         "reload_image",
         "rename",
         "show_details",
+        "toggle_recursive_browsing",
+        "toggle_timings",
         "undo_most_recent_action",
     )
 
     def __init__(
         self,
         copy_to_clipboard_as_base64: str,
+        cycle_sort_mode: str,
+        export_as_data_uri: str,
         move_to_new_file: str,
         optimize_image: str,
         refresh: str,
         reload_image: str,
         rename: str,
         show_details: str,
+        toggle_recursive_browsing: str,
+        toggle_timings: str,
         undo_most_recent_action: str,
     ) -> None:
         self.copy_to_clipboard_as_base64: str = _validate_keybind_or_default(
             copy_to_clipboard_as_base64, "<Control-E>"
         )
+        self.cycle_sort_mode: str = _validate_keybind_or_default(
+            cycle_sort_mode, "<Control-s>"
+        )
+        self.export_as_data_uri: str = _validate_keybind_or_default(
+            export_as_data_uri, "<Control-U>"
+        )
         self.move_to_new_file: str = _validate_keybind_or_default(
             move_to_new_file, "<Control-m>"
         )
@@ -95,6 +158,12 @@ class KeybindConfig:
         self.show_details: str = _validate_keybind_or_default(
             show_details, "<Control-d>"
         )
+        self.toggle_recursive_browsing: str = _validate_keybind_or_default(
+            toggle_recursive_browsing, "<Control-R>"
+        )
+        self.toggle_timings: str = _validate_keybind_or_default(
+            toggle_timings, "<Control-t>"
+        )
         self.undo_most_recent_action: str = _validate_keybind_or_default(
             undo_most_recent_action, "<Control-z>"
         )
@@ -10,17 +10,26 @@ from perf._config import Config as PythonConfig
 def _assert_configs(config_python: PythonConfig, c_config: CConfig) -> None:
 
     assert config_python.max_items_in_cache == c_config.cache_size
+    assert config_python.decode_processes == c_config.decode_processes
+    assert config_python.convert_profiles == c_config.convert_profiles
 
     assert (
         config_python.keybinds.copy_to_clipboard_as_base64
         == c_config.kb_copy_to_clipboard_as_base64
     )
+    assert config_python.keybinds.cycle_sort_mode == c_config.kb_cycle_sort_mode
+    assert config_python.keybinds.export_as_data_uri == c_config.kb_export_as_data_uri
     assert config_python.keybinds.move_to_new_file == c_config.kb_move_to_new_file
     assert config_python.keybinds.optimize_image == c_config.kb_optimize_image
     assert config_python.keybinds.refresh == c_config.kb_refresh
     assert config_python.keybinds.reload_image == c_config.kb_reload_image
     assert config_python.keybinds.rename == c_config.kb_rename
     assert config_python.keybinds.show_details == c_config.kb_show_details
+    assert (
+        config_python.keybinds.toggle_recursive_browsing
+        == c_config.kb_toggle_recursive_browsing
+    )
+    assert config_python.keybinds.toggle_timings == c_config.kb_toggle_timings
     assert (
         config_python.keybinds.undo_most_recent_action
         == c_config.kb_undo_most_recent_action
@@ -28,6 +37,9 @@ def _assert_configs(config_python: PythonConfig, c_config: CConfig) -> None:
 
     assert config_python.background_color == c_config.ui_background_color
     assert config_python.font_file == c_config.ui_font
+    assert config_python.single_instance == c_config.ui_single_instance
+
+    assert config_python.undo_depth == c_config.undo_depth
 
 
 def run() -> None:
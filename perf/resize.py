@@ -0,0 +1,66 @@
+import os
+
+from PIL.Image import Image, Resampling, frombytes
+
+from image_viewer.utils.PIL import resize
+from perf._base import PerfTest
+
+_alpha_to_premultiplied: dict[str, str] = {"RGBA": "RGBa", "LA": "La"}
+
+
+def _resize_with_converts(
+    image: Image, size: tuple[int, int], resample: Resampling
+) -> Image:
+    """How PIL resizes images with alpha, converting the whole image
+    to premultiplied alpha before and back after."""
+    premultiplied_mode: str = _alpha_to_premultiplied[image.mode]
+    return image.convert(premultiplied_mode).resize(size, resample).convert(image.mode)
+
+
+def _assert_images(python_image: Image, c_image: Image) -> None:
+    assert python_image.mode == c_image.mode
+    assert python_image.size == c_image.size
+    assert python_image.tobytes() == c_image.tobytes()
+
+
+def run() -> None:
+    perf_test = PerfTest(
+        python_implementation=_resize_with_converts, c_implementation=resize
+    )
+
+    image_4k: Image = frombytes("RGBA", (3840, 2160), os.urandom(3840 * 2160 * 4))
+
+    perf_test.run(
+        "4K RGBA Downscale Lanczos",
+        5,
+        _assert_images,
+        image_4k,
+        (1920, 1080),
+        Resampling.LANCZOS,
+    )
+    perf_test.run(
+        "4K RGBA Fit Bicubic",
+        5,
+        _assert_images,
+        image_4k,
+        (2560, 1440),
+        Resampling.BICUBIC,
+    )
+    perf_test.run(
+        "4K RGBA Upscale Lanczos",
+        3,
+        _assert_images,
+        image_4k,
+        (5760, 3240),
+        Resampling.LANCZOS,
+    )
+
+    image_4k_la: Image = image_4k.convert("LA")
+    perf_test.run(
+        "4K LA Downscale Lanczos",
+        5,
+        _assert_images,
+        image_4k_la,
+        (1920, 1080),
+        Resampling.LANCZOS,
+    )
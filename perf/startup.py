@@ -0,0 +1,72 @@
+"""Measures time from launching main.py to the first image being on screen.
+Needs a display. An image path can be passed after the test name."""
+
+import os
+import subprocess
+import sys
+from time import perf_counter
+
+ITERATIONS: int = 10
+DEFAULT_IMAGE_PATH: str = os.path.join("tests", "example_images", "a.png")
+
+# Runs main.py, printing perf_counter once the first image is shown and once
+# the viewer would start its main loop, then exits instead of looping
+_CHILD_SCRIPT: str = """
+import runpy
+import sys
+from time import perf_counter
+
+from image_viewer.viewer import ViewerApp
+
+show_first_image = ViewerApp._show_first_image
+
+
+def _show_first_image(self):
+    shown = show_first_image(self)
+    print(perf_counter(), flush=True)
+    return shown
+
+
+def _start(self):
+    print(perf_counter(), flush=True)
+    self.exit()
+
+
+ViewerApp._show_first_image = _show_first_image
+ViewerApp.start = _start
+sys.argv = ["main.py", sys.argv[1]]
+runpy.run_path("main.py", run_name="__main__")
+"""
+
+
+def _launch(image_path: str) -> tuple[float, float]:
+    """Launches the viewer once.
+
+    :param image_path: Image to open.
+    :returns: Seconds until the first image was shown and until fully started."""
+    start: float = perf_counter()
+    output: str = subprocess.run(
+        [sys.executable, "-c", _CHILD_SCRIPT, image_path],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    # perf_counter is system wide, so times from the child compare with start
+    first_frame, started = (float(line) for line in output.split())
+
+    return first_frame - start, started - start
+
+
+def run() -> None:
+    image_path: str = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_IMAGE_PATH
+
+    _launch(image_path)  # Warm up disk cache and compiled bytecode
+
+    times: list[tuple[float, float]] = [_launch(image_path) for _ in range(ITERATIONS)]
+
+    first_frame_times: list[float] = sorted(time for time, _ in times)
+    started_times: list[float] = sorted(time for _, time in times)
+    median: int = ITERATIONS // 2
+
+    print("Time to first frame (median):", first_frame_times[median])
+    print("Time to fully started (median):", started_times[median])
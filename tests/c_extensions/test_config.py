@@ -1,17 +1,24 @@
 import pytest
 
 from image_viewer._config import (
+    DEFAULT_CACHE_DECODE_PROCESSES,
     DEFAULT_CACHE_SIZE,
     DEFAULT_KB_COPY_TO_CLIPBOARD_AS_BASE64,
+    DEFAULT_KB_CYCLE_SORT_MODE,
+    DEFAULT_KB_EXPORT_AS_DATA_URI,
     DEFAULT_KB_MOVE_TO_NEW_FILE,
     DEFAULT_KB_OPTIMIZE_IMAGE,
     DEFAULT_KB_REFRESH,
     DEFAULT_KB_RELOAD_IMAGE,
     DEFAULT_KB_RENAME,
     DEFAULT_KB_SHOW_DETAILS,
+    DEFAULT_KB_TOGGLE_RECURSIVE_BROWSING,
+    DEFAULT_KB_TOGGLE_TIMINGS,
     DEFAULT_KB_UNDO_MOST_RECENT_ACTION,
     DEFAULT_UI_BACKGROUND_COLOR,
     DEFAULT_UI_FONT,
+    DEFAULT_UI_SINGLE_INSTANCE,
+    DEFAULT_UNDO_DEPTH,
     Config,
     parse_config_file,
 )
@@ -23,18 +30,31 @@ def test_config_reader() -> None:
     config: Config = parse_config_file(_get_test_file_path("config.ini"))
 
     assert config.cache_size == 100
+    assert config.decode_processes == 4
+
+    assert config.convert_profiles == {
+        "webp": {"fast": (10, 80), "default": (3, 90)},
+        "avif": {"small": (0, 50)},
+    }
 
     assert config.kb_copy_to_clipboard_as_base64 == "<Control-K>"
+    assert config.kb_cycle_sort_mode == "<F9>"
+    assert config.kb_export_as_data_uri == "<F11>"
     assert config.kb_move_to_new_file == "<F6>"
     assert config.kb_optimize_image == "<Control-J>"
     assert config.kb_refresh == "<Control-H>"
     assert config.kb_reload_image == "<F7>"
     assert config.kb_rename == "<F3>"
     assert config.kb_show_details == "<Control-a>"
+    assert config.kb_toggle_recursive_browsing == "<F8>"
+    assert config.kb_toggle_timings == "<F10>"
     assert config.kb_undo_most_recent_action == "<Control-Z>"
 
     assert config.ui_background_color == "#ABCDEF"
     assert config.ui_font == "test"
+    assert config.ui_single_instance is True
+
+    assert config.undo_depth == 20
 
 
 def test_config_reader_defaults() -> None:
@@ -44,12 +64,16 @@ def test_config_reader_defaults() -> None:
     _assert_defaults(config)
 
     assert is_valid_keybind(config.kb_copy_to_clipboard_as_base64)
+    assert is_valid_keybind(config.kb_cycle_sort_mode)
+    assert is_valid_keybind(config.kb_export_as_data_uri)
     assert is_valid_keybind(config.kb_move_to_new_file)
     assert is_valid_keybind(config.kb_optimize_image)
     assert is_valid_keybind(config.kb_refresh)
     assert is_valid_keybind(config.kb_reload_image)
     assert is_valid_keybind(config.kb_rename)
     assert is_valid_keybind(config.kb_show_details)
+    assert is_valid_keybind(config.kb_toggle_recursive_browsing)
+    assert is_valid_keybind(config.kb_toggle_timings)
     assert is_valid_keybind(config.kb_undo_most_recent_action)
 
     assert is_valid_hex_color(config.ui_background_color)
@@ -104,17 +128,26 @@ def test_validate_hex(hex_color: str, expected: bool) -> None:
 
 def _assert_defaults(config: Config) -> None:
     assert config.cache_size == DEFAULT_CACHE_SIZE
+    assert config.decode_processes == DEFAULT_CACHE_DECODE_PROCESSES
+    assert config.convert_profiles == {}
 
     assert (
         config.kb_copy_to_clipboard_as_base64 == DEFAULT_KB_COPY_TO_CLIPBOARD_AS_BASE64
     )
+    assert config.kb_cycle_sort_mode == DEFAULT_KB_CYCLE_SORT_MODE
+    assert config.kb_export_as_data_uri == DEFAULT_KB_EXPORT_AS_DATA_URI
     assert config.kb_move_to_new_file == DEFAULT_KB_MOVE_TO_NEW_FILE
     assert config.kb_optimize_image == DEFAULT_KB_OPTIMIZE_IMAGE
     assert config.kb_refresh == DEFAULT_KB_REFRESH
     assert config.kb_reload_image == DEFAULT_KB_RELOAD_IMAGE
     assert config.kb_rename == DEFAULT_KB_RENAME
     assert config.kb_show_details == DEFAULT_KB_SHOW_DETAILS
+    assert config.kb_toggle_recursive_browsing == DEFAULT_KB_TOGGLE_RECURSIVE_BROWSING
+    assert config.kb_toggle_timings == DEFAULT_KB_TOGGLE_TIMINGS
     assert config.kb_undo_most_recent_action == DEFAULT_KB_UNDO_MOST_RECENT_ACTION
 
     assert config.ui_background_color == DEFAULT_UI_BACKGROUND_COLOR
     assert config.ui_font == DEFAULT_UI_FONT
+    assert config.ui_single_instance is DEFAULT_UI_SINGLE_INSTANCE
+
+    assert config.undo_depth == DEFAULT_UNDO_DEPTH
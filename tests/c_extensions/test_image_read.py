@@ -0,0 +1,162 @@
+import base64
+import os
+import struct
+import zlib
+from pathlib import Path
+
+import pytest
+
+from image_viewer.image._read import (
+    AVIF,
+    DDS,
+    GIF,
+    JPEG,
+    PNG,
+    WEBP,
+    CRawImageView,
+    encode_as_base64,
+    probe_image,
+    read_image_into_buffer,
+)
+from tests.conftest import (
+    EXAMPLE_AVIF_PATH,
+    EXAMPLE_DDS_PATH,
+    EXAMPLE_GIF_PATH,
+    EXAMPLE_JPEG_PATH,
+    EXAMPLE_PNG_PATH,
+    EXAMPLE_WEBP_PATH,
+    IMG_DIR,
+    ONLY_ON_LINUX,
+)
+
+
+@pytest.mark.parametrize(
+    ("path", "expected_format", "expected_frame_count"),
+    [
+        (EXAMPLE_PNG_PATH, PNG, 1),
+        (EXAMPLE_JPEG_PATH, JPEG, 1),
+        (EXAMPLE_WEBP_PATH, WEBP, 1),
+        (EXAMPLE_GIF_PATH, GIF, 0),
+        (EXAMPLE_DDS_PATH, DDS, 1),
+        (EXAMPLE_AVIF_PATH, AVIF, 1),
+    ],
+)
+def test_probe_image(
+    path: str, expected_format: str, expected_frame_count: int
+) -> None:
+    """Should read format, dimensions, and frame count from headers"""
+    assert probe_image(path) == (expected_format, 2, 2, expected_frame_count)
+
+
+def test_probe_image_failures() -> None:
+    """Should return None for unknown files and missing files"""
+    assert probe_image(os.path.join(IMG_DIR, "not_an_image.txt")) is None
+    assert probe_image(os.path.join(IMG_DIR, "missing.png")) is None
+
+
+@pytest.mark.parametrize(
+    ("path", "expected_format"),
+    [
+        (EXAMPLE_PNG_PATH, PNG),
+        (EXAMPLE_JPEG_PATH, JPEG),
+        (EXAMPLE_WEBP_PATH, WEBP),
+        (EXAMPLE_GIF_PATH, GIF),
+        (EXAMPLE_DDS_PATH, DDS),
+        (EXAMPLE_AVIF_PATH, AVIF),
+    ],
+)
+def test_read_image_into_buffer(path: str, expected_format: str) -> None:
+    """Should detect format from file signature"""
+    image_view = read_image_into_buffer(path)
+    assert image_view is not None
+    assert image_view.format == expected_format
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        b"not an image at all",
+        b"RIFF\x00\x00\x00\x00WAVEfmt ",
+        b"\x00\x00\x00\x18ftypheic\x00\x00\x00\x00mif1heic",
+    ],
+)
+def test_read_image_into_buffer_unknown(tmp_path: Path, header: bytes) -> None:
+    """Should reject files that are not a supported format"""
+    path: str = os.path.join(tmp_path, "unknown")
+    with open(path, "wb") as fp:
+        fp.write(header)
+
+    assert read_image_into_buffer(path) is None
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    crc: int = zlib.crc32(chunk_type + data)
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", crc)
+
+
+def test_probe_image_animated_png(tmp_path: Path) -> None:
+    """Should find frame count in acTL before IDAT"""
+    path: str = os.path.join(tmp_path, "animated.png")
+    with open(path, "wb") as fp:
+        fp.write(b"\x89PNG\r\n\x1a\n")
+        fp.write(_png_chunk(b"IHDR", struct.pack(">IIBBBBB", 300, 200, 8, 6, 0, 0, 0)))
+        fp.write(_png_chunk(b"acTL", struct.pack(">II", 7, 0)))
+        fp.write(_png_chunk(b"IDAT", b""))
+
+    assert probe_image(path) == (PNG, 300, 200, 7)
+
+
+@pytest.mark.skipif(os.name == "nt", reason=ONLY_ON_LINUX)
+def test_probe_image_name_not_utf8(tmp_path: Path) -> None:
+    """Should probe images whose names aren't valid UTF-8"""
+    path: str = os.path.join(tmp_path, os.fsdecode(b"caf\xe9.png"))
+    with open(path, "wb") as fp:
+        fp.write(b"\x89PNG\r\n\x1a\n")
+        fp.write(_png_chunk(b"IHDR", struct.pack(">IIBBBBB", 3, 2, 8, 6, 0, 0, 0)))
+        fp.write(_png_chunk(b"IDAT", b""))
+
+    assert probe_image(path) == (PNG, 3, 2, 1)
+
+
+def test_probe_image_jpeg_large_metadata(tmp_path: Path) -> None:
+    """Should seek past metadata segments larger than what is read up front"""
+    path: str = os.path.join(tmp_path, "exif.jpg")
+    exif: bytes = b"\x00" * 60000
+    with open(path, "wb") as fp:
+        fp.write(b"\xff\xd8")
+        fp.write(b"\xff\xe1" + struct.pack(">H", len(exif) + 2) + exif)
+        fp.write(b"\xff\xc2" + struct.pack(">HBHH", 11, 8, 1080, 1920))
+
+    assert probe_image(path) == (JPEG, 1920, 1080, 1)
+
+
+def test_probe_image_webp_variants(tmp_path: Path) -> None:
+    """Should read dimensions from lossless and extended WebP headers"""
+    lossless_path: str = os.path.join(tmp_path, "lossless.webp")
+    bits: int = (640 - 1) | (480 - 1) << 14
+    with open(lossless_path, "wb") as fp:
+        fp.write(b"RIFF\x00\x00\x00\x00WEBPVP8L\x00\x00\x00\x00\x2f")
+        fp.write(struct.pack("<I", bits) + b"\x00" * 8)
+
+    assert probe_image(lossless_path) == (WEBP, 640, 480, 1)
+
+    animated_path: str = os.path.join(tmp_path, "animated.webp")
+    with open(animated_path, "wb") as fp:
+        fp.write(b"RIFF\x00\x00\x00\x00WEBPVP8X\x0a\x00\x00\x00\x02\x00\x00\x00")
+        fp.write((5000 - 1).to_bytes(3, "little") + (3 - 1).to_bytes(3, "little"))
+
+    assert probe_image(animated_path) == (WEBP, 5000, 3, 0)
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 3, 1048577])
+def test_encode_as_base64(tmp_path: Path, size: int) -> None:
+    """Should match the standard library's base64 for every padding length"""
+    data: bytes = b"\x89PNG\r\n\x1a\n" + os.urandom(size)
+    path: str = os.path.join(tmp_path, "a.png")
+    with open(path, "wb") as fp:
+        fp.write(data)
+
+    image_view: CRawImageView | None = read_image_into_buffer(path)
+
+    assert image_view is not None
+    assert encode_as_base64(image_view) == base64.b64encode(data).decode("ascii")
@@ -34,6 +34,7 @@ EXAMPLE_AVIF_PATH: str = os.path.join(IMG_DIR, "f.avif")
 EXAMPLE_GIF_PATH: str = os.path.join(IMG_DIR, "g.gif")
 
 ONLY_ON_WINDOWS: str = "Only available on Windows"
+ONLY_ON_LINUX: str = "Only available on Linux"
 
 
 @pytest.fixture(name="font", scope="session")
@@ -58,8 +59,10 @@ def canvas_fixture(tk: Tk, font: Font) -> CustomCanvas:
 
 
 @pytest.fixture(name="button_icon_factory", scope="module")
-def button_icon_factory_fixture() -> ButtonIconFactory:
-    return ButtonIconFactory(32)
+def button_icon_factory_fixture(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> ButtonIconFactory:
+    return ButtonIconFactory(32, str(tmp_path_factory.mktemp("cache")))
 
 
 @pytest.fixture(name="image_cache")
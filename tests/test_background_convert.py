@@ -0,0 +1,27 @@
+import os
+
+from image_viewer.files.background_convert import BackgroundConverter
+from tests.conftest import EXAMPLE_PNG_PATH
+
+
+def test_background_converter(tmp_path: str) -> None:
+    """Should convert on another thread and finish once done"""
+    new_path: str = os.path.join(tmp_path, "a.webp")
+    converter = BackgroundConverter(EXAMPLE_PNG_PATH, new_path, "webp", 80, 10)
+    converter._thread.join()
+
+    assert converter.finished
+    assert converter.converted
+    assert converter.progress.frame == 1
+    assert os.path.exists(new_path)
+
+
+def test_background_converter_cancel(tmp_path: str) -> None:
+    """Should not leave a new file behind once cancelled"""
+    new_path: str = os.path.join(tmp_path, "a.webp")
+    converter = BackgroundConverter(EXAMPLE_PNG_PATH, new_path, "webp", 80, 10)
+    converter.cancel()
+    converter._thread.join()
+
+    assert converter.finished
+    assert converter.converted is os.path.exists(new_path)
@@ -0,0 +1,70 @@
+import base64
+import os
+
+import pytest
+
+from image_viewer.files.base64_export import (
+    BackgroundBase64Exporter,
+    export_base64,
+    get_data_uri_prefix,
+)
+from image_viewer.image._read import CRawImageView, read_image_into_buffer
+from tests.conftest import EXAMPLE_PNG_PATH
+
+
+@pytest.fixture(name="image_view")
+def image_view_fixture() -> CRawImageView:
+    image_view: CRawImageView | None = read_image_into_buffer(EXAMPLE_PNG_PATH)
+    assert image_view is not None
+    return image_view
+
+
+def _get_expected_base64() -> bytes:
+    with open(EXAMPLE_PNG_PATH, "rb") as fp:
+        return base64.b64encode(fp.read())
+
+
+@pytest.mark.parametrize(
+    ("image_format", "expected_prefix"),
+    [
+        ("PNG", b"data:image/png;base64,"),
+        ("JPEG", b"data:image/jpeg;base64,"),
+        ("DDS", b"data:image/vnd-ms.dds;base64,"),
+    ],
+)
+def test_get_data_uri_prefix(image_format: str, expected_prefix: bytes) -> None:
+    assert get_data_uri_prefix(image_format) == expected_prefix
+
+
+def test_export_base64_to_pipe(image_view: CRawImageView) -> None:
+    """Should stream a data URI through a pipe"""
+    read_fd, write_fd = os.pipe()
+    with os.fdopen(read_fd, "rb") as reader:
+        with os.fdopen(write_fd, "wb") as writer:
+            export_base64(image_view, writer, data_uri=True)
+
+        assert reader.read() == b"data:image/png;base64," + _get_expected_base64()
+
+
+def test_background_base64_exporter(image_view: CRawImageView, tmp_path: str) -> None:
+    """Should write plain base64 on another thread and finish once done"""
+    output_path: str = os.path.join(tmp_path, "a.txt")
+    exporter = BackgroundBase64Exporter(image_view, output_path, data_uri=False)
+    exporter.wait()
+
+    assert exporter.finished
+    assert exporter.exported
+    with open(output_path, "rb") as fp:
+        assert fp.read() == _get_expected_base64()
+
+
+def test_background_base64_exporter_failure(
+    image_view: CRawImageView, tmp_path: str
+) -> None:
+    """Should report failure when the file can't be written"""
+    output_path: str = os.path.join(tmp_path, "missing_folder", "a.txt")
+    exporter = BackgroundBase64Exporter(image_view, output_path)
+    exporter.wait()
+
+    assert not exporter.exported
+    assert not os.path.exists(output_path)
@@ -0,0 +1,33 @@
+import os
+import shutil
+from concurrent.futures import wait
+
+from image_viewer.files.batch_convert import BatchConverter
+from tests.conftest import EXAMPLE_PNG_PATH
+
+
+def test_batch_converter(tmp_path: str) -> None:
+    """Should convert all images and report each successful one once"""
+    paths: list[tuple[str, str]] = []
+    for name in ("a", "b"):
+        original_path: str = os.path.join(tmp_path, f"{name}.png")
+        shutil.copy(EXAMPLE_PNG_PATH, original_path)
+        paths.append((original_path, os.path.join(tmp_path, f"{name}.webp")))
+
+    batch_converter = BatchConverter(paths, "webp", 10, 80)
+    assert batch_converter.total == 2
+    assert not batch_converter.finished
+
+    converted = batch_converter.cancel()
+    assert batch_converter.cancelled
+
+    # Any already running are left to finish
+    wait([future for _, future in batch_converter._pending])
+    converted += batch_converter.collect_finished()
+
+    assert batch_converter.finished
+    assert batch_converter.converted == converted
+    assert batch_converter.completed == 2
+    for action in converted:
+        assert os.path.exists(action.new_path)
+    assert batch_converter.collect_finished() == []
@@ -1,11 +1,18 @@
 """Tests for the ButtonIconFactory class."""
 
+import os
+from tkinter import PhotoImage as tkPhotoImage
 from tkinter import Tk
+from unittest.mock import patch
 
 from PIL.ImageTk import PhotoImage
 
 from image_viewer.ui.button import IconImages
-from image_viewer.ui.button_icon_factory import DEFAULT_ICON_SIZE, ButtonIconFactory
+from image_viewer.ui.button_icon_factory import (
+    DEFAULT_ICON_SIZE,
+    ICON_ATLAS_VERSION,
+    ButtonIconFactory,
+)
 
 
 def test_create_icons(
@@ -13,8 +20,8 @@ def test_create_icons(
     button_icon_factory: ButtonIconFactory,
 ) -> None:
     """Should successfully create all icons as PhotoImages."""
-    topbar: PhotoImage = button_icon_factory.make_topbar_image(1920)
-    assert isinstance(topbar, PhotoImage)
+    topbar: tkPhotoImage = button_icon_factory.make_topbar_image(1920)
+    assert isinstance(topbar, tkPhotoImage)
     assert topbar.width() == 1920
     assert topbar.height() == 32
 
@@ -32,6 +39,26 @@ def test_create_icons(
     _assert_icons(up_icons)
 
 
+def test_icon_atlas_cached(tmp_path: str) -> None:
+    """Should draw icons once per size and read them from the cache after"""
+    button_icon_factory = ButtonIconFactory(32, tmp_path)
+    assert os.listdir(tmp_path) == [f"icons_v{ICON_ATLAS_VERSION}_32.png"]
+
+    with patch.object(ButtonIconFactory, "_draw_icons") as mock_draw_icons:
+        cached_factory = ButtonIconFactory(32, tmp_path)
+        mock_draw_icons.assert_not_called()
+
+    assert cached_factory._atlas.tobytes() == button_icon_factory._atlas.tobytes()
+
+    with patch.object(
+        ButtonIconFactory, "_draw_icons", wraps=button_icon_factory._draw_icons
+    ) as mock_draw_icons:
+        ButtonIconFactory(24, tmp_path)
+        mock_draw_icons.assert_called_once()
+
+    assert len(os.listdir(tmp_path)) == 2
+
+
 def _assert_icons(icons: IconImages) -> None:
     """Asserts icons are expected types."""
     _assert_icon(icons.default)
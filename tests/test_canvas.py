@@ -1,5 +1,6 @@
 """Tests for the CustomCanvas class."""
 
+from tkinter import PhotoImage as tkPhotoImage
 from tkinter.font import Font
 from unittest.mock import MagicMock, patch
 
@@ -36,9 +37,9 @@ def test_create_assets(
         )
 
 
-def test_create_topbar(canvas: CustomCanvas, example_image: Image) -> None:
+def test_create_topbar(canvas: CustomCanvas) -> None:
     # Should store image after creation or garbage collector kills topbar
-    display_image = PhotoImage(example_image)
+    display_image = tkPhotoImage(width=1920, height=32)
     canvas.create_topbar(display_image)
     assert canvas._topbar is display_image
 
@@ -123,6 +124,24 @@ def test_drag_frame_limit(canvas: CustomCanvas) -> None:
         mock_after.assert_called_once()
 
 
+def test_update_existing_image_display_around(canvas: CustomCanvas) -> None:
+    """Should keep the same part of the image under the provided coords"""
+
+    new_image = MagicMock()
+    new_image.width.return_value = 200
+    new_image.height.return_value = 200
+
+    with (
+        patch.object(CustomCanvas, "bbox", return_value=(0, 0, 100, 100)),
+        patch.object(CustomCanvas, "coords") as mock_coords,
+        patch.object(CustomCanvas, "update_existing_image_display"),
+    ):
+        canvas.update_existing_image_display_around(new_image, 25, 50)
+
+        # Point 25% across and 50% down the image should stay under the coords
+        mock_coords.assert_called_once_with(canvas.image_display.id, 75, 50)
+
+
 def test_get_button_id(canvas: CustomCanvas, example_image: Image) -> None:
     """Should keep track of buttons and correctly return their id"""
 
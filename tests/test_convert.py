@@ -1,7 +1,21 @@
+import os
+from unittest.mock import patch
+
 import pytest
+from PIL.Image import Image
+from PIL.Image import new as new_image
+from PIL.Image import open as open_image
+from PIL.ImageSequence import Iterator as ImageIterator
 
 from image_viewer.image._read import AVIF, DDS, GIF, JPEG, PNG, WEBP
-from image_viewer.utils.convert import try_convert_image_and_save_new
+from image_viewer.utils.convert import (
+    ConvertCancelledError,
+    ConvertProgress,
+    convert_file,
+    get_encoder_profile,
+    try_convert_image_and_save_new,
+)
+from tests.conftest import EXAMPLE_GIF_PATH, EXAMPLE_PNG_PATH, IMG_DIR
 from tests.utils.mocks import MockImage
 
 
@@ -49,3 +63,165 @@ def test_convert_between_types(true_file_extension: str, target_format: str) ->
         MockImage(image_format=true_file_extension.upper()), "new.jpg", target_format
     )
     assert converted is (true_file_extension != target_format)
+
+
+@pytest.mark.parametrize(
+    ("target_format", "speed", "expected_kwargs"),
+    [
+        ("avif", 10, {"speed": 10, "optimize": False}),
+        ("webp", 0, {"method": 6, "optimize": True}),
+        ("webp", 5, {"method": 3, "optimize": False}),
+        ("png", 10, {"compress_level": 1, "optimize": False}),
+    ],
+)
+def test_convert_encoder_speed(
+    target_format: str, speed: int, expected_kwargs: dict[str, int | bool]
+) -> None:
+    """Should map encoder speed to each encoder's own options"""
+    with patch.object(MockImage, "save") as mock_save:
+        try_convert_image_and_save_new(
+            MockImage(image_format="JPEG"), "new", target_format, speed=speed
+        )
+
+    save_kwargs = mock_save.call_args.kwargs
+    for key, value in expected_kwargs.items():
+        assert save_kwargs[key] == value
+
+
+@pytest.mark.parametrize(
+    ("target_format", "profile_name", "expected_profile"),
+    [
+        ("webp", "fast", (9, 70)),
+        ("WEBP", "FAST", (9, 70)),
+        ("avif", "fast", (10, 96)),
+        ("webp", "", (1, 80)),
+        ("avif", "", (0, 96)),
+        ("png", "balanced", (5, 96)),
+    ],
+)
+def test_get_encoder_profile(
+    target_format: str, profile_name: str, expected_profile: tuple[int, int]
+) -> None:
+    """Should prefer profiles configured for a format over built in ones"""
+    convert_profiles: dict[str, dict[str, tuple[int, int]]] = {
+        "webp": {"fast": (9, 70), "default": (1, 80)}
+    }
+    assert (
+        get_encoder_profile(target_format, profile_name, convert_profiles)
+        == expected_profile
+    )
+
+
+def test_get_encoder_profile_missing() -> None:
+    """Should raise ValueError when a profile doesn't exist"""
+    with pytest.raises(ValueError):
+        get_encoder_profile("webp", "missing", {"avif": {"missing": (0, 0)}})
+
+
+def _save_animated_gif(
+    path: str, frame_count: int, durations: list[int] | int = 50
+) -> None:
+    frames: list[Image] = [
+        new_image("L", (8, 8), color * 40) for color in range(frame_count)
+    ]
+    frames[0].save(path, save_all=True, append_images=frames[1:], duration=durations)
+
+
+def _get_durations(path: str) -> list[int]:
+    durations: list[int] = []
+    with open_image(path) as image:
+        for frame in ImageIterator(image):
+            frame.load()
+            durations.append(frame.info["duration"])
+    return durations
+
+
+def test_convert_with_progress(tmp_path: str) -> None:
+    """Should report frames read and stop when cancelled"""
+    gif_path: str = os.path.join(tmp_path, "animated.gif")
+    _save_animated_gif(gif_path, 5)
+
+    progress = ConvertProgress()
+    with open_image(gif_path) as image:
+        assert try_convert_image_and_save_new(
+            image, os.path.join(tmp_path, "a.webp"), "webp", progress=progress
+        )
+        assert progress.frame == progress.frame_count == 5
+
+    progress = ConvertProgress()
+    progress.cancelled = True
+    with (
+        open_image(gif_path) as image,
+        pytest.raises(ConvertCancelledError),
+    ):
+        try_convert_image_and_save_new(
+            image, os.path.join(tmp_path, "b.webp"), "webp", progress=progress
+        )
+
+
+def test_convert_file(tmp_path: str) -> None:
+    """Should save a converted image or clean up after failing"""
+    new_path: str = os.path.join(tmp_path, "a.webp")
+    assert convert_file(EXAMPLE_PNG_PATH, new_path, "webp", 80, 10)
+    with open_image(new_path) as image:
+        assert image.format == "WEBP"
+
+    # Saving fails since folder is missing
+    new_path = os.path.join(tmp_path, "missing", "g.jpg")
+    assert not convert_file(EXAMPLE_GIF_PATH, new_path, "jpg", 80, 10)
+
+    assert not convert_file(
+        os.path.join(IMG_DIR, "not_an_image.txt"), new_path, "png", 80, 10
+    )
+
+    # Cancelled conversions remove the partially written file
+    progress = ConvertProgress()
+    progress.cancelled = True
+    new_path = os.path.join(tmp_path, "b.webp")
+    assert not convert_file(EXAMPLE_PNG_PATH, new_path, "webp", 80, 10, progress)
+    assert not os.path.exists(new_path)
+
+
+@pytest.mark.parametrize(("first_format", "second_format"), [("webp", "gif")])
+def test_convert_animated_durations(
+    tmp_path: str, first_format: str, second_format: str
+) -> None:
+    """Should keep each frame's duration while seeking to each frame only once"""
+    durations: list[int] = [30, 60, 90, 120, 150]
+    path: str = os.path.join(tmp_path, "animated.gif")
+    _save_animated_gif(path, len(durations), durations)
+
+    for target_format in (first_format, second_format):
+        new_path: str = os.path.join(tmp_path, f"animated.{target_format}")
+        with (
+            open_image(path) as image,
+            patch.object(image, "seek", wraps=image.seek) as mock_seek,
+        ):
+            assert try_convert_image_and_save_new(image, new_path, target_format)
+
+        # Seeking to the first frame is free and seeking past the last frame
+        # only ends iteration, every other frame should be decoded once
+        frames_seeked: list[int] = [
+            call.args[0]
+            for call in mock_seek.call_args_list
+            if 0 < call.args[0] < len(durations)
+        ]
+        assert frames_seeked == list(range(1, len(durations)))
+        assert _get_durations(new_path) == durations
+        path = new_path
+
+
+@pytest.mark.parametrize("target_format", ["png", "webp"])
+def test_convert_animated_durations_per_frame(
+    tmp_path: str, target_format: str
+) -> None:
+    """Should keep each frame's duration whether or not the encoder reads them"""
+    durations: list[int] = [30, 60, 90]
+    path: str = os.path.join(tmp_path, "animated.gif")
+    _save_animated_gif(path, len(durations), durations)
+
+    new_path: str = os.path.join(tmp_path, f"new.{target_format}")
+    with open_image(path) as image:
+        assert try_convert_image_and_save_new(image, new_path, target_format)
+
+    assert _get_durations(new_path) == durations
@@ -0,0 +1,93 @@
+import os
+from concurrent.futures import Future
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+from PIL.Image import Image
+
+from image_viewer.image.cache import ImageCache, ImageCacheEntry
+from image_viewer.image.decode_pool import (
+    DecodedImage,
+    DecodePool,
+    _decode_into_shared_memory,
+    _unlink_unwanted_decode,
+)
+from image_viewer.image.image_io import ImageIO, ReadImageResponse
+from image_viewer.image.resizer import ImageResizer
+from tests.conftest import (
+    EXAMPLE_GIF_PATH,
+    EXAMPLE_JPEG_PATH,
+    EXAMPLE_PNG_PATH,
+    IMG_DIR,
+)
+
+
+@pytest.mark.parametrize(
+    "image_path", [EXAMPLE_PNG_PATH, EXAMPLE_JPEG_PATH, EXAMPLE_GIF_PATH]
+)
+def test_decode_into_shared_memory(image_path: str) -> None:
+    """Should match an image fit to screen in this process"""
+    decoded: DecodedImage | None = _decode_into_shared_memory(image_path, 1920, 1080)
+    assert decoded is not None
+
+    read_image_response: ReadImageResponse | None = ImageIO.read_image(image_path)
+    assert read_image_response is not None
+    expected: Image = ImageResizer(1920, 1080).get_image_fit_to_screen(
+        read_image_response.image, read_image_response.image_view
+    )
+
+    image: Image = decoded.to_image()
+    assert image.mode == expected.mode
+    assert image.size == expected.size
+    assert image.tobytes() == expected.tobytes()
+    assert image.getpalette() == expected.getpalette()
+    assert decoded.format == read_image_response.image_view.format
+    assert decoded.original_size == read_image_response.image.size
+
+    start_ns, end_ns, process_id, _ = decoded.worker_span
+    assert start_ns <= end_ns
+    assert process_id == os.getpid()
+
+
+def test_decode_into_shared_memory_bad_path() -> None:
+    """Should return None when the image can't be read"""
+    assert _decode_into_shared_memory(IMG_DIR + "/not_an_image.txt", 10, 10) is None
+
+
+def test_unlink_unwanted_decode() -> None:
+    """Should free the shared memory of a decode that finished after stopping"""
+    decoded: DecodedImage | None = _decode_into_shared_memory(
+        EXAMPLE_PNG_PATH, 1920, 1080
+    )
+    assert decoded is not None
+
+    future: Future[DecodedImage | None] = Future()
+    future.add_done_callback(_unlink_unwanted_decode)
+    future.set_result(decoded)
+
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(decoded.shared_memory_name)
+
+
+def test_decode_pool() -> None:
+    """Should cache prefetched images once collected"""
+    image_cache = ImageCache(20)
+    decode_pool = DecodePool(1, 1920, 1080, image_cache)
+
+    decode_pool.prefetch([EXAMPLE_PNG_PATH, EXAMPLE_JPEG_PATH])
+    for image_path in (EXAMPLE_PNG_PATH, EXAMPLE_JPEG_PATH):
+        decode_pool.collect_finished(image_path)
+
+    # First is always waited on, second is either waited on or cancelled
+    entry: ImageCacheEntry | None = image_cache.get(EXAMPLE_PNG_PATH)
+    assert entry is not None
+    assert entry.format == "PNG"
+    assert not decode_pool._pending
+
+    # Cached images are not decoded again
+    decode_pool.prefetch([EXAMPLE_PNG_PATH])
+    assert not decode_pool._pending
+
+    decode_pool.stop()
+    decode_pool.prefetch([EXAMPLE_GIF_PATH])
+    assert not decode_pool._pending
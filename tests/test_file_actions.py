@@ -4,7 +4,14 @@ from unittest.mock import patch
 
 import pytest
 
-from image_viewer.files.actions import Convert, Delete, FileAction, Rename
+from image_viewer.files.actions import (
+    ActionGroup,
+    Convert,
+    Delete,
+    FileAction,
+    Rename,
+    split_path,
+)
 
 _MODULE_PATH = "image_viewer.files.actions"
 
@@ -70,3 +77,55 @@ def _assert_correct_undo_response(
         assert not path_restored
     else:
         assert path_restored
+
+
+def test_undo_action_group() -> None:
+    """Should undo newest first and keep actions that failed to undo"""
+    first = Rename("a.png", "b.png")
+    second = Rename("c.png", "d.png")
+    group = ActionGroup("renaming", [first, second])
+
+    assert group.get_undo_message() == "Undo renaming (2 files)?"
+
+    def fail_on_first(_: str, original_path: str) -> None:
+        if original_path == "a.png":
+            raise OSError
+
+    with patch(f"{_MODULE_PATH}.os.rename", fail_on_first):
+        assert group.undo_all() == [("c.png", "d.png")]
+    assert group.actions == [first]
+
+    with (
+        patch(f"{_MODULE_PATH}.os.rename", side_effect=OSError),
+        pytest.raises(OSError),
+    ):
+        group.undo_all()
+
+    with patch(f"{_MODULE_PATH}.os.rename"):
+        assert group.undo() == ("", "")
+    assert group.actions == []
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("a.png", ("", "a.png")),
+        ("/images/a.png", ("/images/", "a.png")),
+        ("/images/sub/a.png", ("/images/sub/", "a.png")),
+    ],
+)
+def test_split_path(path: str, expected: tuple[str, str]) -> None:
+    """Should split without changing the path and share folders between actions"""
+    folder, name = split_path(path)
+
+    assert (folder, name) == expected
+    assert folder + name == path
+    assert folder is split_path(path + ".webp")[0]
+
+
+def test_rename_paths() -> None:
+    """Should give back the paths it was made with"""
+    action = Rename("/images/a.png", "/images/sub/b.png")
+
+    assert action.original_path == "/images/a.png"
+    assert action.new_path == "/images/sub/b.png"
@@ -1,15 +1,18 @@
 import os
 import tempfile
-from unittest.mock import patch
+import time
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from image_viewer.files.actions import Rename
+from image_viewer.constants import SortMode
+from image_viewer.files.actions import ActionGroup, Convert, Rename
 from image_viewer.files.file_manager import ImageFileManager, _ShouldPreserveIndex
+from image_viewer.files.metadata_index import FileMetadataIndex
 from image_viewer.image._read import PNG
 from image_viewer.image.cache import ImageCache, ImageCacheEntry
-from image_viewer.image.file import ImageSearchResult
-from tests.conftest import IMG_DIR
+from image_viewer.image.file import ImageName, ImageNameList, ImageSearchResult
+from tests.conftest import EXAMPLE_PNG_PATH, IMG_DIR
 from tests.utils.mocks import MockImage, MockStatResult
 
 _MODULE_PATH = "image_viewer.files.file_manager"
@@ -77,6 +80,22 @@ def test_move_index(file_manager: ImageFileManager) -> None:
     assert file_manager._files.display_index == 0
 
 
+def test_get_paths_to_nearby_images(
+    file_manager_with_3_images: ImageFileManager,
+) -> None:
+    """Should get images on both sides with wrap around and no duplicates"""
+    file_manager: ImageFileManager = file_manager_with_3_images
+
+    assert file_manager.get_paths_to_nearby_images(1) == [
+        file_manager.get_path_to_image("c.jpg"),
+        file_manager.get_path_to_image("e.webp"),
+    ]
+    assert len(file_manager.get_paths_to_nearby_images(5)) == 2
+
+    file_manager._files = ImageNameList([ImageName("a.png")])
+    assert file_manager.get_paths_to_nearby_images(1) == []
+
+
 def test_delete_file(file_manager: ImageFileManager) -> None:
     """Tests deleting a file from disk via file manager"""
 
@@ -148,6 +167,204 @@ def test_undo(file_manager: ImageFileManager) -> None:
         mock_undo.assert_called_once()
 
 
+def test_undo_action_group(file_manager: ImageFileManager) -> None:
+    """Should update files for every action in a group"""
+    file_manager._files = ImageNameList([ImageName("a.png"), ImageName("b.webp")])
+    group = ActionGroup("converting to webp", [Convert("a.png", "b.webp")])
+    file_manager.action_queue.append(group)
+
+    with (
+        patch(f"{_MODULE_PATH}.ask_yes_no", return_value=True),
+        patch.object(Convert, "undo", return_value=("", "b.webp")),
+    ):
+        assert file_manager.undo_most_recent_action()
+
+    assert [image.name for image in file_manager._files] == ["a.png"]
+    assert not file_manager.action_queue
+
+
+def test_undo_action_group_restores(file_manager: ImageFileManager) -> None:
+    """Should swap every image in a group at once and stay on the current image"""
+    file_manager._files = ImageNameList(
+        [*map(ImageName, ("a.webp", "b.webp", "c.jpg"))]
+    )
+    file_manager._files.move_index(2)
+    file_manager._update_after_move_or_edit()
+
+    group = ActionGroup(
+        "converting to webp",
+        [
+            Convert(file_manager.get_path_to_image(f"{name}.png"), f"{name}.webp", True)
+            for name in ("a", "b")
+        ],
+    )
+    file_manager.action_queue.append(group)
+
+    with (
+        patch(f"{_MODULE_PATH}.ask_yes_no", return_value=True) as mock_ask,
+        patch("image_viewer.files.actions.trash_file"),
+        patch("image_viewer.files.actions.restore_file"),
+    ):
+        assert file_manager.undo_most_recent_action()
+
+    mock_ask.assert_called_once()
+    assert [image.name for image in file_manager._files] == ["a.png", "b.png", "c.jpg"]
+    assert file_manager.current_image.name == "c.jpg"
+
+
+def test_undo_depth(image_cache: ImageCache) -> None:
+    """Should only keep as many actions as configured"""
+    file_manager = ImageFileManager(EXAMPLE_PNG_PATH, image_cache, undo_depth=2)
+
+    for name in ("a.png", "b.png", "c.png"):
+        file_manager.action_queue.append(Rename(name, "new.png"))
+
+    assert [action.original_path for action in file_manager.action_queue] == [
+        "b.png",
+        "c.png",
+    ]
+
+
+def test_start_batch_convert(file_manager: ImageFileManager) -> None:
+    """Should convert images with the current image's type to new paths
+    that don't exist yet and reject bad input"""
+    file_manager._files = ImageNameList(
+        [*map(ImageName, ("a.png", "b.jpe", "c.png", "d.png"))]
+    )
+
+    for bad_input in ("*.txt", "*.png", "*.webp:slowest", "*.webp:"):
+        with pytest.raises(ValueError):
+            file_manager.start_batch_convert(bad_input)
+
+    with (
+        patch(f"{_MODULE_PATH}.os.path.exists", lambda path: path.endswith("c.webp")),
+        patch(
+            "image_viewer.files.batch_convert.BatchConverter"
+        ) as mock_batch_converter,
+    ):
+        file_manager.start_batch_convert("*.WEBP:fast")
+
+    mock_batch_converter.assert_called_once_with(
+        [
+            (file_manager.get_path_to_image(name), file_manager.get_path_to_image(new))
+            for name, new in (("a.png", "a.webp"), ("d.png", "d.webp"))
+        ],
+        "webp",
+        10,
+        96,
+    )
+
+    with (
+        patch(f"{_MODULE_PATH}.os.path.exists", return_value=True),
+        pytest.raises(ValueError),
+    ):
+        file_manager.start_batch_convert("*.webp")
+
+
+def test_add_and_finish_batch_convert(file_manager: ImageFileManager) -> None:
+    """Should add converted images without moving the current image
+    and record all of them as one action"""
+    file_manager._files = ImageNameList([ImageName("a.png"), ImageName("b.png")])
+    file_manager._files.move_index(1)
+
+    actions: list[Convert] = [
+        Convert(file_manager.get_path_to_image("a.png"), "a.webp"),
+        Convert(file_manager.get_path_to_image("b.png"), "b.webp"),
+    ]
+    file_manager.add_batch_converted_images(actions)
+    assert len(file_manager._files) == 4
+    assert file_manager.current_image.name == "b.png"
+
+    batch_converter = MagicMock(target_format="webp", converted=actions)
+    file_manager.finish_batch_convert(batch_converter)
+    group = file_manager.action_queue[-1]
+    assert isinstance(group, ActionGroup)
+    assert group.actions == actions
+
+
+@pytest.mark.parametrize(
+    ("user_input", "expected"),
+    [
+        ("new.webp:fast", ("new.webp", "fast")),
+        ("new.webp:my_profile", ("new.webp", "my_profile")),
+        ("new.webp", ("new.webp", "")),
+        (":fast", (":fast", "")),
+        ("C:new.webp", ("C:new.webp", "")),
+        ("C:\\dir\\new.webp", ("C:\\dir\\new.webp", "")),
+        ("*.webp:fast", ("*.webp", "fast")),
+        ("notes:draft", ("notes:draft", "")),
+        ("new.png:fast", ("new.png:fast", "")),
+    ],
+)
+def test_split_encoder_profile(user_input: str, expected: tuple[str, str]) -> None:
+    """Should only split off profiles that are single words after a convert"""
+    assert ImageFileManager._split_encoder_profile(user_input, "png") == expected
+
+
+def test_rename_or_convert_with_profile(image_cache: ImageCache) -> None:
+    """Should start converting with encoder settings from config profiles"""
+    file_manager = ImageFileManager(
+        EXAMPLE_PNG_PATH, image_cache, {"webp": {"small": (2, 50)}}
+    )
+
+    with (
+        patch(f"{_MODULE_PATH}.can_convert", return_value=True),
+        patch(
+            "image_viewer.files.background_convert.BackgroundConverter"
+        ) as mock_converter,
+    ):
+        converter = file_manager.rename_or_convert_current_image(
+            MockImage(), "new.webp:small"
+        )
+
+    assert converter is mock_converter.return_value
+    mock_converter.assert_called_once_with(
+        EXAMPLE_PNG_PATH, os.path.join(IMG_DIR, "new.webp"), "webp", 50, 2
+    )
+    # Nothing changes until the conversion finishes
+    assert not file_manager.action_queue
+
+    with pytest.raises(ValueError):
+        file_manager.rename_or_convert_current_image(MockImage(), "new.webp:missing")
+
+
+@pytest.mark.parametrize("delete_original", [True, False])
+def test_finish_convert(file_manager: ImageFileManager, delete_original: bool) -> None:
+    """Should add the converted image and show it in place of a deleted original"""
+    file_manager._files = ImageNameList([*map(ImageName, ("a.png", "c.jpg"))])
+    file_manager._update_after_move_or_edit()
+
+    converter = MagicMock(
+        converted=True,
+        original_path=file_manager.get_path_to_image("a.png"),
+        new_path=file_manager.get_path_to_image("b.webp"),
+        target_format="webp",
+    )
+    with (
+        patch(f"{_MODULE_PATH}.ask_yes_no", return_value=delete_original),
+        patch(f"{_MODULE_PATH}.trash_file") as mock_trash,
+    ):
+        file_manager.finish_convert(converter)
+
+    assert (mock_trash.call_count == 1) is delete_original
+    names: list[str] = [image.name for image in file_manager._files]
+    if delete_original:
+        assert names == ["b.webp", "c.jpg"]
+        assert file_manager.current_image.name == "b.webp"
+    else:
+        assert names == ["a.png", "b.webp", "c.jpg"]
+        assert file_manager.current_image.name == "a.png"
+
+    action = file_manager.action_queue[-1]
+    assert isinstance(action, Convert)
+    assert action.original_file_deleted is delete_original
+
+    # Failed or cancelled conversions change nothing
+    converter.converted = False
+    file_manager.finish_convert(converter)
+    assert len(file_manager.action_queue) == 1
+
+
 # TODO: Clean test up
 def test_get_and_show_details(file_manager: ImageFileManager) -> None:
     """Should return a string containing details on current cached image and show it"""
@@ -214,6 +431,17 @@ def test_move_to_new_file(file_manager: ImageFileManager) -> None:
         assert file_manager.image_folder == IMG_DIR
 
 
+def test_move_to_path(file_manager: ImageFileManager) -> None:
+    """Should keep cached images when moving within the current folder"""
+    file_manager.update_files_with_known_starting_image()
+
+    with patch.object(ImageCache, "clear") as mock_clear:
+        file_manager.move_to_path(os.path.join(IMG_DIR, "d.jpg"))
+        mock_clear.assert_not_called()
+
+    assert file_manager.current_image.name == "d.jpg"
+
+
 def test_move_to_new_file_cancelled(file_manager: ImageFileManager) -> None:
     """When user closes file dialog, function exits immediately"""
     with patch(
@@ -231,3 +459,85 @@ def test_current_image_cache_still_fresh(file_manager: ImageFileManager) -> None
         file_manager.current_image_cache_still_fresh()
 
         mock_image_cache_still_fresh.assert_called_once_with(file_manager.path_to_image)
+
+
+def test_toggle_recursive_browsing(file_manager: ImageFileManager) -> None:
+    """Should include images in subfolders once their scans complete"""
+    file_manager.toggle_recursive_browsing()
+    assert file_manager.recursive
+    assert len(file_manager._files) == 7
+
+    walker = file_manager._folder_walker
+    assert walker is not None
+    while walker._scans:
+        time.sleep(0.01)
+        file_manager.move_index(0)
+
+    assert len(file_manager._files) == 9
+    assert file_manager.current_image.name == "a.png"
+
+    file_manager._files.set_index_to_image("sub_folder.png/large.jpg")
+    file_manager.move_index(0)
+    assert file_manager.path_to_image == os.path.join(
+        IMG_DIR, "sub_folder.png", "large.jpg"
+    )
+
+    # Updates within the same folder keep images found in subfolders
+    file_manager.update_files_with_known_starting_image()
+    assert file_manager._folder_walker is walker
+    assert len(file_manager._files) == 9
+    assert file_manager.current_image.name == "sub_folder.png/large.jpg"
+    assert not walker._pending_folders
+
+    # Turning off should continue in the current image's folder
+    file_manager.toggle_recursive_browsing()
+    assert not file_manager.recursive
+    assert file_manager._folder_walker is None
+    assert file_manager.image_folder == os.path.join(IMG_DIR, "sub_folder.png")
+    assert file_manager.current_image.name == "large.jpg"
+    assert len(file_manager._files) == 2
+
+
+def test_cycle_sort_mode(file_manager: ImageFileManager) -> None:
+    """Should sort by each mode while staying on the current image"""
+    file_manager.update_files_with_known_starting_image()
+    current_image_name: str = file_manager.current_image.name
+
+    expected_modes = (
+        SortMode.MODIFIED_TIME,
+        SortMode.SIZE,
+        SortMode.DIMENSIONS,
+        SortMode.NAME,
+    )
+    for expected_mode in expected_modes:
+        file_manager.cycle_sort_mode()
+
+        assert file_manager.sort_mode == expected_mode
+        assert file_manager.current_image.name == current_image_name
+        assert len(file_manager._files) == 7
+
+    file_manager.sort_mode = SortMode.MODIFIED_TIME
+    file_manager.cycle_sort_mode()
+    sizes: list[int] = [
+        file_manager.metadata_index[image.name].size for image in file_manager._files
+    ]
+    assert sizes == sorted(sizes)
+
+
+def test_cycle_sort_mode_uses_index(file_manager: ImageFileManager) -> None:
+    """Should only stat unindexed images and sort by dimensions once read"""
+    file_manager.update_files_with_known_starting_image()
+    file_manager.cycle_sort_mode()
+
+    with patch.object(FileMetadataIndex, "update_stats") as mock_update:
+        file_manager.cycle_sort_mode()
+        mock_update.assert_not_called()
+
+    file_manager.cycle_sort_mode()
+    assert file_manager.sort_mode == SortMode.DIMENSIONS
+    pixel_counts: list[int] = [
+        file_manager.metadata_index[image.name].pixel_count
+        for image in file_manager._files
+    ]
+    assert pixel_counts == sorted(pixel_counts)
+    assert pixel_counts[-1] > 0
@@ -0,0 +1,78 @@
+import time
+
+from image_viewer.files.folder_walker import (
+    MAX_SCAN_WORKERS,
+    FolderScanResult,
+    LazyFolderWalker,
+)
+from image_viewer.image.file import ImageName, ImageNameList
+from tests.conftest import IMG_DIR
+
+
+def _wait_for_scans(walker: LazyFolderWalker) -> list[FolderScanResult]:
+    results: list[FolderScanResult] = []
+    while walker._scans:
+        time.sleep(0.01)
+        results += walker.collect_finished_scans()
+
+    return results
+
+
+def test_scan_root() -> None:
+    """Should only scan root and queue its subfolders"""
+    walker = LazyFolderWalker(IMG_DIR)
+
+    image_names: list[str] = walker.scan_root()
+
+    assert len(image_names) == 7
+    assert walker._pending_folders == ["sub_folder.png"]
+    assert not walker.finished
+
+    # Scanning again finds the same images without queueing folders twice
+    assert walker.scan_root() == image_names
+    assert walker._pending_folders == ["sub_folder.png"]
+
+
+def test_scan_folders_near_index() -> None:
+    """Should scan pending folders close to the current index"""
+    walker = LazyFolderWalker(IMG_DIR)
+    files = ImageNameList(sorted(map(ImageName, walker.scan_root())))
+
+    walker.scan_folders_near_index(files)
+    results: list[FolderScanResult] = _wait_for_scans(walker)
+
+    assert len(results) == 1
+    assert results[0].folder == "sub_folder.png"
+    assert sorted(results[0].image_names) == [
+        "sub_folder.png/e.dds",
+        "sub_folder.png/large.jpg",
+    ]
+    assert walker.finished
+
+    walker.stop()
+
+
+def test_far_folders_not_scanned() -> None:
+    """Should not scan folders far from the current index"""
+    walker = LazyFolderWalker(IMG_DIR)
+    walker._pending_folders = ["sub_folder.png"]
+    files = ImageNameList([ImageName(f"{i:03}.png") for i in range(100)])
+    files._display_index = 50
+
+    walker.scan_folders_near_index(files)
+
+    assert not walker._scans
+    assert walker._pending_folders == ["sub_folder.png"]
+
+
+def test_scan_limited_when_not_sorted_by_name() -> None:
+    """Should only scan as many folders as there are workers at a time"""
+    walker = LazyFolderWalker(IMG_DIR)
+    walker._pending_folders = [f"missing_{i}" for i in range(MAX_SCAN_WORKERS + 2)]
+    files = ImageNameList([ImageName("a.png")], lambda image: (0, image.name))
+
+    walker.scan_folders_near_index(files)
+
+    assert len(walker._scans) == MAX_SCAN_WORKERS
+    assert len(walker._pending_folders) == 2
+    walker.stop()
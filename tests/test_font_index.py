@@ -0,0 +1,88 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from image_viewer.utils.font_index import FontIndex, find_font_path
+
+
+@pytest.fixture(name="font_folders")
+def font_folders_fixture(tmp_path: str) -> list[str]:
+    user_fonts: str = os.path.join(tmp_path, "user_fonts")
+    system_fonts: str = os.path.join(tmp_path, "system_fonts")
+    os.makedirs(os.path.join(system_fonts, "truetype"))
+
+    for font_path in (
+        os.path.join(system_fonts, "truetype", "a.ttf"),
+        os.path.join(system_fonts, "b.otf"),
+    ):
+        with open(font_path, "w", encoding="utf-8"):
+            pass
+
+    return [user_fonts, system_fonts]
+
+
+def test_build_read_write(font_folders: list[str], tmp_path: str) -> None:
+    """Should find fonts in subfolders and read back what was written"""
+    font_index = FontIndex.build(font_folders)
+    system_fonts: str = font_folders[1]
+
+    assert font_index.fonts == {
+        "a.ttf": os.path.join(system_fonts, "truetype", "a.ttf"),
+        "b.otf": os.path.join(system_fonts, "b.otf"),
+    }
+    assert font_index.is_current(font_folders)
+
+    index_path: str = os.path.join(tmp_path, "cache", "font_index.txt")
+    font_index.write(index_path)
+    read_index: FontIndex | None = FontIndex.read(index_path)
+
+    assert read_index is not None
+    assert read_index.fonts == font_index.fonts
+    assert read_index.folder_mtimes == font_index.folder_mtimes
+
+
+def test_read_bad_index(tmp_path: str) -> None:
+    """Should return None when the index is missing or malformed"""
+    index_path: str = os.path.join(tmp_path, "font_index.txt")
+    assert FontIndex.read(index_path) is None
+
+    with open(index_path, "w", encoding="utf-8") as fp:
+        fp.write("D\tnot a number\t/fonts\n")
+
+    assert FontIndex.read(index_path) is None
+
+
+def test_is_current(font_folders: list[str]) -> None:
+    """Should be stale when a folder it read changes or a new folder is searched"""
+    font_index = FontIndex.build(font_folders)
+    assert not font_index.is_current([*font_folders, "/new_fonts"])
+
+    os.makedirs(font_folders[0])  # User fonts folder created
+    assert not font_index.is_current(font_folders)
+
+    font_index = FontIndex.build(font_folders)
+    truetype_folder: str = os.path.join(font_folders[1], "truetype")
+    os.utime(truetype_folder, ns=(0, 0))
+    assert not font_index.is_current(font_folders)
+
+
+def test_find_font_path(font_folders: list[str], tmp_path: str) -> None:
+    """Should only walk font folders when the cached index is stale"""
+    index_path: str = os.path.join(tmp_path, "font_index.txt")
+
+    with patch(
+        "image_viewer.utils.font_index.get_font_folders", return_value=font_folders
+    ):
+        assert find_font_path("b.otf", index_path) == os.path.join(
+            font_folders[1], "b.otf"
+        )
+
+        with patch.object(FontIndex, "build") as mock_build:
+            assert find_font_path("b.otf", index_path) == os.path.join(
+                font_folders[1], "b.otf"
+            )
+            mock_build.assert_not_called()
+
+        with pytest.raises(RuntimeError):
+            find_font_path("missing.ttf", index_path)
@@ -2,9 +2,9 @@
 
 from unittest.mock import patch
 
-from PIL.Image import Image
+from PIL.Image import Image, new
 
-from image_viewer.image.cache import ImageCache, ImageCacheEntry
+from image_viewer.image.cache import ImageCache, ImageCacheEntry, ZoomLevelCache
 from tests.utils.mocks import MockStatResult
 
 
@@ -75,6 +75,57 @@ def test_image_cache_fresh(image_cache: ImageCache) -> None:
         assert not image_cache.image_cache_still_fresh(path)
 
 
+def test_zoom_level_cache_evicts_farthest() -> None:
+    """Should evict levels farthest from the current level when over max bytes,
+    but never level 0 or the level just added."""
+
+    # Each 10x10 RGB image is 300 bytes
+    zoom_levels = ZoomLevelCache(1000)
+    for zoom_level in range(3):
+        zoom_levels.add(zoom_level, new("RGB", (10, 10)), zoom_level)
+
+    assert zoom_levels.byte_size == 900
+
+    zoom_levels.add(3, new("RGB", (10, 10)), 3)
+    assert set(zoom_levels) == {0, 2, 3}
+    assert zoom_levels.byte_size == 900
+
+    zoom_levels.add(4, new("RGB", (30, 30)), 4)
+    assert set(zoom_levels) == {0, 4}
+
+
+def test_zoom_level_cache_trim() -> None:
+    """Should keep level 0 and the levels closest to it."""
+
+    zoom_levels = ZoomLevelCache(10_000)
+    for zoom_level in range(5):
+        zoom_levels.add(zoom_level, new("RGB", (10, 10)), zoom_level)
+
+    zoom_levels.trim(2)
+
+    assert set(zoom_levels) == {0, 1, 2}
+    assert zoom_levels.byte_size == 900
+
+
+def test_persist_zoom_levels() -> None:
+    """Should store zoom levels with an entry and drop the zoom levels of
+    least recently used entries when over the byte limit."""
+
+    cache = ImageCache(3)
+    cache["entry1"] = _get_empty_cache_entry()
+    cache["entry2"] = _get_empty_cache_entry()
+
+    for key in ("entry1", "entry2", "missing"):
+        zoom_levels = ZoomLevelCache(10_000)
+        zoom_levels.add(0, new("RGB", (10, 10)), 0)
+        zoom_levels.add(1, new("RGB", (10, 10)), 1)
+        with patch("image_viewer.image.cache.MAX_PERSISTED_ZOOM_BYTES", 1000):
+            cache.persist_zoom_levels(key, zoom_levels)
+
+    assert cache["entry1"].zoom_levels is None
+    assert cache["entry2"].zoom_levels is not None
+
+
 def _get_empty_cache_entry() -> ImageCacheEntry:
     """Returns an ImageCacheEntry with placeholder values"""
     return ImageCacheEntry(Image(), (0, 0), 0, "", "")
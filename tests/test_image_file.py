@@ -35,3 +35,55 @@ def test_remove_current_image(
     image_names.remove_current_image(index_movement)
 
     assert image_names._display_index == expected_index
+
+
+@pytest.mark.parametrize(
+    ("starting_index", "insertion_index", "expected_index"),
+    [(0, 0, 2), (1, 1, 3), (1, 2, 1)],
+)
+def test_insert_sorted_and_preserve_index(
+    starting_index: int, insertion_index: int, expected_index: int
+) -> None:
+    """Should keep index on the same image after inserting many images"""
+    image_names = ImageNameList([ImageName("a.png"), ImageName("c.png")])
+    image_names._display_index = starting_index
+    current_image: ImageName = image_names.get_current_image()
+
+    image_names.insert_sorted_and_preserve_index(
+        insertion_index, [ImageName("b/a.png"), ImageName("b/b.png")]
+    )
+
+    assert image_names._display_index == expected_index
+    assert image_names.get_current_image() is current_image
+
+
+def test_search_with_sort_key() -> None:
+    """Should find names with a linear search and insert by key when sorted by key"""
+    sizes: dict[str, int] = {"c.png": 1, "a.png": 2, "b.png": 3, "d.png": 2}
+    image_names = ImageNameList(
+        [ImageName("c.png"), ImageName("a.png"), ImageName("b.png")],
+        lambda image: (sizes[image.name], image.name),
+    )
+
+    search_result = image_names.search("b.png")
+    assert search_result.found
+    assert search_result.index == 2
+
+    search_result = image_names.search("d.png")
+    assert not search_result.found
+    assert search_result.index == 2
+
+
+def test_insert_by_sort_key_and_preserve_index() -> None:
+    """Should insert each image where its key belongs and keep the current image"""
+    sizes: dict[str, int] = {"a.png": 1, "b.png": 3, "c.png": 2, "d.png": 0}
+    image_names = ImageNameList([ImageName("a.png"), ImageName("b.png")])
+    image_names._display_index = 1
+
+    image_names.insert_by_sort_key_and_preserve_index(
+        [ImageName("c.png"), ImageName("d.png")],
+        lambda image: (sizes[image.name], image.name),
+    )
+
+    assert [image.name for image in image_names] == ["d.png", "a.png", "c.png", "b.png"]
+    assert image_names.get_current_image().name == "b.png"
@@ -229,3 +229,101 @@ def test_get_zoomed_image(image_io: ImageIO) -> None:
     assert image_io.get_zoomed_image(ZoomDirection.IN) is zoom_2
     assert image_io.get_zoomed_image(ZoomDirection.IN) is zoom_3
     assert image_io.get_zoomed_image(ZoomDirection.OUT) is zoom_2
+
+
+def test_get_zoomed_image_after_revisit(image_io: ImageIO) -> None:
+    """Should reuse zoom levels persisted when revisiting an image."""
+
+    assert image_io.load_image(EXAMPLE_JPEG_PATH)
+    zoom_1: Image | None = image_io.get_zoomed_image(ZoomDirection.IN)
+    assert zoom_1
+
+    image_io.reset_and_setup()
+    assert image_io.load_image(EXAMPLE_JPEG_PATH)
+
+    assert image_io.get_zoomed_image(ZoomDirection.IN) is zoom_1
+
+
+def test_zoom_level_not_added_after_persisting(image_io: ImageIO) -> None:
+    """Should not cache zoom levels that finish after moving to another image."""
+
+    assert image_io.load_image(EXAMPLE_JPEG_PATH)
+    mip_chain = image_io.mip_chain
+    zoomed_image_cache = image_io.zoomed_image_cache
+    load_id: int = image_io.current_load_id
+
+    image_io.reset_and_setup()
+    byte_size: int = zoomed_image_cache.byte_size
+
+    image_io.load_zoom_level(mip_chain, zoomed_image_cache, 1, False, load_id)
+    image_io.precompute_zoom_levels(mip_chain, zoomed_image_cache, load_id)
+
+    assert not zoomed_image_cache.keys() - {0}
+    assert zoomed_image_cache.byte_size == byte_size
+
+
+def test_get_zoom_preview(image_io: ImageIO) -> None:
+    """Should return an uncached preview the size of the next zoom level."""
+
+    assert image_io.load_image(EXAMPLE_JPEG_PATH)
+
+    preview: Image | None = image_io.get_zoom_preview(ZoomDirection.IN)
+    assert preview
+    assert preview.size == (1458, 1458)
+    assert not image_io.zoom_level_cached
+
+    zoom_1: Image | None = image_io.get_zoomed_image_at_current_level()
+    assert zoom_1
+    assert zoom_1.size == preview.size
+    assert image_io.zoom_level_cached
+
+    # Cached levels are returned as is
+    image_io._state.zoom_level = 0
+    assert image_io.get_zoom_preview(ZoomDirection.IN) is zoom_1
+
+
+def test_load_zoom_level(image_io: ImageIO) -> None:
+    """Should cache a zoom level unless another image was loaded."""
+
+    assert image_io.load_image(EXAMPLE_JPEG_PATH)
+    preview: Image | None = image_io.get_zoom_preview(ZoomDirection.IN)
+    assert preview
+
+    image_io.load_zoom_level(
+        image_io.mip_chain,
+        image_io.zoomed_image_cache,
+        1,
+        False,
+        image_io.current_load_id - 1,
+    )
+    assert not image_io.zoom_level_cached
+
+    image_io.begin_zoom_level_load()
+    assert image_io._zoom_level_thread is not None
+    image_io._zoom_level_thread.join()
+
+    assert not image_io.zoom_level_loading
+    assert image_io.zoom_level_cached
+    zoom_1: Image | None = image_io.get_zoomed_image_at_current_level()
+    assert zoom_1
+    assert zoom_1.size == preview.size
+
+
+def test_precompute_zoom_levels(image_io: ImageIO) -> None:
+    """Should cache the first zoom levels unless another image was loaded."""
+
+    assert image_io.load_image(EXAMPLE_JPEG_PATH)
+
+    image_io.precompute_zoom_levels(
+        image_io.mip_chain, image_io.zoomed_image_cache, image_io.current_load_id - 1
+    )
+    assert not image_io.zoomed_image_cache.keys() - {0}
+
+    image_io.precompute_zoom_levels(
+        image_io.mip_chain, image_io.zoomed_image_cache, image_io.current_load_id
+    )
+    zoom_1: Image | None = image_io.zoomed_image_cache.get(1)
+    assert zoom_1
+    assert 2 in image_io.zoomed_image_cache
+
+    assert image_io.get_zoomed_image(ZoomDirection.IN) is zoom_1
@@ -7,7 +7,7 @@ from PIL.Image import new as new_image
 
 from image_viewer.image._read import JPEG
 from image_viewer.image.image_io import ImageIO, ReadImageResponse
-from image_viewer.image.resizer import ImageResizer
+from image_viewer.image.resizer import ImageResizer, MipChain
 from image_viewer.utils.PIL import resize
 from tests.conftest import IMG_DIR
 
@@ -124,3 +124,41 @@ def test_get_image_fit_to_screen(
         mock_get_jpeg_fit_to_screen.assert_not_called()
 
     assert resized_image.mode == image.mode
+
+
+def test_mip_chain() -> None:
+    """Should return the smallest reduction still larger than the target"""
+    image: Image = new_image("RGB", (1000, 800))
+    view = MagicMock()
+    view.format = "asdf"
+
+    mip_chain = MipChain(image, view)
+
+    assert mip_chain.get_source_for(1200, 900) is image
+    assert mip_chain.get_source_for(600, 500) is image
+
+    mip: Image = mip_chain.get_source_for(300, 200)
+    assert mip.size == (500, 400)
+    assert mip_chain.get_source_for(300, 200) is mip
+
+    assert mip_chain.get_source_for(100, 50).size == (125, 100)
+
+    palette_image: Image = new_image("P", (1000, 800))
+    assert MipChain(palette_image, view).get_source_for(100, 50) is palette_image
+
+
+def test_mip_chain_jpeg(image_io: ImageIO) -> None:
+    """Should reduce RGB JPEGs while decoding"""
+    read_image_response: ReadImageResponse | None = image_io.read_image(
+        IMG_DIR + "/sub_folder.png/large.jpg"
+    )
+    assert read_image_response is not None
+    image: Image = read_image_response.image
+    width, height = image.size
+
+    mip_chain = MipChain(image, read_image_response.image_view)
+    with patch.object(Image, "reduce") as mock_reduce:
+        mip: Image = mip_chain.get_source_for(width // 4, height // 4)
+        mock_reduce.assert_not_called()
+
+    assert mip.size == (width // 4, height // 4)
@@ -7,21 +7,33 @@ import pytest
 from psleak import MemoryLeakTestCase
 
 from image_viewer._config import parse_config_file
+from image_viewer.constants import VALID_FILE_TYPES
 from image_viewer.image._read import (
     CRawImageView,
     decode_jpeg_downscaled,
+    probe_image,
     read_image_into_buffer,
 )
-from tests.conftest import EXAMPLE_JPEG_PATH, IMG_DIR, ONLY_ON_WINDOWS
+from image_viewer.image._resize import resize_premultiplied
+from tests.conftest import EXAMPLE_JPEG_PATH, IMG_DIR, ONLY_ON_LINUX, ONLY_ON_WINDOWS
 
 if sys.platform == "win32":
     from image_viewer.utils._os_nt import (
         get_files_in_folder,
         read_buffer_as_base64_and_copy_to_clipboard,
     )
+
+    # mypy
+    get_files_in_folder_with_suffixes = lambda *_: ""
+    get_file_stats_in_folder = lambda *_: ""
 else:
+    from image_viewer.utils._os_linux import (
+        get_file_stats_in_folder,
+        get_files_in_folder,
+        get_files_in_folder_with_suffixes,
+    )
+
     # mypy
-    get_files_in_folder = lambda _: ""
     read_buffer_as_base64_and_copy_to_clipboard = lambda _: ""
 
 
@@ -65,10 +77,23 @@ class TestLeaks(MemoryLeakTestCase):
 
         self.execute(decode_jpeg_downscaled, image_buffer, 2)
 
-    @pytest.mark.skipif(sys.platform != "win32", reason=ONLY_ON_WINDOWS)
+    def test_probe_image(self) -> None:
+        self.execute(probe_image, EXAMPLE_JPEG_PATH)
+
+    def test_resize_premultiplied(self) -> None:
+        self.execute(resize_premultiplied, bytes(64 * 48 * 4), 4, 64, 48, 30, 20, 1)
+
     def test_get_files_in_folder(self) -> None:
         self.execute(get_files_in_folder, IMG_DIR)
 
+    @pytest.mark.skipif(sys.platform != "linux", reason=ONLY_ON_LINUX)
+    def test_get_files_in_folder_with_suffixes(self) -> None:
+        self.execute(get_files_in_folder_with_suffixes, IMG_DIR, VALID_FILE_TYPES)
+
+    @pytest.mark.skipif(sys.platform != "linux", reason=ONLY_ON_LINUX)
+    def test_get_file_stats_in_folder(self) -> None:
+        self.execute(get_file_stats_in_folder, IMG_DIR, ["a.png", "missing.png"])
+
     @pytest.mark.skipif(sys.platform != "win32", reason=ONLY_ON_WINDOWS)
     def test_read_buffer_as_base64_and_copy_to_clipboard(self) -> None:
         image_view: CRawImageView | None = read_image_into_buffer(EXAMPLE_JPEG_PATH)
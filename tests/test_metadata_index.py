@@ -0,0 +1,100 @@
+import os
+from unittest.mock import patch
+
+from image_viewer.constants import SortMode
+from image_viewer.files.metadata_index import (
+    FileMetadata,
+    FileMetadataIndex,
+    _read_dimensions,
+)
+from image_viewer.image.file import ImageName
+from tests.conftest import IMG_DIR
+
+
+def test_update_stats() -> None:
+    """Should stat images and forget ones that no longer exist"""
+    metadata_index = FileMetadataIndex(IMG_DIR)
+    metadata_index["gone.png"] = FileMetadata(0, 0)
+
+    metadata_index.update_stats(["a.png", "d.jpg", "gone.png"])
+
+    assert set(metadata_index) == {"a.png", "d.jpg"}
+    assert metadata_index["a.png"].size == os.path.getsize(
+        os.path.join(IMG_DIR, "a.png")
+    )
+
+
+def test_dimensions_kept_for_unchanged_files() -> None:
+    """Should only reset dimensions when a file changes"""
+    metadata_index = FileMetadataIndex(IMG_DIR)
+    metadata_index.update_stats(["a.png"])
+    metadata_index["a.png"].dimensions = (1, 2)
+
+    metadata_index.update_stats(["a.png"])
+    assert metadata_index["a.png"].dimensions == (1, 2)
+
+    metadata_index["a.png"].size += 1
+    metadata_index.update_stats(["a.png"])
+    assert metadata_index["a.png"].dimensions is None
+
+
+def test_load_dimensions() -> None:
+    """Should read dimensions from headers and use 0x0 for unreadable files"""
+    metadata_index = FileMetadataIndex(IMG_DIR)
+    metadata_index.update_stats(["d.jpg", "not_an_image.txt"])
+
+    metadata_index.start_loading_dimensions()
+    metadata_index._dimension_loads[0][1].result()
+
+    # Dimensions are only stored once collected
+    assert metadata_index["d.jpg"].dimensions is None
+    assert metadata_index.collect_loaded_dimensions()
+    assert metadata_index["d.jpg"].pixel_count > 0
+    assert metadata_index["not_an_image.txt"].dimensions == (0, 0)
+    assert not metadata_index.collect_loaded_dimensions()
+
+
+def test_get_sort_key() -> None:
+    """Should return keys for metadata sort modes and None for name"""
+    metadata_index = FileMetadataIndex(IMG_DIR)
+    metadata_index["a.png"] = FileMetadata(5, 10)
+    metadata_index["a.png"].dimensions = (2, 3)
+
+    assert metadata_index.get_sort_key(SortMode.NAME) is None
+
+    image = ImageName("a.png")
+    missing_image = ImageName("missing.png")
+    for sort_mode, expected in (
+        (SortMode.MODIFIED_TIME, 5),
+        (SortMode.SIZE, 10),
+        (SortMode.DIMENSIONS, 6),
+    ):
+        sort_key = metadata_index.get_sort_key(sort_mode)
+        assert sort_key is not None
+        assert sort_key(image) == (expected, "a.png")
+        assert sort_key(missing_image) == (0, "missing.png")
+
+
+def test_sort_key_ties_ordered_by_name() -> None:
+    """Should order images with equal metadata by name"""
+    metadata_index = FileMetadataIndex(IMG_DIR)
+    metadata_index["b.png"] = FileMetadata(1, 1)
+    metadata_index["a.png"] = FileMetadata(1, 1)
+
+    sort_key = metadata_index.get_sort_key(SortMode.SIZE)
+    assert sort_key is not None
+
+    images = [ImageName("b.png"), ImageName("a.png")]
+    assert [image.name for image in sorted(images, key=sort_key)] == [
+        "a.png",
+        "b.png",
+    ]
+
+
+def test_read_dimensions_probe_fails() -> None:
+    """Should give no dimensions for an image that can't be probed"""
+    with patch(
+        "image_viewer.files.metadata_index.probe_image",
+        side_effect=UnicodeEncodeError("utf-8", "", 0, 1, ""),
+    ):
+        assert _read_dimensions(os.path.join(IMG_DIR, "a.png")) == (0, 0)
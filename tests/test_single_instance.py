@@ -0,0 +1,57 @@
+import os
+import socket
+
+import pytest
+
+from image_viewer.utils.single_instance import (
+    InstanceServer,
+    SentPathConnection,
+    send_path_to_running_viewer,
+)
+from tests.conftest import ONLY_ON_LINUX
+
+
+@pytest.mark.skipif(os.name == "nt", reason=ONLY_ON_LINUX)
+def test_receive_without_blocking() -> None:
+    """Should read a path as it arrives without waiting for the rest"""
+    client, server = socket.socketpair()
+    connection = SentPathConnection(server)
+    try:
+        assert not connection.receive()
+
+        client.sendall(b"/images/")
+        assert not connection.receive()
+
+        client.sendall(b"a.png")
+        client.close()
+        assert connection.receive()
+        assert connection.path == "/images/a.png"
+    finally:
+        connection.close()
+
+
+@pytest.mark.skipif(os.name == "nt", reason=ONLY_ON_LINUX)
+def test_send_and_receive_path(tmp_path: str) -> None:
+    """Should receive paths sent by later launches and remove the socket on close"""
+    socket_path: str = os.path.join(tmp_path, "viewer.sock")
+    assert not send_path_to_running_viewer(socket_path, "/a.png")
+
+    with open(socket_path, "w", encoding="utf-8"):
+        pass  # Left by a viewer that didn't exit cleanly
+
+    instance_server = InstanceServer(socket_path)
+    try:
+        assert instance_server.accept() is None
+
+        assert send_path_to_running_viewer(socket_path, "/images/ä.png")
+        connection = instance_server.accept()
+        assert connection is not None
+        assert connection.receive()
+        assert connection.path == "/images/ä.png"
+        connection.close()
+        assert connection.closed
+    finally:
+        instance_server.close()
+
+    assert not os.path.exists(socket_path)
+    assert not send_path_to_running_viewer(socket_path, "/a.png")
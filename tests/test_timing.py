@@ -0,0 +1,199 @@
+import json
+import os
+from threading import Thread
+from unittest.mock import patch
+
+import pytest
+
+from image_viewer.image.image_io import ImageIO
+from image_viewer.utils.timing import (
+    ImageLoadTimings,
+    SpanTracer,
+    StageTimer,
+    traced,
+)
+from tests.conftest import EXAMPLE_PNG_PATH
+
+
+@pytest.fixture(name="stage_timer")
+def stage_timer_fixture() -> StageTimer:
+    stage_timer = StageTimer()
+    stage_timer.toggle()
+    return stage_timer
+
+
+def test_measure_disabled() -> None:
+    """Should record nothing while disabled"""
+    stage_timer = StageTimer()
+    stage_timer.begin("a.png")
+
+    with stage_timer.measure("Read"):
+        pass
+    stage_timer.note("Read", "test")
+
+    assert stage_timer.current is None
+    assert not stage_timer.history
+
+
+def test_measure_and_note(stage_timer: StageTimer) -> None:
+    """Should add time of each measure to its stage and record notes"""
+    stage_timer.begin("a.png")
+
+    with stage_timer.measure("Decode"):
+        pass
+    with stage_timer.measure("Decode"):
+        pass
+    stage_timer.note("Resize", "cached")
+
+    timings: ImageLoadTimings | None = stage_timer.current
+    assert timings is not None
+    assert list(timings.stages) == ["Decode"]
+    assert timings.stages["Decode"] >= 0
+    assert timings.details == {"Resize": "cached"}
+    assert list(stage_timer.history) == [timings]
+
+
+def test_measure_other_thread(stage_timer: StageTimer) -> None:
+    """Should ignore stages measured on threads other than the one loading"""
+    stage_timer.begin("a.png")
+
+    def measure() -> None:
+        with stage_timer.measure("Resize"):
+            pass
+
+    thread = Thread(target=measure)
+    thread.start()
+    thread.join()
+
+    assert stage_timer.current is not None
+    assert not stage_timer.current.stages
+
+
+def test_toggle(stage_timer: StageTimer) -> None:
+    """Should end the current load's timings when toggled"""
+    stage_timer.begin("a.png")
+    stage_timer.toggle()
+
+    assert not stage_timer.enabled
+    assert stage_timer.current is None
+    assert len(stage_timer.history) == 1
+
+
+def test_format() -> None:
+    """Should show a line per stage with details in parentheses"""
+    timings = ImageLoadTimings("a.png")
+    timings.stages["Read"] = 1.25
+    timings.stages["Resize"] = 3
+    timings.details["Resize"] = "HAMMING"
+    timings.details["Decode"] = "cached"
+
+    assert timings.format() == "Read: 1.2 ms\nResize (HAMMING): 3.0 ms\nDecode (cached)"
+
+
+def test_export(stage_timer: StageTimer, tmp_path: str) -> None:
+    """Should write every recorded load as JSON"""
+    stage_timer.begin("a.png")
+    stage_timer.current.stages["Read"] = 1.0  # type: ignore[union-attr]
+    stage_timer.begin("b.png")
+
+    path: str = os.path.join(tmp_path, "timings.json")
+    stage_timer.export(path)
+
+    with open(path, encoding="utf-8") as fp:
+        exported = json.load(fp)
+
+    assert exported == [
+        {"path": "a.png", "stages_ms": {"Read": 1.0}, "details": {}},
+        {"path": "b.png", "stages_ms": {}, "details": {}},
+    ]
+
+
+def test_image_load_stages(stage_timer: StageTimer, image_io: ImageIO) -> None:
+    """Should time reading, opening, decoding, and resizing an image"""
+    with (
+        patch("image_viewer.image.image_io.stage_timer", stage_timer),
+        patch("image_viewer.image.resizer.stage_timer", stage_timer),
+    ):
+        stage_timer.begin(EXAMPLE_PNG_PATH)
+        assert image_io.load_image(EXAMPLE_PNG_PATH) is not None
+
+    assert stage_timer.current is not None
+    assert list(stage_timer.current.stages) == ["Read", "Open", "Decode", "Resize"]
+    assert "Resize" in stage_timer.current.details
+
+
+def test_span_disabled() -> None:
+    """Should record no spans while disabled"""
+    span_tracer = SpanTracer()
+
+    with span_tracer.span("load_image"):
+        pass
+
+    assert not span_tracer.events
+
+
+def test_span(tmp_path: str) -> None:
+    """Should export spans from each thread with thread names as a Chrome trace"""
+    span_tracer = SpanTracer()
+    span_tracer.enabled = True
+
+    with span_tracer.span("load_image", "a.png"):
+        pass
+
+    def load_frame() -> None:
+        with span_tracer.span("load_frame"):
+            pass
+
+    thread = Thread(target=load_frame, name="Animation")
+    thread.start()
+    thread.join()
+
+    span_tracer.name_process(1, "Decode Worker")
+    span_tracer.add_span("decode_into_shared_memory", 1000, 3000, 1, 2)
+
+    path: str = os.path.join(tmp_path, "trace.json")
+    span_tracer.export(path)
+
+    with open(path, encoding="utf-8") as fp:
+        events = json.load(fp)["traceEvents"]
+
+    spans = [event for event in events if event["ph"] == "X"]
+    assert [span["name"] for span in spans] == [
+        "load_image",
+        "load_frame",
+        "decode_into_shared_memory",
+    ]
+    assert spans[0]["args"] == {"detail": "a.png"}
+    assert spans[0]["tid"] != spans[1]["tid"]
+    assert spans[2] == {
+        "name": "decode_into_shared_memory",
+        "ph": "X",
+        "ts": 1,
+        "dur": 2,
+        "pid": 1,
+        "tid": 2,
+    }
+
+    names = {
+        (event["name"], event["args"]["name"]) for event in events if event["ph"] == "M"
+    }
+    assert ("thread_name", "Animation") in names
+    assert ("process_name", "Decode Worker") in names
+
+
+def test_traced() -> None:
+    """Should record calls of decorated functions while tracing"""
+    span_tracer = SpanTracer()
+
+    @traced
+    def load() -> int:
+        return 1
+
+    with patch("image_viewer.utils.timing.span_tracer", span_tracer):
+        assert load() == 1
+        span_tracer.enabled = True
+        assert load() == 1
+
+    assert [event["name"] for event in span_tracer.events] == [
+        "test_traced.<locals>.load"
+    ]
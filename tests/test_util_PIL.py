@@ -2,7 +2,7 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
-from PIL.Image import Image, new
+from PIL.Image import Image, Resampling, frombytes, new
 
 from image_viewer._config import DEFAULT_UI_FONT
 from image_viewer.image.file import ImageName
@@ -16,6 +16,8 @@ from image_viewer.utils.PIL import (
     resize,
 )
 
+_MODULE_PATH: str = "image_viewer.utils.PIL"
+
 
 def test_image_path() -> None:
     """Check that ImageName correctly finds image suffixes"""
@@ -29,22 +31,45 @@ def test_image_path() -> None:
     assert example_image_path.suffix == ""
 
 
-def test_init_PIL() -> None:  # noqa: N802
-    """Should remove all values from _plugins and set default font"""
+def test_init_PIL(tmp_path: str) -> None:  # noqa: N802
+    """Should remove all values from _plugins and set default font
+    once text is first drawn"""
     from PIL import Image as _Image
     from PIL.ImageDraw import ImageDraw
 
+    ImageDraw.font = None
     init_PIL(DEFAULT_UI_FONT, 20)
     assert len(_Image._plugins) == 0
+    assert ImageDraw.font is None
+
+    # Font index is written to the cache folder when text is first drawn
+    with patch(f"{_MODULE_PATH}.get_cache_folder", return_value=tmp_path):
+        create_dropdown_image("test")
     assert ImageDraw.font is not None
 
     del _Image, ImageDraw
 
 
-def test_create_images() -> None:
+def test_init_PIL_missing_font(tmp_path: str) -> None:  # noqa: N802
+    """Should fall back to PIL's font when the configured one isn't installed"""
+    from PIL.ImageDraw import ImageDraw
+
+    ImageDraw.font = None
+    init_PIL("not_a_font.ttf", 20)
+
+    with patch(f"{_MODULE_PATH}.get_cache_folder", return_value=tmp_path):
+        assert get_placeholder_for_errored_image(OSError("test"), 100, 100)
+    assert ImageDraw.font is not None
+
+    ImageDraw.font = None
+    del ImageDraw
+
+
+def test_create_images(tmp_path: str) -> None:
     init_PIL(DEFAULT_UI_FONT, 20)
 
-    dropdown = create_dropdown_image("test\ntest")
+    with patch(f"{_MODULE_PATH}.get_cache_folder", return_value=tmp_path):
+        dropdown = create_dropdown_image("test\ntest")
     assert isinstance(dropdown, Image)
 
     example_error = Exception("test")
@@ -71,6 +96,30 @@ def test_resize() -> None:
     assert new_image.size == (15, 15)
 
 
+@pytest.mark.parametrize("mode", ["RGBA", "LA"])
+@pytest.mark.parametrize(
+    "resample",
+    [Resampling.LANCZOS, Resampling.BICUBIC, Resampling.BOX, Resampling.HAMMING],
+)
+@pytest.mark.parametrize("size", [(7, 5), (32, 24), (100, 3)])
+def test_resize_premultiplied(
+    mode: str, resample: Resampling, size: tuple[int, int]
+) -> None:
+    """Images with alpha should match PIL's resize through premultiplied modes"""
+    pixel_data: bytes = bytes(i * 151 % 256 for i in range(17 * 13 * len(mode)))
+    example_image: Image = frombytes(mode, (17, 13), pixel_data)
+    example_image.info["duration"] = 100
+
+    new_image: Image = resize(example_image, size, resample)
+    expected: Image = (
+        example_image.convert(mode[:-1] + "a").resize(size, resample).convert(mode)
+    )
+
+    assert new_image.mode == mode
+    assert new_image.tobytes() == expected.tobytes()
+    assert new_image.info["duration"] == 100
+
+
 @pytest.mark.parametrize(
     ("mode", "pixel_data", "expected_mode"),
     [
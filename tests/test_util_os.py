@@ -3,13 +3,18 @@ from unittest.mock import patch
 
 import pytest
 
+from image_viewer.constants import VALID_FILE_TYPES
 from image_viewer.utils.os import (
     get_byte_display,
+    get_cache_folder,
+    get_file_stats_in_folder,
     get_files_in_folder,
+    get_files_in_folder_with_suffixes,
+    get_folders_in_folder,
     maybe_truncate_long_name,
     split_name_and_suffix,
 )
-from tests.conftest import IMG_DIR
+from tests.conftest import IMG_DIR, ONLY_ON_LINUX
 
 
 @pytest.mark.parametrize("os_name", ["nt", "linux"])
@@ -24,6 +29,18 @@ def test_get_byte_display(os_name: str) -> None:
         assert get_byte_display(1000 * kb_size) == expected_display_1000kb
 
 
+@pytest.mark.skipif(os.name == "nt", reason=ONLY_ON_LINUX)
+def test_get_cache_folder() -> None:
+    """Should use XDG_CACHE_HOME, falling back to ~/.cache"""
+    with patch.dict(os.environ, {"XDG_CACHE_HOME": "/cache"}):
+        assert get_cache_folder() == "/cache/personal_image_viewer"
+
+    with patch.dict(os.environ, {"XDG_CACHE_HOME": ""}):
+        assert get_cache_folder() == os.path.expanduser(
+            "~/.cache/personal_image_viewer"
+        )
+
+
 def test_truncate_long_name() -> None:
     """Should truncate names relative to size passed"""
     assert maybe_truncate_long_name("abcdefgh.png", 5, 5) == "abcdefgh.png"
@@ -49,3 +66,33 @@ def test_get_files_in_folder() -> None:
 
     files = list(get_files_in_folder(IMG_DIR))
     assert len(files) == 8
+
+
+def test_get_files_in_folder_with_suffixes() -> None:
+    """Should only find files with a matching suffix, ignoring case"""
+
+    files = get_files_in_folder_with_suffixes(IMG_DIR, VALID_FILE_TYPES)
+    assert len(files) == 7
+    assert "not_an_image.txt" not in files
+
+    files = get_files_in_folder_with_suffixes(IMG_DIR, ["PNG", "txt"])
+    assert sorted(files) == ["a.png", "not_an_image.txt"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason=ONLY_ON_LINUX)
+def test_folder_names_not_utf8(tmp_path: str) -> None:
+    """Should list and stat in folders whose names aren't valid UTF-8"""
+    folder_name: str = os.fsdecode(b"folder\xff")
+    folder: str = os.path.join(tmp_path, folder_name)
+    os.mkdir(folder)
+    image_name: str = os.fsdecode(b"image\xfe.png")
+    with open(os.path.join(folder, image_name), "wb") as fp:
+        fp.write(b"0")
+
+    assert get_folders_in_folder(str(tmp_path)) == [folder_name]
+    assert get_files_in_folder(folder) == [image_name]
+    assert get_files_in_folder_with_suffixes(folder, ["png"]) == [image_name]
+
+    stats = get_file_stats_in_folder(folder, [image_name])
+    assert stats[0] is not None
+    assert stats[0][1] == 1
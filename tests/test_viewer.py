@@ -1,10 +1,14 @@
 """Tests for the ViewerApp class."""
 
+import tkinter as tk
+from tkinter import CallWrapper
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from image_viewer.viewer import ViewerApp
+from image_viewer.utils.timing import span_tracer, stage_timer
+from image_viewer.viewer import TracedCallWrapper, ViewerApp
+from tests.conftest import EXAMPLE_PNG_PATH
 from tests.utils.mocks import MockEvent
 
 _MODULE_PATH: str = "image_viewer.viewer"
@@ -175,3 +179,92 @@ def test_copy_to_clipboard_as_base64(viewer: ViewerApp) -> None:
         viewer.app.clipboard_get()
         == "R0lGODdhAgACAKEEAKykvbi1vNLQxd3c2CwAAAAAAgACAAACA0QmBQA7"
     )
+
+
+def test_export_as_data_uri(viewer: ViewerApp) -> None:
+    """Should only run one export at a time"""
+    with patch(
+        "image_viewer.files.base64_export.BackgroundBase64Exporter"
+    ) as mock_exporter:
+        mock_exporter.return_value.finished = False
+        viewer.export_as_data_uri(MagicMock())
+        viewer.export_as_data_uri(MagicMock())
+
+        mock_exporter.assert_called_once()
+        assert viewer.base64_exporter is not None
+
+        mock_exporter.return_value.finished = True
+        viewer._poll_base64_export()
+
+    assert viewer.base64_exporter is None
+
+
+def test_open_sent_image(viewer: ViewerApp) -> None:
+    """Should open images sent by later launches that exist"""
+    with (
+        patch.object(ViewerApp, "load_image") as mock_load_image,
+        patch.object(viewer.file_manager, "move_to_path") as mock_move_to_path,
+    ):
+        viewer.open_sent_image(None)
+        viewer.open_sent_image("/not/a/file.png")
+        mock_load_image.assert_not_called()
+
+        viewer.open_sent_image(EXAMPLE_PNG_PATH)
+        mock_move_to_path.assert_called_once_with(EXAMPLE_PNG_PATH)
+        mock_load_image.assert_called_once()
+
+
+def test_receive_sent_image(viewer: ViewerApp) -> None:
+    """Should only open a sent image once all of its path is received"""
+    connection = MagicMock()
+    connection.closed = False
+    connection.path = EXAMPLE_PNG_PATH
+
+    with (
+        patch.object(viewer.app.tk, "deletefilehandler") as mock_delete_handler,
+        patch.object(ViewerApp, "open_sent_image") as mock_open_sent_image,
+    ):
+        connection.receive.return_value = False
+        viewer._receive_sent_image(connection)
+        mock_open_sent_image.assert_not_called()
+
+        connection.receive.return_value = True
+        viewer._receive_sent_image(connection)
+        mock_delete_handler.assert_called_once_with(connection)
+        connection.close.assert_called_once()
+        mock_open_sent_image.assert_called_once_with(EXAMPLE_PNG_PATH)
+
+
+def test_toggle_timings(viewer: ViewerApp) -> None:
+    """Should only wrap Tk callbacks for tracing while tracing"""
+    assert tk.CallWrapper is CallWrapper
+
+    with patch.object(ViewerApp, "update_details_dropdown"):
+        viewer.toggle_timings(MagicMock())
+        assert span_tracer.enabled
+        assert tk.CallWrapper is TracedCallWrapper
+
+        with patch.object(ViewerApp, "_export_timings") as mock_export:
+            viewer.toggle_timings(MagicMock())
+            mock_export.assert_called_once()
+
+    assert not stage_timer.enabled
+    assert not span_tracer.enabled
+    assert tk.CallWrapper is CallWrapper
+
+
+def test_start_stops_tracing(viewer: ViewerApp) -> None:
+    """Should restore tkinter's CallWrapper once the main loop ends"""
+    with patch.object(ViewerApp, "update_details_dropdown"):
+        viewer.toggle_timings(MagicMock())
+    assert tk.CallWrapper is TracedCallWrapper
+
+    with (
+        patch.object(viewer.app, "mainloop", side_effect=SystemExit),
+        pytest.raises(SystemExit),
+    ):
+        viewer.start()
+
+    assert not span_tracer.enabled
+    assert tk.CallWrapper is CallWrapper
+    stage_timer.toggle()  # Leave timing off for other tests